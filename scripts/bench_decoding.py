@@ -0,0 +1,73 @@
+"""Benchmark untyped vs typed (schema) decoding of large issue lists.
+
+Decodes a synthetic issue page with the untyped parser (serializer.loads)
+and with the precompiled Issue adapter used when PLANE_TYPED_DECODING is
+enabled, reporting for each:
+
+- time: best wall time of several decodes
+- retained: memory held by the decoded result
+- peak: peak memory allocated while decoding
+
+Usage:
+    uv run python scripts/bench_decoding.py [--issues 10000] [--rounds 5]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from bench_payloads import make_issue_page
+
+from plane_mcp.common import serializer
+from plane_mcp.common.decoding import payload_adapter
+from plane_mcp.schemas import Issue
+
+
+def measure(func: Callable[[], Any], rounds: int) -> float:
+    """Return the best wall time of `rounds` runs in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def memory(func: Callable[[], Any]) -> tuple[float, float]:
+    """Return (retained, peak) MB allocated by one run, keeping its result alive."""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained / 1024 / 1024, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=10000, help="Number of issues in the payload")
+    parser.add_argument("--rounds", type=int, default=5, help="Runs per case (best time is reported)")
+    args = parser.parse_args()
+
+    raw = json.dumps(make_issue_page(args.issues)).encode()
+    size_mb = len(raw) / 1024 / 1024
+    adapter = payload_adapter(Issue, many=True)
+    print(f"Payload: {args.issues} issues, {size_mb:.1f} MB (serializer backend: {serializer.BACKEND})")
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("untyped", lambda: serializer.loads(raw)),
+        ("typed (Issue adapter)", lambda: adapter.validate_json(raw)),
+    ]
+    print(f"{'case':<24}{'time, ms':>12}{'MB/s':>10}{'retained, MB':>15}{'peak, MB':>11}")
+    for name, func in cases:
+        elapsed = measure(func, args.rounds)
+        retained, peak = memory(func)
+        print(f"{name:<24}{elapsed * 1000:>12.1f}{size_mb / elapsed:>10.0f}{retained:>15.1f}{peak:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Synthetic Plane API payloads for benchmarks."""
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+PRIORITIES = ("urgent", "high", "medium", "low", "none")
+STATE_GROUPS = ("backlog", "unstarted", "started", "completed", "cancelled")
+WORDS = (
+    "api", "cache", "cycle", "deploy", "docs", "error", "fix", "index", "issue", "login",
+    "module", "page", "query", "refactor", "release", "review", "search", "state", "sync", "ui",
+)
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def make_issue(index: int, project_id: str, states: list[str], members: list[str], rng: random.Random) -> dict:
+    """Build an issue shaped like a Plane v1 issue response."""
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=index * 7)
+    title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8)))
+    paragraphs = "".join(f"<p>{' '.join(rng.choice(WORDS) for _ in range(40))}</p>" for _ in range(rng.randint(1, 4)))
+    return {
+        "id": _uuid(rng),
+        "name": title.capitalize(),
+        "description_html": paragraphs,
+        "description_stripped": paragraphs.replace("<p>", "").replace("</p>", " "),
+        "description_binary": "AQ" * rng.randint(200, 800),
+        "sequence_id": index + 1,
+        "sort_order": float(index * 65535),
+        "priority": rng.choice(PRIORITIES),
+        "state": rng.choice(states),
+        "project": project_id,
+        "workspace": project_id,
+        "parent": None,
+        "estimate_point": None,
+        "point": rng.choice((None, 1, 2, 3, 5, 8)),
+        "assignees": rng.sample(members, rng.randint(0, 2)),
+        "labels": [],
+        "start_date": None,
+        "target_date": (created + timedelta(days=14)).date().isoformat(),
+        "completed_at": None,
+        "archived_at": None,
+        "is_draft": False,
+        "external_source": None,
+        "external_id": None,
+        "created_at": created.isoformat(),
+        "updated_at": (created + timedelta(hours=rng.randint(1, 500))).isoformat(),
+        "created_by": rng.choice(members),
+        "updated_by": rng.choice(members),
+        "deleted_at": None,
+        "type_id": None,
+    }
+
+
+def make_issue_page(count: int, seed: int = 42) -> dict:
+    """Build a paginated issue list response with `count` issues."""
+    rng = random.Random(seed)
+    project_id = _uuid(rng)
+    states = [_uuid(rng) for _ in STATE_GROUPS]
+    members = [_uuid(rng) for _ in range(12)]
+    return {
+        "grouped_by": None,
+        "sub_grouped_by": None,
+        "total_count": count,
+        "next_cursor": f"{count}:1:0",
+        "prev_cursor": f"{count}:-1:1",
+        "next_page_results": False,
+        "prev_page_results": False,
+        "count": count,
+        "total_pages": 1,
+        "total_results": count,
+        "extra_stats": None,
+        "results": [make_issue(i, project_id, states, members, rng) for i in range(count)],
+    }
+
+
+def make_state(index: int, project_id: str, rng: random.Random) -> dict:
+    """Build a state shaped like a Plane v1 state response."""
+    group = STATE_GROUPS[index % len(STATE_GROUPS)]
+    return {
+        "id": _uuid(rng),
+        "name": group.capitalize(),
+        "color": f"#{rng.getrandbits(24):06x}",
+        "group": group,
+        "sequence": float(index * 15000),
+        "default": index == 0,
+        "project": project_id,
+    }
+
+
+def make_cycle(index: int, project_id: str, members: list[str], rng: random.Random) -> dict:
+    """Build a cycle shaped like a Plane v1 cycle response."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(weeks=index * 2)
+    return {
+        "id": _uuid(rng),
+        "name": f"Sprint {index + 1}",
+        "description": " ".join(rng.choice(WORDS) for _ in range(12)),
+        "start_date": start.isoformat(),
+        "end_date": (start + timedelta(weeks=2)).isoformat(),
+        "owned_by": rng.choice(members),
+        "project": project_id,
+        "created_at": start.isoformat(),
+        "updated_at": start.isoformat(),
+    }
+
+
+def make_module(index: int, project_id: str, members: list[str], rng: random.Random) -> dict:
+    """Build a module shaped like a Plane v1 module response."""
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=index * 10)
+    return {
+        "id": _uuid(rng),
+        "name": f"{rng.choice(WORDS).capitalize()} module {index + 1}",
+        "description": " ".join(rng.choice(WORDS) for _ in range(12)),
+        "status": rng.choice(("backlog", "planned", "in-progress", "completed")),
+        "lead": rng.choice(members),
+        "members": rng.sample(members, 3),
+        "start_date": created.date().isoformat(),
+        "target_date": (created + timedelta(weeks=6)).date().isoformat(),
+        "project": project_id,
+        "created_at": created.isoformat(),
+        "updated_at": created.isoformat(),
+    }
+
+
+def make_worklog(issue: dict, members: list[str], rng: random.Random) -> dict:
+    """Build a worklog shaped like a Plane v1 worklog response."""
+    logged = datetime.fromisoformat(issue["created_at"]) + timedelta(hours=rng.randint(1, 200))
+    return {
+        "id": _uuid(rng),
+        "description": " ".join(rng.choice(WORDS) for _ in range(6)),
+        "duration": rng.choice((15, 30, 45, 60, 90, 120, 240)),
+        "issue": issue["id"],
+        "project_id": issue["project"],
+        "logged_by": rng.choice(members),
+        "created_at": logged.isoformat(),
+        "updated_at": logged.isoformat(),
+    }
+
+
+def make_dataset(
+    issue_count: int = 5000,
+    cycle_count: int = 6,
+    module_count: int = 8,
+    worklogs_per_issue: int = 2,
+    seed: int = 42,
+) -> dict:
+    """
+    Build a consistent single-project data set for the mock Plane API.
+
+    Issues are spread over cycles and modules round-robin, and every issue
+    gets up to `worklogs_per_issue` worklogs.
+    """
+    rng = random.Random(seed)
+    project_id = _uuid(rng)
+    members = [_uuid(rng) for _ in range(12)]
+    states = [make_state(i, project_id, rng) for i in range(len(STATE_GROUPS))]
+    state_ids = [state["id"] for state in states]
+    issues = [make_issue(i, project_id, state_ids, members, rng) for i in range(issue_count)]
+    cycles = [make_cycle(i, project_id, members, rng) for i in range(cycle_count)]
+    modules = [make_module(i, project_id, members, rng) for i in range(module_count)]
+    return {
+        "project": {
+            "id": project_id,
+            "name": "Benchmark",
+            "identifier": "BENCH",
+            "description": "Synthetic project for benchmarks",
+            "project_lead": members[0],
+        },
+        "members": [
+            {"id": member, "display_name": f"user{i}", "email": f"user{i}@example.com"}
+            for i, member in enumerate(members)
+        ],
+        "states": states,
+        "issues": issues,
+        "cycles": cycles,
+        "modules": modules,
+        "cycle_issues": {
+            cycle["id"]: [issue["id"] for issue in issues[i::cycle_count]] for i, cycle in enumerate(cycles)
+        },
+        "module_issues": {
+            module["id"]: [issue["id"] for issue in issues[i::module_count]] for i, module in enumerate(modules)
+        },
+        "worklogs": {
+            issue["id"]: [make_worklog(issue, members, rng) for _ in range(rng.randint(0, worklogs_per_issue))]
+            for issue in issues
+        },
+    }
@@ -0,0 +1,66 @@
+"""Benchmark JSON encode/decode throughput of the serializer backends.
+
+Compares the standard library with orjson on a synthetic 10k-issue page,
+covering the two hot paths: parsing Plane responses and serializing tool
+output (minified and pretty).
+
+Usage:
+    uv run python scripts/bench_serializer.py [--issues 10000] [--rounds 5]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from bench_payloads import make_issue_page
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def measure(func: Callable[[], Any], rounds: int) -> float:
+    """Return the best wall time of `rounds` runs in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=10000, help="Number of issues in the payload")
+    parser.add_argument("--rounds", type=int, default=5, help="Runs per case (best is reported)")
+    args = parser.parse_args()
+
+    payload = make_issue_page(args.issues)
+    raw = json.dumps(payload).encode()
+    size_mb = len(raw) / 1024 / 1024
+    print(f"Payload: {args.issues} issues, {size_mb:.1f} MB")
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("json.loads", lambda: json.loads(raw)),
+        ("json.dumps indent=2", lambda: json.dumps(payload, indent=2)),
+        ("json.dumps minified", lambda: json.dumps(payload, separators=(",", ":"), ensure_ascii=False)),
+    ]
+    if orjson is not None:
+        cases += [
+            ("orjson.loads", lambda: orjson.loads(raw)),
+            ("orjson.dumps indent=2", lambda: orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()),
+            ("orjson.dumps minified", lambda: orjson.dumps(payload).decode()),
+        ]
+    else:
+        print("orjson is not installed, only the standard library is measured")
+
+    print(f"{'case':<24}{'time, ms':>12}{'MB/s':>10}")
+    for name, func in cases:
+        elapsed = measure(func, args.rounds)
+        print(f"{name:<24}{elapsed * 1000:>12.1f}{size_mb / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Benchmark server cold start: imports plus tool registration.
+
+Runs a fresh interpreter with -X importtime for each toolset selection,
+creating the server the way plane-mcp does, and reports the best of
+several runs:
+
+- startup: wall time from interpreter start of the import to a server with tools registered
+- imports: total time spent importing modules (from -X importtime)
+- plane_mcp: import time of the project's own modules
+- tools: number of registered tools
+
+Results can be saved as JSON and compared against a saved baseline; the
+exit code is non-zero when a configuration regresses beyond the tolerance.
+
+Usage:
+    uv run python scripts/bench_startup.py [--toolsets all --toolsets issues] [--top 15]
+    uv run python scripts/bench_startup.py --json startup.json
+    uv run python scripts/bench_startup.py --baseline startup.json --tolerance 0.3
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+
+# Executed in the child interpreter; prints startup wall time and tool count
+_STARTUP = """
+import asyncio, time
+start = time.perf_counter()
+from plane_mcp.server import create_server
+server = create_server()
+elapsed = time.perf_counter() - start
+print(elapsed, len(asyncio.run(server.list_tools())))
+"""
+
+
+@dataclass
+class StartupResult:
+    """Cold start of one toolset selection; times in milliseconds."""
+
+    toolsets: str
+    startup_ms: float
+    imports_ms: float
+    plane_mcp_ms: float
+    tools: int
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, float, float]]:
+    """Parse -X importtime output into (module, self ms, cumulative ms) rows."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return rows
+
+
+def run_once(toolsets: str) -> tuple[float, int, list[tuple[str, float, float]]]:
+    """Start one interpreter; return startup ms, tool count and import rows."""
+    env = {
+        **os.environ,
+        "MCP_TOOLSETS": toolsets,
+        "PLANE_API_KEY": os.getenv("PLANE_API_KEY", "bench"),
+        "PLANE_WORKSPACE_SLUG": os.getenv("PLANE_WORKSPACE_SLUG", "bench"),
+    }
+    child = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _STARTUP],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, tools = child.stdout.split()[-2:]
+    return float(elapsed) * 1000, int(tools), parse_importtime(child.stderr)
+
+
+def measure(toolsets: str, rounds: int) -> tuple[StartupResult, list[tuple[str, float, float]]]:
+    """Best of `rounds` cold starts, with the import rows of the fastest one."""
+    best = None
+    for _ in range(rounds):
+        startup, tools, rows = run_once(toolsets)
+        if best is None or startup < best[0]:
+            best = (startup, tools, rows)
+    startup, tools, rows = best
+    result = StartupResult(
+        toolsets=toolsets,
+        startup_ms=startup,
+        imports_ms=sum(self_ms for _, self_ms, _ in rows),
+        plane_mcp_ms=sum(self_ms for module, self_ms, _ in rows if module.startswith("plane_mcp")),
+        tools=tools,
+    )
+    return result, rows
+
+
+def compare(results: list[StartupResult], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Return a description of every time that is worse than baseline by more than tolerance."""
+    regressions = []
+    for result in results:
+        base = baseline.get(result.toolsets)
+        if base is None:
+            continue
+        for metric in ("startup_ms", "plane_mcp_ms"):
+            if getattr(result, metric) > base[metric] * (1 + tolerance):
+                regressions.append(f"{result.toolsets}.{metric}: {getattr(result, metric):.1f} > {base[metric]:.1f}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--toolsets", action="append", help="MCP_TOOLSETS value to measure (repeatable, default: all and issues)")
+    parser.add_argument("--rounds", type=int, default=5, help="Cold starts per selection (best is reported)")
+    parser.add_argument("--top", type=int, default=10, help="Show the slowest imports of the first selection")
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against results saved with --json")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed relative regression (default 0.3)")
+    args = parser.parse_args()
+
+    results = []
+    top_rows: list[tuple[str, float, float]] = []
+    for toolsets in args.toolsets or ["all", "issues"]:
+        result, rows = measure(toolsets, args.rounds)
+        results.append(result)
+        top_rows = top_rows or rows
+
+    print(f"{'toolsets':<28}{'startup, ms':>13}{'imports, ms':>13}{'plane_mcp, ms':>15}{'tools':>7}")
+    for r in results:
+        print(f"{r.toolsets:<28}{r.startup_ms:>13.1f}{r.imports_ms:>13.1f}{r.plane_mcp_ms:>15.1f}{r.tools:>7}")
+
+    if args.top:
+        print(f"\nSlowest imports ({results[0].toolsets}, self time):")
+        for module, self_ms, cumulative_ms in sorted(top_rows, key=lambda row: -row[1])[:args.top]:
+            print(f"  {self_ms:>8.1f} ms  (cumulative {cumulative_ms:>7.1f})  {module}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({r.toolsets: asdict(r) for r in results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("Regressions:", *regressions, sep="\n  ", file=sys.stderr)
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
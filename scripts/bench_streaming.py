@@ -0,0 +1,129 @@
+"""Benchmark buffered vs streaming parsing of large list pages.
+
+Starts scripts/mock_plane_api.py in a subprocess (so its own allocations
+are not counted) and reads one issue page of each size through
+make_plane_request, projecting issues to the list_project_issues summary:
+
+- buffered: the whole page is parsed, then each issue is projected
+- streaming: issues are parsed and projected one at a time (needs ijson)
+
+Reports wall time and peak Python memory per page size; with streaming,
+peak memory should stay flat as pages grow.
+
+Usage:
+    uv run python scripts/bench_streaming.py [--sizes 100 1000 5000] [--rounds 3]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+SCRIPTS = Path(__file__).resolve().parent
+
+
+async def wait_for(url: str, timeout: float = 30.0) -> None:
+    """Wait until the mock API answers."""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while True:
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.1)
+
+
+async def measure(read: Callable[[], Awaitable[Any]], rounds: int) -> tuple[float, float]:
+    """Best wall time (ms) of `rounds` reads, and the peak memory (MB) of one more."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await read()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    await read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024 / 1024
+
+
+async def run(args: argparse.Namespace) -> None:
+    api_url = f"http://127.0.0.1:{args.port}/"
+    os.environ.update({
+        "PLANE_API_HOST_URL": api_url,
+        "PLANE_API_KEY": "bench",
+        "PLANE_WORKSPACE_SLUG": "bench",
+        "PLANE_RATE_LIMIT_PER_MINUTE": "0",
+        "PLANE_CACHE_ENABLED": "false",
+    })
+    from plane_mcp.common.projection import ISSUE_SUMMARY, project_item, source_keys
+    from plane_mcp.common.request_helper import make_plane_request
+    from plane_mcp.common.streaming import streaming_enabled
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    await wait_for(api_url)
+    projects = await make_plane_request("GET", "workspaces/bench/projects/")
+    project_id = (projects["results"] if isinstance(projects, dict) else projects)[0]["id"]
+    path = f"workspaces/bench/projects/{project_id}/issues/"
+
+    def summary(issue: Any) -> Any:
+        return project_item(issue, summary=ISSUE_SUMMARY)
+
+    async def buffered(size: int) -> list:
+        page = await make_plane_request("GET", path, params={"per_page": size})
+        return [summary(issue) for issue in page["results"]]
+
+    async def streaming(size: int) -> list:
+        page = await make_plane_request(
+            "GET", path, params={"per_page": size}, item=summary, keys=source_keys(summary=ISSUE_SUMMARY)
+        )
+        return page["results"]
+
+    modes = [("buffered", buffered)]
+    if streaming_enabled():
+        modes.append(("streaming", streaming))
+    else:
+        print("ijson is not installed (or PLANE_STREAMING_PARSE=false), only buffered parsing is measured")
+
+    print(f"{'page size':>10}  {'mode':<10}{'time, ms':>10}{'peak, MB':>10}")
+    for size in args.sizes:
+        for name, read in modes:
+            elapsed, peak = await measure(lambda: read(size), args.rounds)
+            print(f"{size:>10}  {name:<10}{elapsed:>10.1f}{peak:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000], help="Page sizes to read")
+    parser.add_argument("--rounds", type=int, default=3, help="Reads per case (best time is reported)")
+    parser.add_argument("--port", type=int, default=8093, help="Port for the mock API")
+    args = parser.parse_args()
+
+    largest = max(args.sizes)
+    mock = subprocess.Popen(
+        [
+            sys.executable, str(SCRIPTS / "mock_plane_api.py"), "--port", str(args.port), "--issues", str(largest),
+            "--page-size", str(largest), "--latency", "0", "--jitter", "0",
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        asyncio.run(run(args))
+    finally:
+        mock.terminate()
+        mock.wait()
+
+
+if __name__ == "__main__":
+    main()
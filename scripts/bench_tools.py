@@ -0,0 +1,249 @@
+"""Benchmark the registered MCP tools against the local mock Plane API.
+
+Starts scripts/mock_plane_api.py in-process (or uses --api-url), imports the
+server with its environment pointed at the mock and calls the FastMCP tools
+directly, the same way a client session would. Reports p50/p99 latency,
+throughput and peak Python memory for:
+
+- single: sequential calls of common read tools
+- fanout: many concurrent get_issue calls
+- paginated: list_project_issues over the whole project, plus a cycle's issues
+
+Results can be saved as JSON and compared against a saved baseline; the
+exit code is non-zero when a scenario regresses beyond the tolerance.
+
+Usage:
+    uv run python scripts/bench_tools.py [--latency 0.02] [--issues 5000] [--json results.json]
+    uv run python scripts/bench_tools.py --baseline baseline.json --tolerance 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+import uvicorn
+
+from bench_payloads import make_dataset
+from mock_plane_api import MockPlaneAPI
+
+ToolCall = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class ScenarioResult:
+    """Timing of one scenario; latencies in milliseconds."""
+
+    name: str
+    calls: int
+    p50_ms: float
+    p99_ms: float
+    throughput: float
+    peak_memory_mb: float
+    upstream_requests: int
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+async def run_calls(calls: list[ToolCall], concurrency: int) -> tuple[list[float], float]:
+    """Run calls with at most `concurrency` in flight; return per-call latencies and wall time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def timed(call: ToolCall) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(call) for call in calls))
+    return latencies, time.perf_counter() - start
+
+
+async def measure(
+    name: str,
+    make_calls: Callable[[], list[ToolCall]],
+    concurrency: int,
+    api: MockPlaneAPI,
+    reset: Callable[[], None],
+) -> ScenarioResult:
+    """
+    Run a scenario twice: once for latency, once under tracemalloc for memory.
+
+    Tracing allocations slows Python down noticeably, so it is kept out of
+    the timed run. Caches are reset before each run so runs are comparable.
+    """
+    reset()
+    requests_before = sum(api.requests.values())
+    latencies, wall = await run_calls(make_calls(), concurrency)
+    upstream = sum(api.requests.values()) - requests_before
+
+    reset()
+    tracemalloc.start()
+    await run_calls(make_calls(), concurrency)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return ScenarioResult(
+        name=name,
+        calls=len(latencies),
+        p50_ms=percentile(latencies, 50) * 1000,
+        p99_ms=percentile(latencies, 99) * 1000,
+        throughput=len(latencies) / wall,
+        peak_memory_mb=peak / 1024 / 1024,
+        upstream_requests=upstream,
+    )
+
+
+def compare(results: list[ScenarioResult], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Return a description of every metric that is worse than baseline by more than tolerance."""
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        for metric in ("p50_ms", "p99_ms", "peak_memory_mb"):
+            if getattr(result, metric) > base[metric] * (1 + tolerance):
+                regressions.append(f"{result.name}.{metric}: {getattr(result, metric):.2f} > {base[metric]:.2f}")
+        if result.throughput < base["throughput"] * (1 - tolerance):
+            regressions.append(f"{result.name}.throughput: {result.throughput:.1f} < {base['throughput']:.1f}")
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> list[ScenarioResult]:
+    dataset = make_dataset(args.issues)
+    api = MockPlaneAPI(dataset, args.latency, args.jitter, args.page_size)
+    project_id = api.project["id"]
+
+    mock_server: Optional[uvicorn.Server] = None
+    mock_task: Optional[asyncio.Task] = None
+    api_url = args.api_url
+    if api_url is None:
+        mock_server = uvicorn.Server(uvicorn.Config(api.app(), host="127.0.0.1", port=args.port, log_level="warning"))
+        mock_task = asyncio.create_task(mock_server.serve())
+        while not mock_server.started:
+            await asyncio.sleep(0.01)
+        api_url = f"http://127.0.0.1:{args.port}/"
+
+    os.environ.update({
+        "PLANE_API_HOST_URL": api_url,
+        "PLANE_API_KEY": "bench",
+        "PLANE_WORKSPACE_SLUG": "bench",
+        "PLANE_RATE_LIMIT_PER_MINUTE": "0",
+        "PLANE_CACHE_ENABLED": "true" if args.cache else "false",
+    })
+    from plane_mcp.common import cache, id_index
+    from plane_mcp.common.http_client import http_client_lifespan
+    from plane_mcp.server import create_server
+
+    mcp = create_server()
+
+    # FastMCP configures INFO logging, which would log every upstream request
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    def reset() -> None:
+        cache._cache = None
+        id_index.get_identifier_index().clear()
+
+    def tool(name: str, **arguments: Any) -> ToolCall:
+        return lambda: mcp.call_tool(name, arguments)
+
+    issue_ids = [issue["id"] for issue in dataset["issues"]]
+    cycle_id = dataset["cycles"][0]["id"]
+    module_id = dataset["modules"][0]["id"]
+
+    def single_calls() -> list[ToolCall]:
+        calls = []
+        for i in range(args.rounds):
+            calls += [
+                tool("get_issue", project_id=project_id, issue_id=issue_ids[i % len(issue_ids)]),
+                tool("list_states", project_id=project_id),
+                tool("list_cycles", project_id=project_id),
+                tool("get_module", project_id=project_id, module_id=module_id),
+                tool("get_issue_worklogs", project_id=project_id, issue_id=issue_ids[i % len(issue_ids)]),
+            ]
+        return calls
+
+    def fanout_calls() -> list[ToolCall]:
+        return [
+            tool("get_issue", project_id=project_id, issue_id=issue_ids[i % len(issue_ids)])
+            for i in range(args.fanout)
+        ]
+
+    def paginated_calls() -> list[ToolCall]:
+        return [
+            tool("list_project_issues", project_id=project_id, max_items=None),
+            tool("list_cycle_issues", project_id=project_id, cycle_id=cycle_id),
+        ] * max(1, args.rounds // 10)
+
+    scenarios = [
+        ("single", single_calls, 1),
+        ("fanout", fanout_calls, args.fanout),
+        ("paginated", paginated_calls, 1),
+    ]
+    results = []
+    try:
+        async with http_client_lifespan(mcp):
+            for name, make_calls, concurrency in scenarios:
+                if args.scenario and name not in args.scenario:
+                    continue
+                results.append(await measure(name, make_calls, concurrency, api, reset))
+    finally:
+        if mock_server is not None and mock_task is not None:
+            mock_server.should_exit = True
+            await mock_task
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=5000, help="Number of issues in the mock project")
+    parser.add_argument("--latency", type=float, default=0.02, help="Mock API base latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.005, help="Mock API random extra latency in seconds")
+    parser.add_argument("--page-size", type=int, default=100, help="Largest page returned by the mock API")
+    parser.add_argument("--rounds", type=int, default=20, help="Iterations of the single-call mix")
+    parser.add_argument("--fanout", type=int, default=200, help="Concurrent calls in the fan-out scenario")
+    parser.add_argument("--scenario", action="append", help="Run only this scenario (repeatable)")
+    parser.add_argument("--cache", action="store_true", help="Keep the response cache enabled")
+    parser.add_argument("--port", type=int, default=8090, help="Port for the in-process mock API")
+    parser.add_argument("--api-url", help="Use an already running mock API instead of starting one")
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against results saved with --json")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression (default 0.2)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    print(f"{'scenario':<12}{'calls':>7}{'p50, ms':>10}{'p99, ms':>10}{'calls/s':>10}{'peak, MB':>10}{'upstream':>10}")
+    for r in results:
+        print(
+            f"{r.name:<12}{r.calls:>7}{r.p50_ms:>10.1f}{r.p99_ms:>10.1f}"
+            f"{r.throughput:>10.1f}{r.peak_memory_mb:>10.1f}{r.upstream_requests:>10}"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({r.name: asdict(r) for r in results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("Regressions:", *regressions, sep="\n  ", file=sys.stderr)
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
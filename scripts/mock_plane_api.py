@@ -0,0 +1,274 @@
+"""Local stand-in for the Plane v1 API, used by the benchmarks.
+
+Serves a synthetic project (issues, states, cycles, modules, worklogs) from
+memory with configurable latency and page size, so tools can be measured
+without a live Plane instance or network noise.
+
+Usage:
+    uv run python scripts/mock_plane_api.py [--port 8090] [--latency 0.05] [--page-size 100]
+
+Then point the server at it:
+    PLANE_API_HOST_URL=http://127.0.0.1:8090/ PLANE_API_KEY=bench PLANE_WORKSPACE_SLUG=bench
+"""
+
+import argparse
+import asyncio
+import random
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from bench_payloads import make_dataset
+
+
+def _page_response(items: list, per_page: int, cursor: Optional[str]) -> dict:
+    """Slice items into a Plane cursor page ('<per_page>:<page>:<is_prev>' cursors)."""
+    page = 0
+    if cursor:
+        try:
+            page = int(cursor.split(":")[1])
+        except (IndexError, ValueError):
+            page = 0
+    start = page * per_page
+    results = items[start:start + per_page]
+    has_next = start + per_page < len(items)
+    return {
+        "grouped_by": None,
+        "sub_grouped_by": None,
+        "total_count": len(items),
+        "next_cursor": f"{per_page}:{page + 1}:0",
+        "prev_cursor": f"{per_page}:{max(page - 1, 0)}:1",
+        "next_page_results": has_next,
+        "prev_page_results": page > 0,
+        "count": len(results),
+        "total_pages": max(1, -(-len(items) // per_page)),
+        "total_results": len(items),
+        "extra_stats": None,
+        "results": results,
+    }
+
+
+class MockPlaneAPI:
+    """
+    In-memory Plane API with simulated latency.
+
+    Args:
+        dataset: Data set from bench_payloads.make_dataset
+        latency: Base delay added to every response in seconds
+        jitter: Extra random delay of up to this many seconds
+        page_size: Largest page the server returns, whatever per_page asks for
+    """
+
+    def __init__(self, dataset: dict, latency: float = 0.0, jitter: float = 0.0, page_size: int = 100) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.page_size = page_size
+        self.requests: Counter[str] = Counter()
+        self._rng = random.Random(0)
+
+        self.project = dataset["project"]
+        self.members = dataset["members"]
+        self.states = dataset["states"]
+        self.issues = dataset["issues"]
+        self.cycles = {cycle["id"]: cycle for cycle in dataset["cycles"]}
+        self.modules = {module["id"]: module for module in dataset["modules"]}
+        self.cycle_issues = dataset["cycle_issues"]
+        self.module_issues = dataset["module_issues"]
+        self.worklogs = dataset["worklogs"]
+        self.issues_by_id = {issue["id"]: issue for issue in self.issues}
+
+    async def _delay(self) -> None:
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _page(self, request: Request, items: list) -> dict:
+        per_page = min(int(request.query_params.get("per_page", self.page_size)), self.page_size)
+        return _page_response(items, max(1, per_page), request.query_params.get("cursor"))
+
+    def _check_project(self, request: Request) -> Optional[Response]:
+        if request.path_params["project_id"] != self.project["id"]:
+            return JSONResponse({"error": "Project not found"}, status_code=404)
+        return None
+
+    async def handle(self, request: Request) -> Response:
+        """Entry point for every route: count, delay, authenticate, dispatch."""
+        route = request.scope["route"]
+        self.requests[f"{request.method} {route.path}"] += 1
+        await self._delay()
+        if not request.headers.get("X-API-Key"):
+            return JSONResponse({"error": "Authentication credentials were not provided"}, status_code=401)
+        if "project_id" in request.path_params and (missing := self._check_project(request)):
+            return missing
+        return await route.handler(request)
+
+    async def me(self, request: Request) -> Response:
+        return JSONResponse(self.members[0])
+
+    async def members_list(self, request: Request) -> Response:
+        return JSONResponse(self.members)
+
+    async def projects(self, request: Request) -> Response:
+        if request.method == "POST":
+            return JSONResponse(self.project, status_code=201)
+        return JSONResponse(self._page(request, [self.project]))
+
+    async def project_detail(self, request: Request) -> Response:
+        return JSONResponse(self.project)
+
+    async def issues_list(self, request: Request) -> Response:
+        if request.method == "POST":
+            body = await request.json()
+            issue = {
+                **self.issues[0],
+                **body,
+                "id": str(uuid.uuid4()),
+                "sequence_id": len(self.issues) + 1,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            }
+            self.issues.append(issue)
+            self.issues_by_id[issue["id"]] = issue
+            self.worklogs[issue["id"]] = []
+            return JSONResponse(issue, status_code=201)
+        issues = self.issues
+        for field in ("state", "priority", "assignees", "labels", "created_by"):
+            if field in request.query_params:
+                wanted = set(request.query_params[field].split(","))
+                issues = [
+                    issue for issue in issues
+                    if (wanted & set(issue.get(field) or []) if isinstance(issue.get(field), list) else issue.get(field) in wanted)
+                ]
+        order_by = request.query_params.get("order_by")
+        if order_by:
+            field = order_by.lstrip("-")
+            issues = sorted(issues, key=lambda issue: issue.get(field) or "", reverse=order_by.startswith("-"))
+        return JSONResponse(self._page(request, issues))
+
+    async def issue_detail(self, request: Request) -> Response:
+        issue = self.issues_by_id.get(request.path_params["issue_id"])
+        if issue is None:
+            return JSONResponse({"error": "Issue not found"}, status_code=404)
+        if request.method == "PATCH":
+            issue.update(await request.json())
+            issue["updated_at"] = datetime.now(timezone.utc).isoformat()
+        elif request.method == "DELETE":
+            return Response(status_code=204)
+        return JSONResponse(issue)
+
+    async def issue_by_readable_id(self, request: Request) -> Response:
+        identifier, _, sequence = request.path_params["readable_id"].rpartition("-")
+        if identifier.upper() != self.project["identifier"] or not sequence.isdigit():
+            return JSONResponse({"error": "Issue not found"}, status_code=404)
+        index = int(sequence) - 1
+        if not 0 <= index < len(self.issues):
+            return JSONResponse({"error": "Issue not found"}, status_code=404)
+        return JSONResponse({**self.issues[index], "project_id": self.project["id"]})
+
+    async def issue_comments(self, request: Request) -> Response:
+        return JSONResponse(self._page(request, []))
+
+    async def issue_worklogs(self, request: Request) -> Response:
+        return JSONResponse(self.worklogs.get(request.path_params["issue_id"], []))
+
+    async def total_worklogs(self, request: Request) -> Response:
+        totals: Counter[str] = Counter()
+        for worklogs in self.worklogs.values():
+            for worklog in worklogs:
+                totals[worklog["logged_by"]] += worklog["duration"]
+        return JSONResponse([{"logged_by": member, "duration": total} for member, total in totals.items()])
+
+    async def states_list(self, request: Request) -> Response:
+        return JSONResponse(self._page(request, self.states))
+
+    async def labels_list(self, request: Request) -> Response:
+        return JSONResponse(self._page(request, []))
+
+    async def cycles_list(self, request: Request) -> Response:
+        return JSONResponse(self._page(request, list(self.cycles.values())))
+
+    async def cycle_detail(self, request: Request) -> Response:
+        cycle = self.cycles.get(request.path_params["cycle_id"])
+        if cycle is None:
+            return JSONResponse({"error": "Cycle not found"}, status_code=404)
+        return JSONResponse(cycle)
+
+    async def cycle_issues_list(self, request: Request) -> Response:
+        issue_ids = self.cycle_issues.get(request.path_params["cycle_id"], [])
+        return JSONResponse(self._page(request, [self.issues_by_id[i] for i in issue_ids]))
+
+    async def modules_list(self, request: Request) -> Response:
+        return JSONResponse(self._page(request, list(self.modules.values())))
+
+    async def module_detail(self, request: Request) -> Response:
+        module = self.modules.get(request.path_params["module_id"])
+        if module is None:
+            return JSONResponse({"error": "Module not found"}, status_code=404)
+        return JSONResponse(module)
+
+    async def module_issues_list(self, request: Request) -> Response:
+        issue_ids = self.module_issues.get(request.path_params["module_id"], [])
+        return JSONResponse(self._page(request, [self.issues_by_id[i] for i in issue_ids]))
+
+    def app(self) -> Starlette:
+        """Build the ASGI application."""
+        workspace = "/api/v1/workspaces/{workspace}"
+        project = workspace + "/projects/{project_id}"
+        routes = [
+            ("/api/v1/users/me/", self.me, ["GET"]),
+            (workspace + "/members/", self.members_list, ["GET"]),
+            (workspace + "/projects/", self.projects, ["GET", "POST"]),
+            (workspace + "/issues/{readable_id}/", self.issue_by_readable_id, ["GET"]),
+            (project + "/", self.project_detail, ["GET"]),
+            (project + "/issues/", self.issues_list, ["GET", "POST"]),
+            (project + "/issues/{issue_id}/", self.issue_detail, ["GET", "PATCH", "DELETE"]),
+            (project + "/issues/{issue_id}/comments/", self.issue_comments, ["GET"]),
+            (project + "/issues/{issue_id}/worklogs/", self.issue_worklogs, ["GET"]),
+            (project + "/total-worklogs/", self.total_worklogs, ["GET"]),
+            (project + "/states/", self.states_list, ["GET"]),
+            (project + "/labels/", self.labels_list, ["GET"]),
+            (project + "/cycles/", self.cycles_list, ["GET"]),
+            (project + "/cycles/{cycle_id}/", self.cycle_detail, ["GET"]),
+            (project + "/cycles/{cycle_id}/cycle-issues/", self.cycle_issues_list, ["GET"]),
+            (project + "/modules/", self.modules_list, ["GET"]),
+            (project + "/modules/{module_id}/", self.module_detail, ["GET"]),
+            (project + "/modules/{module_id}/module-issues/", self.module_issues_list, ["GET"]),
+        ]
+        return Starlette(routes=[_MockRoute(path, handler, methods, self) for path, handler, methods in routes])
+
+
+class _MockRoute(Route):
+    """Route that keeps its real handler and sends requests through MockPlaneAPI.handle."""
+
+    def __init__(self, path: str, handler: Any, methods: list[str], api: MockPlaneAPI) -> None:
+        super().__init__(path, api.handle, methods=methods)
+        self.handler = handler
+
+    async def handle(self, scope: Any, receive: Any, send: Any) -> None:
+        scope["route"] = self
+        await super().handle(scope, receive, send)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--issues", type=int, default=5000, help="Number of issues in the project")
+    parser.add_argument("--latency", type=float, default=0.05, help="Base response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.01, help="Extra random delay in seconds")
+    parser.add_argument("--page-size", type=int, default=100, help="Largest page returned by list endpoints")
+    args = parser.parse_args()
+
+    api = MockPlaneAPI(make_dataset(args.issues), args.latency, args.jitter, args.page_size)
+    print(f"Mock Plane API: project {api.project['identifier']} ({api.project['id']}), {args.issues} issues")
+    uvicorn.run(api.app(), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
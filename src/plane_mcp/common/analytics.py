@@ -0,0 +1,303 @@
+"""Progress analytics for cycles and modules (burndown, velocity, completion, load)."""
+
+import asyncio
+import hashlib
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Optional
+
+from plane_mcp.common import serializer
+from plane_mcp.common.concurrency import bulk_concurrency, map_bounded
+from plane_mcp.common.reports import member_names, ref_id
+from plane_mcp.common.request_helper import PlaneAPIError, make_plane_request, paginate
+from plane_mcp.common.tenant import tenant_local
+
+# Cycles use end_date, modules target_date
+_END_FIELDS = ("end_date", "target_date")
+
+# Longest burndown series returned, in days
+MAX_BURNDOWN_DAYS = 366
+
+# Memoized results per (project, kind, id): (membership fingerprint, result);
+# the default tenant's, other tenants have their own
+_memo: OrderedDict[tuple[str, str, str], tuple[str, dict[str, Any]]] = OrderedDict()
+_MEMO_SIZE = 128
+
+
+def _get_memo() -> OrderedDict[tuple[str, str, str], tuple[str, dict[str, Any]]]:
+    """The current tenant's memoized results."""
+    memo = tenant_local("analytics_memo", OrderedDict)
+    return _memo if memo is None else memo
+
+
+def _to_date(value: Any) -> Optional[date]:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def _points(issue: dict[str, Any]) -> float:
+    """Numeric estimate of an issue, 0 when it has none."""
+    for key in ("point", "estimate_point"):
+        value = issue.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    return 0.0
+
+
+def _fingerprint(
+    parsed: list[tuple[Optional[dict[str, Any]], Optional[str], Optional[str]]],
+    latest_update: Optional[str],
+    today: date,
+) -> str:
+    """
+    Digest of a membership, computed before any member issue is fetched.
+
+    Covers each member's UUID and date added, the state and update time of
+    the issues the records include, the project's latest issue update (which
+    moves whenever a referenced-only member changes) and the day (burndown
+    depends on it).
+    """
+    keys = sorted(
+        (
+            str(issue_id),
+            str(added_at),
+            str(issue.get("updated_at")) if issue is not None else "",
+            str(ref_id(issue.get("state"))) if issue is not None else "",
+        )
+        for issue, issue_id, added_at in parsed
+    )
+    return hashlib.sha1(serializer.dumps([today.isoformat(), latest_update, keys]).encode()).hexdigest()
+
+
+async def _latest_update(base: str, max_staleness: Optional[float]) -> Optional[str]:
+    """Update time of the project's most recently updated issue, from a one-item page."""
+    page = await make_plane_request(
+        "GET",
+        f"{base}/issues/",
+        params={"order_by": "-updated_at", "per_page": 1},
+        max_staleness=max_staleness,
+    )
+    issues = page.get("results") if isinstance(page, dict) else page
+    if isinstance(issues, list) and issues and isinstance(issues[0], dict):
+        return issues[0].get("updated_at")
+    return None
+
+
+def _issue_record(record: dict[str, Any]) -> tuple[Optional[dict[str, Any]], Optional[str], Optional[str]]:
+    """
+    Split a membership record into (issue if included, issue UUID, date added).
+
+    Depending on the Plane version, cycle/module issue endpoints return the
+    issues themselves, records with an issue_detail, or bare records
+    pointing at the issue UUID.
+    """
+    detail = record.get("issue_detail")
+    if isinstance(detail, dict):
+        return detail, detail.get("id"), record.get("created_at")
+    if isinstance(record.get("issue"), str):
+        return None, record["issue"], record.get("created_at")
+    return record, record.get("id"), None
+
+
+def compute_progress(
+    scope: dict[str, Any],
+    members: list[tuple[dict[str, Any], Optional[str]]],
+    states: list[dict[str, Any]],
+    user_names: dict[str, str],
+    identifier: str,
+    today: date,
+) -> dict[str, Any]:
+    """
+    Compute progress figures for a cycle or module.
+
+    Args:
+        scope: Cycle or module object
+        members: (issue, date added to the scope or None) per member issue
+        states: Project states, used to map each issue's state to its group
+        user_names: Display name per user UUID
+        identifier: Project identifier for readable issue IDs
+        today: Day the series ends at (at the latest)
+
+    Returns:
+        Totals, scope change, burndown and velocity series and per-assignee load
+    """
+    groups = {state["id"]: state.get("group") for state in states if state.get("id")}
+    start = _to_date(scope.get("start_date"))
+    end = next((_to_date(scope.get(field)) for field in _END_FIELDS if scope.get(field)), None)
+
+    by_group: dict[str, int] = defaultdict(int)
+    points_total = points_done = 0.0
+    load: dict[str, list[float]] = defaultdict(lambda: [0, 0, 0.0])
+    rows = []
+    for issue, added_at in members:
+        group = groups.get(ref_id(issue.get("state")), "unknown")
+        by_group[group] += 1
+        done = group == "completed"
+        added = _to_date(added_at) or _to_date(issue.get("created_at"))
+        completed = (_to_date(issue.get("completed_at")) or _to_date(issue.get("updated_at"))) if done else None
+        points = _points(issue)
+        if group != "cancelled":
+            points_total += points
+            points_done += points if done else 0.0
+            for assignee in issue.get("assignees") or ["unassigned"]:
+                counts = load[assignee]
+                counts[0] += 1
+                counts[1] += 1 if done else 0
+                counts[2] += 0.0 if done else points
+        rows.append((issue, group, added, completed, points))
+
+    active = [row for row in rows if row[1] != "cancelled"]
+    completed_count = by_group.get("completed", 0)
+
+    # Scope change: issues added after the start
+    added_late = [row for row in active if start and row[2] and row[2] > start]
+    scope_change = {
+        "initial": len(active) - len(added_late),
+        "added_after_start": len(added_late),
+        "added_issues": [f"{identifier}-{row[0].get('sequence_id')}" for row in added_late[:50]],
+    }
+
+    # Burndown: remaining = in scope by that day minus completed by that day
+    burndown_rows = []
+    if start:
+        last = min(end or today, today)
+        days = min((last - start).days + 1, MAX_BURNDOWN_DAYS)
+        span = max((end - start).days, 1) if end else None
+        initial = scope_change["initial"]
+        for offset in range(max(days, 0)):
+            day = start + timedelta(days=offset)
+            in_scope = sum(1 for row in active if not row[2] or row[2] <= day)
+            done = sum(1 for row in active if row[3] and row[3] <= day)
+            ideal = round(initial * max(0.0, 1 - offset / span), 2) if span else None
+            burndown_rows.append([day.isoformat(), in_scope, in_scope - done, ideal])
+
+    # Velocity: completions per ISO week
+    velocity: dict[str, list[float]] = defaultdict(lambda: [0, 0.0])
+    for _, _, _, completed, points in active:
+        if completed:
+            year, week, _ = completed.isocalendar()
+            velocity[f"{year}-W{week:02d}"][0] += 1
+            velocity[f"{year}-W{week:02d}"][1] += points
+
+    return {
+        "totals": {
+            "issues": len(rows),
+            "by_state_group": dict(by_group),
+            "completed": completed_count,
+            "cancelled": by_group.get("cancelled", 0),
+            "completion_ratio": round(completed_count / len(active), 4) if active else None,
+            "points_total": points_total,
+            "points_completed": points_done,
+        },
+        "scope_change": scope_change,
+        "burndown": {"columns": ["date", "scope", "remaining", "ideal"], "rows": burndown_rows},
+        "velocity": {
+            "columns": ["week", "completed", "points"],
+            "rows": [[week, int(count), points] for week, (count, points) in sorted(velocity.items())],
+        },
+        "assignees": {
+            "columns": ["assignee", "issues", "completed", "open", "open_points"],
+            "rows": sorted(
+                (
+                    [user_names.get(user, user), int(total), int(done), int(total - done), open_points]
+                    for user, (total, done, open_points) in load.items()
+                ),
+                key=lambda row: -row[3],
+            ),
+        },
+    }
+
+
+async def scope_analytics(
+    workspace_slug: str,
+    project_id: str,
+    kind: str,
+    scope_id: str,
+    max_staleness: Optional[float] = None,
+) -> dict[str, Any]:
+    """
+    Progress analytics for a cycle or module, memoized per membership.
+
+    The membership list is always re-read (it is usually served by the
+    cache or mirror). If it only references some issues, the project's
+    latest issue update is read too, with a one-item page. If neither
+    changed since the last call today, the previous result is returned
+    without fetching the member issues or anything else.
+
+    Args:
+        workspace_slug: Workspace slug
+        project_id: Project UUID
+        kind: 'cycles' or 'modules'
+        scope_id: Cycle or module UUID
+        max_staleness: Staleness bound for reads from the local mirror
+    """
+    base = f"workspaces/{workspace_slug}/projects/{project_id}"
+    membership = f"{base}/{kind}/{scope_id}/{'cycle-issues' if kind == 'cycles' else 'module-issues'}/"
+    records: list[dict[str, Any]] = []
+    async for page in paginate(membership, max_staleness=max_staleness):
+        records.extend(record for record in page["results"] if isinstance(record, dict))
+
+    parsed = [_issue_record(record) for record in records]
+    missing = [issue_id for issue, issue_id, _ in parsed if issue is None and issue_id]
+
+    today = datetime.now(timezone.utc).date()
+    latest_update = await _latest_update(base, max_staleness) if missing else None
+    fingerprint = _fingerprint(parsed, latest_update, today)
+    memo = _get_memo()
+    key = (project_id, kind, scope_id)
+    memoized = memo.get(key)
+    if memoized is not None and memoized[0] == fingerprint:
+        memo.move_to_end(key)
+        return {**memoized[1], "memoized": True}
+
+    # Fetch the issues that the membership records only reference
+
+    async def fetch(issue_id: str) -> dict[str, Any]:
+        return await make_plane_request("GET", f"{base}/issues/{issue_id}/", max_staleness=max_staleness)
+
+    fetched = await map_bounded(fetch, missing, bulk_concurrency())
+    errors = [result for result in fetched if isinstance(result, BaseException)]
+    if errors:
+        raise PlaneAPIError(f"Failed to fetch {len(errors)} of {len(missing)} member issues: {errors[0]}")
+    by_id = dict(zip(missing, fetched))
+    member_issues = [
+        (issue if issue is not None else by_id[issue_id], added_at)
+        for issue, issue_id, added_at in parsed
+        if issue is not None or issue_id in by_id
+    ]
+
+    scope, states, project, members = await asyncio.gather(
+        make_plane_request("GET", f"{base}/{kind}/{scope_id}/", max_staleness=max_staleness),
+        make_plane_request("GET", f"{base}/states/", max_staleness=max_staleness),
+        make_plane_request("GET", f"{base}/", max_staleness=max_staleness),
+        make_plane_request("GET", f"workspaces/{workspace_slug}/members/"),
+    )
+    if isinstance(states, dict):
+        states = states.get("results", [])
+
+    result = {
+        kind[:-1]: {
+            "id": scope.get("id"),
+            "name": scope.get("name"),
+            "start_date": scope.get("start_date"),
+            "end_date": next((scope.get(field) for field in _END_FIELDS if scope.get(field)), None),
+        },
+        **compute_progress(
+            scope,
+            member_issues,
+            states or [],
+            member_names(members),
+            project.get("identifier", "") if isinstance(project, dict) else "",
+            today,
+        ),
+    }
+
+    memo[key] = (fingerprint, result)
+    memo.move_to_end(key)
+    while len(memo) > _MEMO_SIZE:
+        memo.popitem(last=False)
+    return {**result, "memoized": False}
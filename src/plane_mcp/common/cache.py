@@ -0,0 +1,192 @@
+"""TTL/ETag response cache for read-only Plane API requests."""
+
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from plane_mcp.common.tenant import tenant_local, tenant_resource
+
+# Named TTL rules matched in order against the request path (first match wins).
+# A TTL of 0 means the entry is never served without revalidation, so it is
+# only stored when the response carries an ETag or Last-Modified validator.
+# Paths that match no rule are never cached.
+DEFAULT_TTL_RULES: tuple[tuple[str, str, float], ...] = (
+    ("worklogs", r"/(worklogs|total-worklogs)/", 0),
+    ("comments", r"/comments/", 0),
+    ("states", r"/states/", 300),
+    ("labels", r"/labels/", 300),
+    ("issue_types", r"/issue-types/", 300),
+    ("cycles", r"/cycles/", 60),
+    ("modules", r"/modules/", 60),
+    ("issues", r"/issues/", 0),
+    ("members", r"/members/$", 300),
+    ("user", r"^users/me/$", 600),
+    ("projects", r"/projects/([^/]+/)?$", 120),
+)
+
+# Project-level collections whose cached reads are affected by a write to
+# another collection (e.g. issue writes change cycle/module issue listings).
+RELATED_COLLECTIONS: dict[str, tuple[str, ...]] = {
+    "issues": ("issues", "cycles", "modules", "total-worklogs"),
+    "cycles": ("cycles",),
+    "modules": ("modules",),
+}
+
+_PROJECT_PATH = re.compile(r"^(workspaces/[^/]+/)projects/([^/]+)/(?:([^/]+)/)?")
+
+
+@dataclass
+class CacheEntry:
+    """Cached response body with freshness and revalidation data."""
+
+    data: Any
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without asking Plane."""
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers for conditional revalidation of a stale entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """LRU-bounded cache of GET responses keyed by request path."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_rules: tuple[tuple[str, str, float], ...] = DEFAULT_TTL_RULES,
+    ) -> None:
+        self.max_entries = max_entries
+        self._rules = [(name, re.compile(pattern), ttl) for name, pattern, ttl in ttl_rules]
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Return the TTL for a path, or None if the path is not cacheable."""
+        path = path.split("?", 1)[0]
+        for _, pattern, ttl in self._rules:
+            if pattern.search(path):
+                return ttl
+        return None
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for a key (fresh or stale) and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: str, data: Any, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store a response if its path is cacheable."""
+        ttl = self.ttl_for(key)
+        if ttl is None or (ttl <= 0 and not (etag or last_modified)):
+            return
+        self._entries[key] = CacheEntry(data, time.monotonic() + ttl, etag, last_modified)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh(self, key: str) -> Optional[CacheEntry]:
+        """Extend the lifetime of an entry after a 304 Not Modified."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.expires_at = time.monotonic() + (self.ttl_for(key) or 0)
+        return entry
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Drop all entries whose key starts with prefix."""
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def invalidate_path(self, path: str) -> int:
+        """Drop all entries for exactly this path, with any query string."""
+        keys = [key for key in self._entries if key.split("?", 1)[0] == path]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def invalidate_for_write(self, path: str) -> int:
+        """Drop entries whose data may have changed after a write to path."""
+        path = path.split("?", 1)[0]
+        match = _PROJECT_PATH.match(path)
+        if not match or match.group(3) is None:
+            # Writes to workspace-level resources (e.g. creating or updating
+            # a project) affect the resource itself and its parent listing.
+            parent = path.rstrip("/").rsplit("/", 1)[0] + "/"
+            return self.invalidate_path(path) + self.invalidate_path(parent)
+
+        workspace, project_id, collection = match.groups()
+        project_prefix = f"{workspace}projects/{project_id}/"
+        removed = 0
+        for related in RELATED_COLLECTIONS.get(collection, (collection,)):
+            removed += self.invalidate_prefix(f"{project_prefix}{related}/")
+        if collection == "issues":
+            # Readable-identifier lookups (workspaces/{slug}/issues/ABC-1/)
+            removed += self.invalidate_prefix(f"{workspace}issues/")
+        return removed
+
+    def project_ids(self) -> set[str]:
+        """IDs of the projects that have cached project-level entries."""
+        return {match.group(2) for match in map(_PROJECT_PATH.match, self._entries) if match}
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _ttl_rules_from_env() -> tuple[tuple[str, str, float], ...]:
+    """Apply PLANE_CACHE_TTLS overrides (e.g. 'states:600,issues:30') to the default rules."""
+    overrides = {}
+    for item in os.getenv("PLANE_CACHE_TTLS", "").split(","):
+        if ":" in item:
+            name, ttl = item.split(":", 1)
+            overrides[name.strip()] = float(ttl)
+    return tuple((name, pattern, overrides.get(name, ttl)) for name, pattern, ttl in DEFAULT_TTL_RULES)
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def _create_cache() -> ResponseCache:
+    return ResponseCache(
+        max_entries=int(os.getenv("PLANE_CACHE_MAX_ENTRIES", "1024")),
+        ttl_rules=_ttl_rules_from_env(),
+    )
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get the current tenant's response cache (the process-wide one by default), or None when caching is disabled."""
+    global _cache
+    if os.getenv("PLANE_CACHE_ENABLED", "true").lower() not in ("1", "true", "yes"):
+        return None
+    cache = tenant_local("response_cache", _create_cache)
+    if cache is not None:
+        return cache
+    if _cache is None:
+        _cache = _create_cache()
+    return _cache
+
+
+def invalidate_tenant_cache(tenant_key: str, path: str) -> None:
+    """Apply a write to path made for another tenant ('' for the default one), e.g. by another worker."""
+    cache = _cache if not tenant_key else tenant_resource(tenant_key, "response_cache")
+    if cache is not None:
+        cache.invalidate_for_write(path)
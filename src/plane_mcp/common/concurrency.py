@@ -0,0 +1,74 @@
+"""Concurrency helpers for fanning out and de-duplicating Plane API requests."""
+
+import asyncio
+import os
+from typing import Awaitable, Callable, Hashable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def bulk_concurrency() -> int:
+    """Default number of parallel requests for tools that fan out (PLANE_BULK_CONCURRENCY, default 8)."""
+    return int(os.getenv("PLANE_BULK_CONCURRENCY", "8"))
+
+
+async def map_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    concurrency: int,
+) -> list[R | BaseException]:
+    """
+    Run func over items with at most `concurrency` calls in flight.
+
+    Args:
+        func: Async function applied to each item
+        items: Items to process
+        concurrency: Maximum number of concurrent calls
+
+    Returns:
+        Results in input order; failed calls are returned as their exception
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+
+class SingleFlight:
+    """
+    Share one in-flight call among concurrent callers with the same key.
+
+    The first caller starts the call; callers arriving before it finishes
+    await the same result (or exception) instead of starting their own.
+    Nothing is kept once the call completes, so this never serves stale data.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """
+        Run func once per key among concurrent callers.
+
+        Returns:
+            The call's result and whether it was shared with an earlier caller
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # A cancelled caller must not cancel the call for everyone else
+        return await asyncio.shield(task), shared
@@ -0,0 +1,215 @@
+"""Output budget for tool results, with continuation handles for the rest.
+
+A tool result larger than the budget is cut at an item boundary of its
+result list (a top-level list, or the 'results' list of an object) and
+returned with a continuation handle. The remaining items are kept in a
+bounded, expiring in-memory store, and continue_result returns them
+chunk by chunk without another request to Plane. Results without an
+item list are returned whole.
+"""
+
+import os
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from plane_mcp.common import serializer
+from plane_mcp.common.tenant import current_tenant_key
+
+# Rough size of a token in bytes of JSON, for budgets given in tokens
+TOKEN_BYTES = 4
+
+# Bytes reserved for the continuation object added to a cut result
+_CONTINUATION_BYTES = 200
+
+
+def parse_budget(value: Optional[str]) -> int:
+    """
+    Parse an output budget: bytes ('200000'), or approximate tokens ('50000t', '50000 tokens').
+
+    Returns:
+        The budget in bytes; 0 means unlimited
+    """
+    value = (value or "").strip().lower()
+    if not value:
+        return 0
+    for suffix in ("tokens", "t"):
+        if value.endswith(suffix):
+            return int(value[:-len(suffix)].strip()) * TOKEN_BYTES
+    return int(value)
+
+
+def output_budget() -> int:
+    """Global output budget in bytes (MCP_OUTPUT_BUDGET, default 200000; 0 disables it)."""
+    return parse_budget(os.getenv("MCP_OUTPUT_BUDGET", "200000"))
+
+
+def tokens_to_bytes(tokens: Optional[int]) -> Optional[int]:
+    """Per-call budget from a max_output_tokens tool argument; None keeps the global budget."""
+    return None if tokens is None else max(0, tokens) * TOKEN_BYTES
+
+
+@dataclass
+class Remainder:
+    """Items of a cut result that have not been returned yet."""
+
+    tenant: str
+    envelope: Optional[dict[str, Any]]
+    items: list[Any]
+    pretty: bool
+    budget: int
+    expires_at: float
+
+
+class ContinuationStore:
+    """
+    Remainders of cut results by handle, least recently stored dropped first.
+
+    Args:
+        max_entries: Remainders kept at most
+        ttl: Seconds a remainder is kept
+    """
+
+    def __init__(self, max_entries: int = 100, ttl: float = 600.0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, Remainder] = OrderedDict()
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for handle in [handle for handle, entry in self._entries.items() if entry.expires_at <= now]:
+            del self._entries[handle]
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, envelope: Optional[dict[str, Any]], items: list[Any], pretty: bool, budget: int) -> str:
+        """Store the remaining items of a result and return their handle."""
+        handle = secrets.token_urlsafe(12)
+        self._entries[handle] = Remainder(
+            tenant=current_tenant_key(),
+            envelope=envelope,
+            items=items,
+            pretty=pretty,
+            budget=budget,
+            expires_at=time.monotonic() + self.ttl,
+        )
+        self._prune()
+        return handle
+
+    def take(self, handle: str) -> Optional[Remainder]:
+        """Remove and return a remainder, if it exists, has not expired and belongs to the current tenant."""
+        self._prune()
+        entry = self._entries.get(handle)
+        if entry is None or entry.tenant != current_tenant_key():
+            return None
+        del self._entries[handle]
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_store: Optional[ContinuationStore] = None
+
+
+def get_continuation_store() -> ContinuationStore:
+    """
+    Get the process-wide continuation store.
+
+    Environment variables:
+        MCP_CONTINUATION_MAX_ENTRIES: Cut results kept at most (default 100)
+        MCP_CONTINUATION_TTL: Seconds a cut result can be continued (default 600)
+    """
+    global _store
+    if _store is None:
+        _store = ContinuationStore(
+            max_entries=int(os.getenv("MCP_CONTINUATION_MAX_ENTRIES", "100")),
+            ttl=float(os.getenv("MCP_CONTINUATION_TTL", "600")),
+        )
+    return _store
+
+
+def _size(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode())
+
+
+def _render(envelope: Optional[dict[str, Any]], items: list[Any], continuation: Optional[dict], pretty: bool) -> str:
+    document = {**(envelope or {}), "results": items}
+    if continuation is not None:
+        document["continuation"] = continuation
+    return serializer.dumps(document, pretty)
+
+
+def _cut(envelope: Optional[dict[str, Any]], items: list[Any], pretty: bool, budget: int) -> str:
+    """Return as many leading items as fit the budget (at least one), storing the rest."""
+    available = budget - _size(serializer.dumps(envelope or {}, pretty)) - _CONTINUATION_BYTES
+    count, used = 0, 0
+    for item in items:
+        used += _size(serializer.dumps(item, pretty)) + 1
+        if used > available:
+            break
+        count += 1
+    count = max(1, count)
+    if count >= len(items):
+        return _render(envelope, items, None, pretty)
+
+    handle = get_continuation_store().put(envelope, items[count:], pretty, budget)
+    continuation = {
+        "handle": handle,
+        "returned": count,
+        "remaining": len(items) - count,
+        "hint": "Call continue_result with this handle for the next items",
+    }
+    return _render(envelope, items[:count], continuation, pretty)
+
+
+def fit_output(data: Any, pretty: bool = False, budget: Optional[int] = None) -> str:
+    """
+    Serialize tool output, cutting it at an item boundary when it exceeds the budget.
+
+    Args:
+        data: Tool output (already projected)
+        pretty: Indent the JSON output
+        budget: Budget in bytes for this call; defaults to the global budget, 0 is unlimited
+
+    Returns:
+        The JSON output; a cut result is an object with 'results' (the items
+        that fit), the other fields of the original object and 'continuation'
+    """
+    budget = output_budget() if budget is None else budget
+    text = serializer.dumps(data, pretty)
+    if budget <= 0 or _size(text) <= budget:
+        return text
+    if isinstance(data, list):
+        envelope, items = None, data
+    elif isinstance(data, dict) and isinstance(data.get("results"), list):
+        envelope = {key: value for key, value in data.items() if key != "results"}
+        items = data["results"]
+    else:
+        return text
+    if len(items) < 2:
+        return text
+    return _cut(envelope, items, pretty, budget)
+
+
+def continue_output(handle: str, budget: Optional[int] = None) -> Optional[str]:
+    """
+    Next chunk of a cut result.
+
+    Args:
+        handle: Continuation handle from a previous output
+        budget: Budget in bytes for this chunk; defaults to the budget of the original call
+
+    Returns:
+        The chunk, with a new continuation if items still remain; None if the
+        handle is unknown, expired or already used
+    """
+    remainder = get_continuation_store().take(handle)
+    if remainder is None:
+        return None
+    budget = remainder.budget if budget is None else budget
+    if budget <= 0:
+        return _render(remainder.envelope, remainder.items, None, remainder.pretty)
+    return _cut(remainder.envelope, remainder.items, remainder.pretty, budget)
@@ -0,0 +1,128 @@
+"""Typed decoding of Plane responses with precompiled pydantic TypeAdapters.
+
+With PLANE_TYPED_DECODING enabled, responses of endpoints that have a
+schema in plane_mcp.schemas are validated straight from the response
+bytes into dicts, in one pass instead of parsing and then checking the
+fields the schema declares. Fields the schema does not declare are kept
+as they are, so typed decoding only validates and never drops data.
+
+Values keep their JSON types: UUIDs and timestamps stay strings, so the
+decoded data is interchangeable with serializer.loads output. A response
+that does not match its schema falls back to the untyped parser.
+
+pydantic and the schemas are imported on first use, so they are not loaded
+while typed decoding is off.
+"""
+
+import os
+import re
+import types
+from datetime import date, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional, TypedDict, Union, get_args, get_origin
+from uuid import UUID
+
+from plane_mcp.common import serializer
+from plane_mcp.common.projection import PAGINATION_KEYS
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+    from plane_mcp.schemas import PlaneBaseModel
+
+# Endpoint -> name of the plane_mcp.schemas model of the objects it returns;
+# list endpoints (ending in the collection name) may answer with a plain list
+# or a paginated page
+DECODE_RULES: tuple[tuple[re.Pattern, str, bool], ...] = (
+    (re.compile(r"^workspaces/[^/]+/projects/[^/]+/issues/$"), "Issue", True),
+    (re.compile(r"^workspaces/[^/]+/projects/[^/]+/issues/[^/]+/$"), "Issue", False),
+)
+
+# Page fields kept besides the results
+_PAGE_KEYS = (*PAGINATION_KEYS, "prev_cursor", "prev_page_results", "total_pages", "total_results")
+
+# Types Plane sends as JSON strings
+_STRING_TYPES = (UUID, datetime, date)
+
+
+def typed_decoding_enabled() -> bool:
+    """Whether responses are decoded through their schemas (PLANE_TYPED_DECODING, default false)."""
+    return os.getenv("PLANE_TYPED_DECODING", "false").lower() in ("1", "true", "yes")
+
+
+def _wire_type(annotation: Any) -> Any:
+    """Annotation of a schema field as it appears in JSON (UUIDs and dates as strings)."""
+    if annotation in _STRING_TYPES:
+        return str
+    origin = get_origin(annotation)
+    if origin is list:
+        args = get_args(annotation)
+        return list[_wire_type(args[0])] if args else list
+    if origin in (Union, types.UnionType):
+        return Union[tuple(_wire_type(arg) for arg in get_args(annotation))]
+    return annotation
+
+
+def _keeping_extra(typed_dict: type) -> type:
+    """Make pydantic keep the keys a TypedDict does not declare."""
+    from pydantic import ConfigDict
+
+    typed_dict.__pydantic_config__ = ConfigDict(extra="allow")
+    return typed_dict
+
+
+@lru_cache(maxsize=None)
+def payload_type(model: type["PlaneBaseModel"]) -> type:
+    """TypedDict with the schema's fields in their JSON types; every field is optional and nullable, others are kept."""
+    fields = {name: Optional[_wire_type(field.annotation)] for name, field in model.model_fields.items()}
+    return _keeping_extra(TypedDict(f"{model.__name__}Payload", fields, total=False))
+
+
+@lru_cache(maxsize=None)
+def payload_adapter(model: type["PlaneBaseModel"], many: bool) -> "TypeAdapter":
+    """
+    Compiled adapter for a single object, or for a list or page of objects.
+
+    Args:
+        model: Schema of the objects
+        many: Decode a list endpoint's response (a list or a paginated page)
+    """
+    from pydantic import TypeAdapter
+
+    item = payload_type(model)
+    if not many:
+        return TypeAdapter(item)
+    page = _keeping_extra(TypedDict(
+        f"{model.__name__}Page",
+        {**{key: Any for key in _PAGE_KEYS}, "results": list[item]},
+        total=False,
+    ))
+    return TypeAdapter(Union[page, list[item]])
+
+
+def _rule(path: str) -> Optional[tuple[type["PlaneBaseModel"], bool]]:
+    path = path.split("?", 1)[0]
+    for pattern, model, many in DECODE_RULES:
+        if pattern.match(path):
+            import plane_mcp.schemas
+
+            return getattr(plane_mcp.schemas, model), many
+    return None
+
+
+def decode_response(path: str, content: bytes) -> Any:
+    """
+    Parse a Plane response body for path.
+
+    Uses the endpoint's schema adapter when typed decoding is enabled and
+    the endpoint has one, the untyped parser otherwise.
+    """
+    rule = _rule(path) if typed_decoding_enabled() else None
+    if rule is not None:
+        from pydantic import ValidationError
+
+        try:
+            return payload_adapter(*rule).validate_json(content)
+        except ValidationError:
+            pass
+    return serializer.loads(content)
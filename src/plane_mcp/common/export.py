@@ -0,0 +1,332 @@
+"""Streaming NDJSON export of a whole workspace, resumable from a checkpoint."""
+
+import argparse
+import asyncio
+import gzip
+import os
+import sys
+import time
+from collections import Counter
+from typing import Any, BinaryIO, Optional
+
+from plane_mcp.common import serializer
+from plane_mcp.common.concurrency import bulk_concurrency, map_bounded
+from plane_mcp.common.http_client import close_http_client
+from plane_mcp.common.identifiers import resolve_project_id
+from plane_mcp.common.reports import issue_of
+from plane_mcp.common.request_helper import PlaneAPIError, make_plane_request, paginate
+from plane_mcp.common.tenant import current_tenant_key, get_workspace_slug
+
+CHECKPOINT_VERSION = 1
+
+# Per-project steps in export order; issues (with comments and worklogs) go last
+_STEPS = ("project", "cycles", "modules", "issues")
+
+
+class NdjsonWriter:
+    """
+    Appends NDJSON records to a file, optionally gzip-compressed.
+
+    Records are written as they come; commit() makes everything written so
+    far durable and returns the file offset to resume from. With gzip each
+    commit closes a gzip member, so truncating the file to a committed
+    offset always leaves a valid (multi-member) gzip stream.
+
+    Args:
+        path: Output file
+        compress: Gzip-compress the output
+        offset: Committed offset to resume at; None starts a new file
+    """
+
+    def __init__(self, path: str, compress: bool, offset: Optional[int] = None) -> None:
+        self.compress = compress
+        if offset is None:
+            self._file: BinaryIO = open(path, "wb")
+        else:
+            self._file = open(path, "r+b")
+            self._file.truncate(offset)
+            self._file.seek(offset)
+        self._member: Optional[gzip.GzipFile] = None
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Write one record as a JSON line."""
+        line = (serializer.dumps(record) + "\n").encode()
+        if not self.compress:
+            self._file.write(line)
+            return
+        if self._member is None:
+            self._member = gzip.GzipFile(fileobj=self._file, mode="wb")
+        self._member.write(line)
+
+    def commit(self) -> int:
+        """Flush everything written so far to disk and return the resulting offset."""
+        if self._member is not None:
+            self._member.close()
+            self._member = None
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self) -> None:
+        """Close the file without committing a pending gzip member."""
+        self._file.close()
+
+
+def export_dir() -> Optional[str]:
+    """Directory the export_snapshot tool writes to (PLANE_EXPORT_DIR); None disables the tool."""
+    return os.getenv("PLANE_EXPORT_DIR") or None
+
+
+def export_target(path: str) -> str:
+    """
+    Resolve an export_snapshot output path inside the export directory.
+
+    Tool clients only name files relative to PLANE_EXPORT_DIR, so they cannot
+    overwrite other files the server can write to. Clients with their own
+    credentials (MCP_MULTI_TENANT) write to a subdirectory named by their
+    tenant key, so their exports and checkpoints are kept apart from the
+    others'. The CLI takes any path.
+
+    Raises:
+        PlaneAPIError: If the export directory is not configured, or the path is
+            absolute, contains '..' or leads outside the directory through a symlink
+    """
+    directory = export_dir()
+    if directory is None:
+        raise PlaneAPIError("export_snapshot is disabled; set PLANE_EXPORT_DIR to the directory exports are written to")
+    parts = path.replace("\\", "/").split("/")
+    if not path.strip() or os.path.isabs(path) or path.startswith(("/", "\\")) or ".." in parts:
+        raise PlaneAPIError(f"Export path must be relative to the export directory without '..', got '{path}'")
+    tenant = current_tenant_key()
+    if tenant:
+        directory = os.path.join(directory, tenant)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    root = os.path.realpath(directory)
+    target = os.path.realpath(os.path.join(root, path))
+    if target == root or os.path.commonpath([root, target]) != root:
+        raise PlaneAPIError(f"Export path '{path}' leads outside the export directory")
+    return target
+
+
+def _checkpoint_path(path: str) -> str:
+    return f"{path}.checkpoint"
+
+
+def _load_checkpoint(path: str) -> Optional[dict[str, Any]]:
+    try:
+        with open(_checkpoint_path(path), "rb") as f:
+            checkpoint = serializer.loads(f.read())
+    except FileNotFoundError:
+        return None
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise PlaneAPIError(f"Unsupported export checkpoint {_checkpoint_path(path)}, remove it to start over")
+    return checkpoint
+
+
+def _save_checkpoint(path: str, checkpoint: dict[str, Any]) -> None:
+    """Write the checkpoint atomically so an interruption never leaves a torn file."""
+    target = _checkpoint_path(path)
+    with open(f"{target}.tmp", "w", encoding="utf-8") as f:
+        f.write(serializer.dumps(checkpoint))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(f"{target}.tmp", target)
+
+
+async def _list_all(path: str) -> list[dict[str, Any]]:
+    """Read a (small) list endpoint completely."""
+    items: list[dict[str, Any]] = []
+    async for page in paginate(path, use_cache=False):
+        items.extend(item for item in page["results"] if isinstance(item, dict))
+    return items
+
+
+class _Export:
+    """State of one export run: output, checkpoint and record counts."""
+
+    def __init__(
+        self,
+        path: str,
+        workspace_slug: str,
+        writer: NdjsonWriter,
+        checkpoint: dict[str, Any],
+        concurrency: int,
+    ) -> None:
+        self.path = path
+        self.workspace_slug = workspace_slug
+        self.writer = writer
+        self.checkpoint = checkpoint
+        self.concurrency = concurrency
+        self.counts: Counter[str] = Counter(checkpoint["counts"])
+
+    def emit(self, kind: str, data: dict[str, Any], **refs: Any) -> None:
+        self.writer.write({"type": kind, **refs, "data": data})
+        self.counts[kind] += 1
+
+    def save(self, **position: Any) -> None:
+        """Commit the output and record the position reached."""
+        self.checkpoint.update(position, offset=self.writer.commit(), counts=dict(self.counts))
+        _save_checkpoint(self.path, self.checkpoint)
+
+    async def scope(self, base: str, project_id: str, kind: str) -> None:
+        """Export cycles or modules with their issue membership."""
+        member_kind, members = ("cycle_issue", "cycle-issues") if kind == "cycles" else ("module_issue", "module-issues")
+        scope_key = f"{kind[:-1]}_id"
+        for item in await _list_all(f"{base}/{kind}/"):
+            self.emit(kind[:-1], item, project_id=project_id)
+            async for page in paginate(f"{base}/{kind}/{item['id']}/{members}/", use_cache=False):
+                for record in page["results"]:
+                    issue_id = record.get("issue") if isinstance(record.get("issue"), str) else issue_of(record).get("id")
+                    self.emit(member_kind, {"issue_id": issue_id}, project_id=project_id, **{scope_key: item["id"]})
+
+    async def issue_children(self, base: str, issue_id: str) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Comments and worklogs of one issue."""
+        comments = await _list_all(f"{base}/issues/{issue_id}/comments/")
+        worklogs = await make_plane_request("GET", f"{base}/issues/{issue_id}/worklogs/", use_cache=False)
+        return comments, worklogs if isinstance(worklogs, list) else []
+
+    async def issues(self, base: str, project_id: str, cursor: Optional[str]) -> None:
+        """
+        Export issues page by page, each with its comments and worklogs.
+
+        Only one page and its children are held in memory; the checkpoint is
+        saved after every page but the last with the cursor of the next one
+        (the last page is committed when the project is marked done).
+        """
+        async for page in paginate(f"{base}/issues/", cursor=cursor, use_cache=False):
+            issues = [issue for issue in page["results"] if isinstance(issue, dict) and issue.get("id")]
+            children = await map_bounded(
+                lambda issue: self.issue_children(base, issue["id"]), issues, self.concurrency
+            )
+            for issue, result in zip(issues, children):
+                if isinstance(result, BaseException):
+                    raise PlaneAPIError(f"Failed to export issue {issue['id']}: {result}")
+                self.emit("issue", issue, project_id=project_id)
+                comments, worklogs = result
+                for comment in comments:
+                    self.emit("comment", comment, project_id=project_id, issue_id=issue["id"])
+                for worklog in worklogs:
+                    self.emit("worklog", worklog, project_id=project_id, issue_id=issue["id"])
+            if page.get("next_page_results") and page.get("next_cursor"):
+                self.save(cursor=page["next_cursor"])
+
+    async def project(self, project_id: str) -> None:
+        """Export one project, continuing from the checkpointed step."""
+        base = f"workspaces/{self.workspace_slug}/projects/{project_id}"
+        resume_step = self.checkpoint.get("step") if self.checkpoint.get("project") == project_id else None
+        start = _STEPS.index(resume_step) if resume_step in _STEPS else 0
+        for step in _STEPS[start:]:
+            if step != resume_step:
+                self.save(project=project_id, step=step, cursor=None)
+            if step == "project":
+                self.emit("project", await make_plane_request("GET", f"{base}/", use_cache=False), project_id=project_id)
+            elif step == "issues":
+                await self.issues(base, project_id, self.checkpoint.get("cursor"))
+            else:
+                await self.scope(base, project_id, step)
+            resume_step = None
+        self.checkpoint["done"].append(project_id)
+        self.save(project=None, step=None, cursor=None)
+
+
+async def export_workspace(
+    path: str,
+    projects: Optional[list[str]] = None,
+    compress: Optional[bool] = None,
+    resume: bool = True,
+    concurrency: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Stream the workspace to an NDJSON file.
+
+    Each line is {"type": ..., "project_id": ..., "data": {...}} for projects,
+    cycles, cycle_issue memberships, modules, module_issue memberships,
+    issues, comments and worklogs (comments and worklogs also carry
+    issue_id). Issues are read one page at a time, so memory use does not
+    grow with the size of the workspace.
+
+    Progress is checkpointed to '<path>.checkpoint' after every page of
+    issues; an interrupted export run again with resume picks up from there
+    and the checkpoint is removed once the export completes.
+
+    Args:
+        path: Output file
+        projects: Project UUIDs or identifiers to export; defaults to all projects
+        compress: Gzip the output; defaults to whether path ends with '.gz'
+        resume: Continue from an existing checkpoint instead of starting over
+        concurrency: Parallel comment/worklog requests (default PLANE_BULK_CONCURRENCY)
+
+    Returns:
+        Summary with the number of records written per type
+    """
+    started = time.monotonic()
+    workspace_slug = get_workspace_slug()
+    compress = path.endswith(".gz") if compress is None else compress
+
+    checkpoint = _load_checkpoint(path) if resume and os.path.exists(path) else None
+    if checkpoint is not None and checkpoint.get("compress") != compress:
+        raise PlaneAPIError(f"Checkpoint for {path} was written with compress={checkpoint.get('compress')}")
+    resumed = checkpoint is not None
+
+    if checkpoint is None:
+        if projects:
+            project_ids = [await resolve_project_id(project) for project in projects]
+        else:
+            project_ids = [project["id"] for project in await _list_all(f"workspaces/{workspace_slug}/projects/")]
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "compress": compress,
+            "projects": project_ids,
+            "done": [],
+            "project": None,
+            "step": None,
+            "cursor": None,
+            "offset": 0,
+            "counts": {},
+        }
+
+    writer = NdjsonWriter(path, compress, checkpoint["offset"] if resumed else None)
+    try:
+        export = _Export(path, workspace_slug, writer, checkpoint, concurrency or bulk_concurrency())
+        if not resumed:
+            export.save()
+        for project_id in checkpoint["projects"]:
+            if project_id not in checkpoint["done"]:
+                await export.project(project_id)
+        writer.commit()
+    finally:
+        writer.close()
+    os.remove(_checkpoint_path(path))
+
+    return {
+        "path": os.path.abspath(path),
+        "compressed": compress,
+        "resumed": resumed,
+        "projects": len(checkpoint["projects"]),
+        "records": dict(export.counts),
+        "elapsed_seconds": round(time.monotonic() - started, 2),
+    }
+
+
+def export_main(argv: list[str]) -> None:
+    """Command line entry point: plane-mcp export <path> [options]."""
+    parser = argparse.ArgumentParser(prog="plane-mcp export", description="Export the workspace to NDJSON.")
+    parser.add_argument("path", help="Output file (gzip-compressed if it ends with .gz)")
+    parser.add_argument("--project", action="append", dest="projects", help="Project UUID or identifier (repeatable)")
+    parser.add_argument("--gzip", action=argparse.BooleanOptionalAction, default=None, help="Compress the output")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and start over")
+    parser.add_argument("--concurrency", type=int, help="Parallel comment/worklog requests")
+    args = parser.parse_args(argv)
+
+    async def run() -> dict[str, Any]:
+        try:
+            return await export_workspace(args.path, args.projects, args.gzip, not args.restart, args.concurrency)
+        finally:
+            await close_http_client()
+
+    try:
+        summary = asyncio.run(run())
+    except PlaneAPIError as e:
+        print(f"ERROR: Export failed: {e} (run again to resume)", file=sys.stderr)
+        sys.exit(1)
+    print(serializer.dumps(summary, pretty=True))
@@ -0,0 +1,137 @@
+"""Structured issue filters with pushdown to Plane's list endpoint."""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+
+from plane_mcp.common.projection import get_path
+from plane_mcp.common.request_helper import PlaneAPIError
+
+OPERATORS = frozenset({"eq", "ne", "in", "not_in", "contains", "gt", "gte", "lt", "lte", "is_null"})
+
+# Issue fields Plane's list endpoint filters on natively (comma-separated
+# values, any-of semantics). Every condition is still checked locally, so a
+# Plane version that ignores a parameter only costs bandwidth, not accuracy.
+NATIVE_ISSUE_FILTERS = frozenset({"state", "priority", "assignees", "labels", "created_by"})
+
+# Virtual fields resolved through the project's states before filtering
+STATE_FIELDS = {"state_name": "name", "state_group": "group"}
+
+_NEGATED = {"eq": "ne", "in": "not_in", "ne": "eq", "not_in": "in"}
+
+
+@dataclass(frozen=True)
+class Condition:
+    """A single predicate: field (dotted path allowed), operator and value."""
+
+    field: str
+    op: str
+    value: Any = None
+
+    @property
+    def values(self) -> list[Any]:
+        """The value as a list (for in/not_in and pushdown)."""
+        return list(self.value) if isinstance(self.value, (list, tuple, set)) else [self.value]
+
+
+def parse_conditions(filters: Iterable[Mapping[str, Any]]) -> list[Condition]:
+    """
+    Validate filters given as dicts like {"field": "priority", "op": "in", "value": ["high", "urgent"]}.
+
+    Raises:
+        PlaneAPIError: If a filter has no field or an unknown operator
+    """
+    conditions = []
+    for item in filters:
+        field = item.get("field")
+        op = item.get("op", "eq")
+        if not field:
+            raise PlaneAPIError(f"Filter without a field: {dict(item)}")
+        if op not in OPERATORS:
+            raise PlaneAPIError(f"Unknown filter operator '{op}', expected one of: {', '.join(sorted(OPERATORS))}")
+        conditions.append(Condition(field, op, item.get("value")))
+    return conditions
+
+
+def resolve_state_conditions(conditions: list[Condition], states: list[dict[str, Any]]) -> list[Condition]:
+    """
+    Rewrite state_name/state_group conditions into conditions on the state UUID.
+
+    Names and groups are matched case-insensitively, so the rewritten
+    condition can be pushed down to Plane like any other state filter.
+    """
+    resolved = []
+    for condition in conditions:
+        attribute = STATE_FIELDS.get(condition.field)
+        if attribute is None:
+            resolved.append(condition)
+            continue
+        if condition.op not in _NEGATED:
+            raise PlaneAPIError(f"Filter on {condition.field} supports only eq, ne, in and not_in")
+        wanted = {str(value).lower() for value in condition.values}
+        state_ids = [state["id"] for state in states if str(state.get(attribute, "")).lower() in wanted]
+        op = "in" if condition.op in ("eq", "in") else "not_in"
+        resolved.append(Condition("state", op, state_ids))
+    return resolved
+
+
+def pushdown_params(conditions: list[Condition]) -> dict[str, str]:
+    """Query parameters for the conditions Plane can evaluate itself (first one per field)."""
+    params: dict[str, str] = {}
+    for condition in conditions:
+        if condition.field not in NATIVE_ISSUE_FILTERS or condition.field in params:
+            continue
+        list_field = condition.field in ("assignees", "labels")
+        if condition.op in ("eq", "in") or (list_field and condition.op == "contains"):
+            values = [str(value) for value in condition.values if value is not None]
+            if values:
+                params[condition.field] = ",".join(values)
+    return params
+
+
+def _compare(actual: Any, op: str, expected: Any) -> bool:
+    if actual is None or expected is None:
+        return False
+    try:
+        if op == "gt":
+            return actual > expected
+        if op == "gte":
+            return actual >= expected
+        if op == "lt":
+            return actual < expected
+        return actual <= expected
+    except TypeError:
+        return False
+
+
+def evaluate(condition: Condition, item: Mapping[str, Any]) -> bool:
+    """Check one condition against an issue; list fields match if any element does."""
+    actual = get_path(item, condition.field)
+    op = condition.op
+
+    if op in ("ne", "not_in"):
+        return not evaluate(Condition(condition.field, _NEGATED[op], condition.value), item)
+    if op == "is_null":
+        is_empty = actual in (None, "", [], {})
+        return is_empty if condition.value is None else is_empty == bool(condition.value)
+    if op == "eq":
+        return condition.value in actual if isinstance(actual, list) else actual == condition.value
+    if op == "in":
+        if isinstance(actual, list):
+            return any(value in actual for value in condition.values)
+        return actual in condition.values
+    if op == "contains":
+        if isinstance(actual, list):
+            return condition.value in actual
+        return isinstance(actual, str) and str(condition.value).lower() in actual.lower()
+    return _compare(actual, op, condition.value)
+
+
+def matches(item: Any, conditions: list[Condition]) -> bool:
+    """Whether an issue satisfies all conditions."""
+    return isinstance(item, Mapping) and all(evaluate(condition, item) for condition in conditions)
+
+
+def needs_states(conditions: list[Condition]) -> bool:
+    """Whether any condition uses a virtual state field."""
+    return any(condition.field in STATE_FIELDS for condition in conditions)
+
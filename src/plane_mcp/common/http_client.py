@@ -0,0 +1,84 @@
+"""Shared pooled HTTP client for Plane API."""
+
+import os
+import sys
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+from plane_mcp.common.tenant import close_tenants, tenant_local
+
+_client: Optional[httpx.AsyncClient] = None
+_lifespan_users = 0
+
+
+def _http2_enabled() -> bool:
+    """Check whether HTTP/2 was requested and the h2 package is available."""
+    if os.getenv("PLANE_HTTP2", "false").lower() not in ("1", "true", "yes"):
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        print("WARNING: PLANE_HTTP2 is enabled but 'h2' is not installed, falling back to HTTP/1.1", file=sys.stderr)
+        return False
+    return True
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create an HTTP client with a connection pool configured from environment.
+
+    Environment variables:
+        PLANE_HTTP_MAX_CONNECTIONS: Maximum number of open connections (default 100)
+        PLANE_HTTP_MAX_KEEPALIVE: Maximum number of idle keep-alive connections (default 20)
+        PLANE_HTTP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept open (default 30)
+        PLANE_HTTP2: Enable HTTP/2 when the 'h2' package is installed (default false)
+    """
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("PLANE_HTTP_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("PLANE_HTTP_MAX_KEEPALIVE", "20")),
+        keepalive_expiry=float(os.getenv("PLANE_HTTP_KEEPALIVE_EXPIRY", "30")),
+    )
+    return httpx.AsyncClient(limits=limits, http2=_http2_enabled(), timeout=30.0)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the HTTP client of the current tenant (the process-wide one by default), creating it on first use."""
+    global _client
+    client = tenant_local("http_client", create_http_client)
+    if client is not None:
+        return client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the process-wide HTTP client and release pooled connections."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+
+
+@asynccontextmanager
+async def http_client_lifespan(server: Any) -> AsyncIterator[dict[str, Any]]:
+    """
+    FastMCP lifespan that owns the shared HTTP client.
+
+    FastMCP enters the lifespan once per session (once for stdio, once per
+    connected client for SSE), so the client is opened by the first session
+    and closed when the last active session ends, together with the clients
+    of any tenants.
+    """
+    global _lifespan_users
+    _lifespan_users += 1
+    get_http_client()
+    try:
+        yield {}
+    finally:
+        _lifespan_users -= 1
+        if _lifespan_users == 0:
+            await close_http_client()
+            await close_tenants()
@@ -0,0 +1,125 @@
+"""In-process index of readable Plane identifiers (PROJ, PROJ-42) to UUIDs."""
+
+import os
+import re
+from collections import OrderedDict
+from typing import Any, Optional
+
+from plane_mcp.common.tenant import tenant_local
+
+_PROJECTS_PATH = re.compile(r"^workspaces/[^/]+/projects/(?:([^/]+)/)?$")
+_PROJECT_ISSUES_PATH = re.compile(r"^workspaces/[^/]+/projects/([^/]+)/.*issues/")
+_READABLE_ISSUE_PATH = re.compile(r"^workspaces/[^/]+/issues/([A-Za-z0-9]+)-(\d+)/$")
+
+
+def _items(data: Any) -> list:
+    """Return the objects contained in a single, list or paginated response."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        results = data.get("results")
+        return results if isinstance(results, list) else [data]
+    return []
+
+
+class IdentifierIndex:
+    """
+    Maps project identifiers to project UUIDs and (project, sequence) to issue UUIDs.
+
+    Issues are keyed by project UUID and sequence number rather than by
+    readable ID, so issue lists can be indexed before the project's
+    identifier is known.
+    """
+
+    def __init__(self, max_issues: int = 50000) -> None:
+        self.max_issues = max_issues
+        self._projects: dict[str, str] = {}
+        self._issues: OrderedDict[tuple[str, int], str] = OrderedDict()
+
+    def add_project(self, identifier: str, project_id: str) -> None:
+        """Record a project identifier."""
+        self._projects[identifier.upper()] = project_id
+
+    def add_issue(self, project_id: str, sequence_id: int, issue_id: str) -> None:
+        """Record an issue's sequence number within its project."""
+        key = (project_id, int(sequence_id))
+        self._issues[key] = issue_id
+        self._issues.move_to_end(key)
+        while len(self._issues) > self.max_issues:
+            self._issues.popitem(last=False)
+
+    def forget_project(self, project_id: str) -> None:
+        """Drop a deleted project and its issues."""
+        for identifier in [key for key, value in self._projects.items() if value == project_id]:
+            del self._projects[identifier]
+        for key in [key for key in self._issues if key[0] == project_id]:
+            del self._issues[key]
+
+    def forget_issue(self, issue_id: str) -> Optional[str]:
+        """Drop a deleted issue; return its project UUID if it was indexed."""
+        for key, value in self._issues.items():
+            if value == issue_id:
+                del self._issues[key]
+                return key[0]
+        return None
+
+    def project_id(self, identifier: str) -> Optional[str]:
+        """Return the UUID for a project identifier, if indexed."""
+        return self._projects.get(identifier.upper())
+
+    def issue_id(self, project_id: str, sequence_id: int) -> Optional[str]:
+        """Return the UUID for an issue sequence number in a project, if indexed."""
+        return self._issues.get((project_id, int(sequence_id)))
+
+    def observe(self, path: str, data: Any) -> None:
+        """Index projects and issues found in a Plane response for path."""
+        path = path.split("?", 1)[0]
+
+        if _PROJECTS_PATH.match(path):
+            for project in _items(data):
+                if isinstance(project, dict) and project.get("identifier") and project.get("id"):
+                    self.add_project(project["identifier"], project["id"])
+            return
+
+        match = _READABLE_ISSUE_PATH.match(path)
+        if match and isinstance(data, dict):
+            project_id = data.get("project_id") or data.get("project")
+            if project_id and data.get("id"):
+                self.add_project(match.group(1), project_id)
+                self.add_issue(project_id, int(match.group(2)), data["id"])
+            return
+
+        match = _PROJECT_ISSUES_PATH.match(path)
+        if match:
+            for item in _items(data):
+                if not isinstance(item, dict):
+                    continue
+                # Cycle/module membership endpoints may wrap the issue
+                issue = item.get("issue_detail") if isinstance(item.get("issue_detail"), dict) else item
+                if issue.get("id") and issue.get("sequence_id") is not None:
+                    project_id = issue.get("project_id") or issue.get("project") or match.group(1)
+                    if isinstance(project_id, str):
+                        self.add_issue(project_id, issue["sequence_id"], issue["id"])
+
+    def clear(self) -> None:
+        """Drop all indexed identifiers."""
+        self._projects.clear()
+        self._issues.clear()
+
+
+_index: Optional[IdentifierIndex] = None
+
+
+def _create_index() -> IdentifierIndex:
+    return IdentifierIndex(max_issues=int(os.getenv("PLANE_ID_INDEX_MAX_ISSUES", "50000")))
+
+
+def get_identifier_index() -> IdentifierIndex:
+    """Get the current tenant's identifier index (the process-wide one by default)."""
+    global _index
+    index = tenant_local("identifier_index", _create_index)
+    if index is not None:
+        return index
+    if _index is None:
+        _index = _create_index()
+    return _index
@@ -0,0 +1,125 @@
+"""Resolution of readable project/issue identifiers to Plane UUIDs."""
+
+import asyncio
+import re
+from typing import Any, Optional
+
+from plane_mcp.common.id_index import get_identifier_index
+from plane_mcp.common.request_helper import PlaneAPIError, make_plane_request
+from plane_mcp.common.tenant import get_workspace_slug
+
+_UUID = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+_READABLE_ISSUE = re.compile(r"^([A-Za-z0-9]+)-(\d+)$")
+
+
+def is_uuid(value: str) -> bool:
+    """Check whether a value looks like a Plane UUID."""
+    return bool(_UUID.match(value))
+
+
+def indexed_issue_id(issue: str) -> Optional[str]:
+    """UUID of an issue reference known without a request: a UUID itself, or a readable ID in the index."""
+    if is_uuid(issue):
+        return issue.lower()
+    match = _READABLE_ISSUE.match(issue)
+    if not match:
+        return None
+    index = get_identifier_index()
+    project_id = index.project_id(match.group(1))
+    return index.issue_id(project_id, int(match.group(2))) if project_id else None
+
+
+async def resolve_project_id(project: str) -> str:
+    """
+    Resolve a project UUID or identifier (e.g. 'PROFI') to the project UUID.
+
+    Unknown identifiers are looked up by listing the workspace's projects
+    once; the response fills the index for later calls.
+
+    Raises:
+        PlaneAPIError: If no project has this identifier
+    """
+    if is_uuid(project):
+        return project
+
+    index = get_identifier_index()
+    project_id = index.project_id(project)
+    if project_id is None:
+        workspace_slug = get_workspace_slug()
+        await make_plane_request("GET", f"workspaces/{workspace_slug}/projects/")
+        project_id = index.project_id(project)
+    if project_id is None:
+        raise PlaneAPIError(f"Unknown project identifier: {project}")
+    return project_id
+
+
+async def resolve_issue(project: str, issue: str) -> tuple[str, str]:
+    """
+    Resolve a project and an issue reference to (project UUID, issue UUID).
+
+    The issue may be a UUID or a readable ID such as 'PROFI-48'. For readable
+    IDs the project is taken from the ID itself, and no request is made when
+    the issue is already indexed.
+
+    Raises:
+        PlaneAPIError: If the project or issue cannot be found
+    """
+    match = _READABLE_ISSUE.match(issue)
+    if is_uuid(issue) or not match:
+        return await resolve_project_id(project), issue
+
+    identifier, sequence_id = match.group(1), int(match.group(2))
+    index = get_identifier_index()
+    project_id = index.project_id(identifier)
+    issue_id = index.issue_id(project_id, sequence_id) if project_id else None
+    if issue_id is None:
+        workspace_slug = get_workspace_slug()
+        await make_plane_request("GET", f"workspaces/{workspace_slug}/issues/{identifier.upper()}-{sequence_id}/")
+        project_id = index.project_id(identifier)
+        issue_id = index.issue_id(project_id, sequence_id) if project_id else None
+    if project_id is None or issue_id is None:
+        raise PlaneAPIError(f"Unknown issue identifier: {issue}")
+    return project_id, issue_id
+
+
+async def resolve_issue_ids(project_id: str, issues: list[str]) -> list[str]:
+    """Resolve a list of issue UUIDs and/or readable IDs to issue UUIDs."""
+    resolved = await asyncio.gather(*(resolve_issue(project_id, issue) for issue in issues))
+    return [issue_id for _, issue_id in resolved]
+
+
+async def fetch_issue(project: Optional[str], issue: str, max_staleness: Optional[float] = None) -> Any:
+    """
+    Get an issue by UUID or readable ID with a single request.
+
+    UUIDs and indexed readable IDs are read from the project's issue
+    endpoint, which the response cache and mirror can answer; other
+    readable IDs from the workspace's readable-ID endpoint, whose response
+    indexes them for later calls.
+
+    Args:
+        project: UUID or identifier of the project; required for issue UUIDs
+        issue: Issue UUID or readable ID (e.g. 'PROFI-48')
+        max_staleness: Passed to make_plane_request for project endpoint reads
+
+    Raises:
+        PlaneAPIError: If the project cannot be resolved or the request fails
+    """
+    workspace_slug = get_workspace_slug()
+    match = _READABLE_ISSUE.match(issue)
+    if is_uuid(issue) or not match:
+        if not project:
+            raise PlaneAPIError(f"A project is required to get issue {issue}")
+        project_id, issue_id = await resolve_project_id(project), issue
+    else:
+        identifier, sequence_id = match.group(1).upper(), int(match.group(2))
+        index = get_identifier_index()
+        project_id = index.project_id(identifier)
+        issue_id = index.issue_id(project_id, sequence_id) if project_id else None
+        if issue_id is None:
+            return await make_plane_request("GET", f"workspaces/{workspace_slug}/issues/{identifier}-{sequence_id}/")
+    return await make_plane_request(
+        "GET",
+        f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/",
+        max_staleness=max_staleness,
+    )
@@ -0,0 +1,220 @@
+"""Lightweight in-process metrics with Prometheus text exposition.
+
+Metrics are plain dict updates on the event loop thread, cheap enough to
+stay enabled in production. The SSE/HTTP server exposes them on /metrics;
+with several workers every series carries a worker label and one scrape
+returns the metrics of all of them.
+"""
+
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Iterable, Optional, TypeVar
+
+# Seconds; covers cache hits (sub-millisecond) up to slow paginated calls
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Fixed path segments of the Plane API; every other segment is an ID, slug or
+# readable identifier and is replaced by a placeholder
+_API_KEYWORDS = frozenset({
+    "users", "me", "workspaces", "members", "projects", "issues", "issue-types", "states", "labels",
+    "cycles", "cycle-issues", "transfer-issues", "modules", "module-issues", "comments", "worklogs",
+    "total-worklogs",
+})
+_READABLE_ID = re.compile(r"^[A-Za-z0-9]+-\d+$")
+
+
+def path_template(path: str) -> str:
+    """Replace every variable segment of an API path (query string dropped) so it can be used as a low-cardinality label."""
+    segments = path.split("?", 1)[0].split("/")
+    template = []
+    for position, segment in enumerate(segments):
+        if not segment or segment in _API_KEYWORDS:
+            template.append(segment)
+        elif position == 1 and segments[0] == "workspaces":
+            template.append("{workspace}")
+        elif _READABLE_ID.match(segment):
+            template.append("{readable_id}")
+        else:
+            template.append("{id}")
+    return "/".join(template)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self, extra: str = "") -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = defaultdict(float)
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] += amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self, extra: str = "") -> list[str]:
+        lines = self.header()
+        for labels, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels, extra)} {value}")
+        return lines
+
+
+class Gauge(Counter):
+    """Value that can go up and down per label set."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] -= amount
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in fixed buckets per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+        # Per label set: non-cumulative bucket counts (+Inf last), sum
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = defaultdict(float)
+
+    def observe(self, value: float, *labels: str) -> None:
+        counts = self._counts.get(labels)
+        if counts is None:
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[labels] += value
+
+    def render(self, extra: str = "") -> list[str]:
+        lines = self.header()
+        for labels, counts in self._counts.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                bucket_labels = _format_labels(self.labelnames, labels, ",".join(filter(None, (extra, f'le="{le}"'))))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels, extra)} {self._sums[labels]}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels, extra)} {cumulative}")
+        return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class Registry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: M) -> M:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self, worker: Optional[str] = None) -> str:
+        """Render all metrics in Prometheus text exposition format (0.0.4), optionally labelled with a worker."""
+        extra = f'worker="{_escape(worker)}"' if worker else ""
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render(extra))
+        return "\n".join(lines) + "\n"
+
+
+def merge_expositions(texts: Iterable[str]) -> str:
+    """
+    Merge expositions of the same registry (one per worker) into one.
+
+    Each metric's HELP/TYPE header is kept once, followed by the series of
+    every exposition, as the text format requires.
+    """
+    families: dict[str, list[str]] = {}
+    for text in texts:
+        series: list[str] = []
+        for line in text.splitlines():
+            if line.startswith("# HELP "):
+                name = line.split(" ", 3)[2]
+                series = families.setdefault(name, [])
+                if not series:
+                    series.append(line)
+            elif line.startswith("# TYPE "):
+                if len(series) == 1:
+                    series.append(line)
+            elif line:
+                series.append(line)
+    return "\n".join(line for series in families.values() for line in series) + "\n"
+
+
+REGISTRY = Registry()
+
+TOOL_CALLS = REGISTRY.register(Counter(
+    "plane_mcp_tool_calls_total", "MCP tool calls by tool and outcome", ("tool", "status"),
+))
+TOOL_DURATION = REGISTRY.register(Histogram(
+    "plane_mcp_tool_duration_seconds", "MCP tool call latency", ("tool",),
+))
+TOOLS_IN_FLIGHT = REGISTRY.register(Gauge(
+    "plane_mcp_tools_in_flight", "MCP tool calls currently executing",
+))
+API_REQUESTS = REGISTRY.register(Counter(
+    "plane_api_requests_total", "Upstream Plane API requests", ("method", "path", "status"),
+))
+API_DURATION = REGISTRY.register(Histogram(
+    "plane_api_request_duration_seconds", "Upstream Plane API request latency", ("method", "path"),
+))
+API_IN_FLIGHT = REGISTRY.register(Gauge(
+    "plane_api_requests_in_flight", "Upstream Plane API requests currently in flight",
+))
+API_RETRIES = REGISTRY.register(Counter(
+    "plane_api_retries_total", "Retried upstream Plane API requests", ("method", "path", "reason"),
+))
+API_COALESCED = REGISTRY.register(Counter(
+    "plane_api_coalesced_requests_total", "GET calls that joined an identical in-flight request", ("path",),
+))
+CACHE_LOOKUPS = REGISTRY.register(Counter(
+    "plane_api_cache_lookups_total", "Response cache lookups by result (hit, revalidated, miss)", ("result",),
+))
+MIRROR_LOOKUPS = REGISTRY.register(Counter(
+    "plane_mirror_lookups_total", "Local mirror lookups by result (hit, miss)", ("result",),
+))
+WEBHOOK_EVENTS = REGISTRY.register(Counter(
+    "plane_webhook_events_total", "Received Plane webhooks by event and result (applied, ignored, rejected)",
+    ("event", "result"),
+))
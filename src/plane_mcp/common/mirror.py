@@ -0,0 +1,354 @@
+"""Local SQLite mirror of the workspace for serving reads without Plane."""
+
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+from urllib.parse import parse_qs
+
+from plane_mcp.common import serializer
+from plane_mcp.common.tenant import current_tenant
+
+# Project-level collections kept in the mirror
+PROJECT_KINDS = ("issues", "states", "labels", "cycles", "modules", "worklogs")
+
+# Issues are listed newest first like Plane does; everything else keeps the
+# order Plane returned it in.
+_DESCENDING = frozenset({"issues"})
+
+# Query parameters the mirror can answer; anything else goes to Plane
+_PAGE_PARAMS = frozenset({"per_page", "cursor"})
+
+# Writes to these collections also change fields of mirrored issues
+_ISSUE_MEMBERSHIP = re.compile(r"/(cycle-issues|module-issues|transfer-issues)/")
+
+_PROJECTS_PATH = re.compile(r"^workspaces/[^/]+/projects/(?:(?P<project>[^/]+)/)?$")
+_COLLECTION_PATH = re.compile(
+    r"^workspaces/[^/]+/projects/(?P<project>[^/]+)/"
+    r"(?P<kind>issues|states|labels|cycles|modules)/(?:(?P<item>[^/]+)/)?$"
+)
+_WORKLOGS_PATH = re.compile(r"^workspaces/[^/]+/projects/(?P<project>[^/]+)/issues/(?P<issue>[^/]+)/worklogs/$")
+_PROJECT_WRITE_PATH = re.compile(r"^workspaces/[^/]+/projects/(?P<project>[^/]+)/(?P<kind>[^/]+)/")
+
+# Scope used for workspace-level kinds (the project list)
+WORKSPACE_SCOPE = ""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    parent_id TEXT,
+    sort_key TEXT NOT NULL,
+    updated_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS objects_scope ON objects (kind, project_id, sort_key);
+CREATE INDEX IF NOT EXISTS objects_parent ON objects (kind, parent_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    kind TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    full_synced_at REAL NOT NULL,
+    watermark TEXT,
+    PRIMARY KEY (kind, project_id)
+);
+"""
+
+
+@dataclass
+class SyncState:
+    """When a kind was last synced for a project and how far the delta sync got."""
+
+    kind: str
+    project_id: str
+    synced_at: float
+    full_synced_at: float
+    watermark: Optional[str]
+
+    @property
+    def age(self) -> float:
+        """Seconds since the last successful sync."""
+        return time.time() - self.synced_at
+
+
+def _page_number(cursor: Optional[str]) -> int:
+    """Page index of a Plane pagination cursor ('<per_page>:<page>:<is_prev>')."""
+    if not cursor:
+        return 0
+    try:
+        return max(0, int(cursor.split(":")[1]))
+    except (IndexError, ValueError):
+        return 0
+
+
+class Mirror:
+    """
+    SQLite store of Plane objects, answering GET paths the way Plane would.
+
+    Objects are stored as their raw JSON next to the columns needed to scope
+    and order them. Freshness is tracked per (kind, project): a read is
+    served only if that kind was synced for the project within the caller's
+    staleness bound, otherwise it falls through to Plane.
+
+    The bound covers changes, not deletions: a delta sync only sees issues
+    that still exist, so an issue deleted in Plane stays in the mirror until
+    the next full sync (PLANE_MIRROR_FULL_SYNC_INTERVAL) unless a webhook or
+    a deletion through this server removes it first.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._db = sqlite3.connect(path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    # Writing (used by the sync)
+
+    def _rows(
+        self,
+        kind: str,
+        project_id: str,
+        items: Iterable[dict[str, Any]],
+        parent_id: Optional[str],
+    ) -> list[tuple]:
+        rows = []
+        for position, item in enumerate(items):
+            if not isinstance(item, dict) or not item.get("id"):
+                continue
+            sort_key = (item.get("created_at") or "") if kind in _DESCENDING else f"{position:010d}"
+            rows.append((
+                kind,
+                item["id"],
+                project_id,
+                parent_id,
+                sort_key,
+                item.get("updated_at"),
+                serializer.dumps(item),
+            ))
+        return rows
+
+    def _insert(self, rows: list[tuple]) -> None:
+        self._db.executemany(
+            "INSERT OR REPLACE INTO objects (kind, id, project_id, parent_id, sort_key, updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def replace(
+        self,
+        kind: str,
+        project_id: str,
+        items: list[dict[str, Any]],
+        parent_id: Optional[str] = None,
+    ) -> None:
+        """Replace all objects of a kind in a project (or under a parent) with items."""
+        with self._db:
+            self._db.execute("BEGIN")
+            if parent_id is None:
+                self._db.execute("DELETE FROM objects WHERE kind = ? AND project_id = ?", (kind, project_id))
+            else:
+                self._db.execute("DELETE FROM objects WHERE kind = ? AND parent_id = ?", (kind, parent_id))
+            self._insert(self._rows(kind, project_id, items, parent_id))
+
+    def upsert(self, kind: str, project_id: str, items: list[dict[str, Any]]) -> None:
+        """Insert or update objects of a kind, keeping the others."""
+        with self._db:
+            self._db.execute("BEGIN")
+            self._insert(self._rows(kind, project_id, items, None))
+
+    def delete(self, kind: str, item_id: str) -> Optional[str]:
+        """Remove a deleted object; return its project ID if it was mirrored."""
+        with self._db:
+            self._db.execute("BEGIN")
+            row = self._db.execute("SELECT project_id FROM objects WHERE kind = ? AND id = ?", (kind, item_id)).fetchone()
+            self._db.execute("DELETE FROM objects WHERE kind = ? AND id = ?", (kind, item_id))
+        return row[0] if row else None
+
+    def mark_synced(self, kind: str, project_id: str, full: bool, watermark: Optional[str] = None) -> None:
+        """Record a successful sync of a kind for a project."""
+        now = time.time()
+        previous = self.sync_state(kind, project_id)
+        full_synced_at = now if full or previous is None else previous.full_synced_at
+        self._db.execute(
+            "INSERT OR REPLACE INTO sync_state (kind, project_id, synced_at, full_synced_at, watermark) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (kind, project_id, now, full_synced_at, watermark),
+        )
+
+    def mark_stale(self, kind: str, project_id: str) -> None:
+        """Stop serving a kind for a project until it is synced again."""
+        self._db.execute(
+            "UPDATE sync_state SET synced_at = 0 WHERE kind = ? AND project_id = ?",
+            (kind, project_id),
+        )
+
+    def invalidate_for_write(self, path: str) -> None:
+        """Mark what a write through this server changed as stale."""
+        path = path.split("?", 1)[0]
+        match = _PROJECT_WRITE_PATH.match(path)
+        if match is None:
+            if _PROJECTS_PATH.match(path):
+                self.mark_stale("projects", WORKSPACE_SCOPE)
+            return
+        project_id, kind = match.group("project"), match.group("kind")
+        if "/worklogs/" in path:
+            self.mark_stale("worklogs", project_id)
+        elif kind in PROJECT_KINDS:
+            self.mark_stale(kind, project_id)
+        if _ISSUE_MEMBERSHIP.search(path):
+            self.mark_stale("issues", project_id)
+
+    # Reading
+
+    def sync_state(self, kind: str, project_id: str) -> Optional[SyncState]:
+        """Get the sync state of a kind for a project, if it was ever synced."""
+        row = self._db.execute(
+            "SELECT kind, project_id, synced_at, full_synced_at, watermark FROM sync_state "
+            "WHERE kind = ? AND project_id = ?",
+            (kind, project_id),
+        ).fetchone()
+        return SyncState(*row) if row else None
+
+    def sync_states(self) -> list[SyncState]:
+        """Get the sync state of every mirrored (kind, project)."""
+        rows = self._db.execute(
+            "SELECT kind, project_id, synced_at, full_synced_at, watermark FROM sync_state ORDER BY project_id, kind"
+        ).fetchall()
+        return [SyncState(*row) for row in rows]
+
+    def count(self, kind: str, project_id: str) -> int:
+        """Number of mirrored objects of a kind in a project."""
+        return self._db.execute(
+            "SELECT COUNT(*) FROM objects WHERE kind = ? AND project_id = ?", (kind, project_id)
+        ).fetchone()[0]
+
+    def ids(self, kind: str, project_id: str) -> list[str]:
+        """IDs of mirrored objects of a kind in a project."""
+        rows = self._db.execute("SELECT id FROM objects WHERE kind = ? AND project_id = ?", (kind, project_id))
+        return [row[0] for row in rows]
+
+    def items(self, kind: str, project_id: str, parent_id: Optional[str] = None) -> list[dict[str, Any]]:
+        """Mirrored objects of a kind in a project (or under a parent), in listing order."""
+        order = "DESC" if kind in _DESCENDING else "ASC"
+        if parent_id is None:
+            rows = self._db.execute(
+                f"SELECT data FROM objects WHERE kind = ? AND project_id = ? ORDER BY sort_key {order}, id {order}",
+                (kind, project_id),
+            )
+        else:
+            rows = self._db.execute(
+                f"SELECT data FROM objects WHERE kind = ? AND parent_id = ? ORDER BY sort_key {order}, id {order}",
+                (kind, parent_id),
+            )
+        return [serializer.loads(row[0]) for row in rows]
+
+    def page(self, kind: str, project_id: str, per_page: int, cursor: Optional[str] = None) -> dict[str, Any]:
+        """
+        One page of mirrored objects of a kind in a project, shaped like Plane's cursor pagination.
+
+        Only the requested page is read and decoded, so walking all pages
+        costs the same as reading the collection once.
+        """
+        order = "DESC" if kind in _DESCENDING else "ASC"
+        page = _page_number(cursor)
+        start = page * per_page
+        total = self.count(kind, project_id)
+        rows = self._db.execute(
+            f"SELECT data FROM objects WHERE kind = ? AND project_id = ? ORDER BY sort_key {order}, id {order} "
+            "LIMIT ? OFFSET ?",
+            (kind, project_id, per_page, start),
+        )
+        results = [serializer.loads(row[0]) for row in rows]
+        return {
+            "total_count": total,
+            "count": len(results),
+            "next_cursor": f"{per_page}:{page + 1}:0",
+            "prev_cursor": f"{per_page}:{max(page - 1, 0)}:1",
+            "next_page_results": start + per_page < total,
+            "prev_page_results": page > 0,
+            "results": results,
+        }
+
+    def item(self, kind: str, item_id: str) -> Optional[dict[str, Any]]:
+        """A single mirrored object, if present."""
+        row = self._db.execute("SELECT data FROM objects WHERE kind = ? AND id = ?", (kind, item_id)).fetchone()
+        return serializer.loads(row[0]) if row else None
+
+    def is_fresh(self, kind: str, project_id: str, max_staleness: float) -> bool:
+        """Whether a kind was synced for a project within max_staleness seconds."""
+        state = self.sync_state(kind, project_id)
+        return state is not None and state.age <= max_staleness
+
+    def lookup(self, path: str, max_staleness: float) -> Optional[Any]:
+        """
+        Answer a GET path from the mirror.
+
+        Args:
+            path: API path as passed to make_plane_request (query string included)
+            max_staleness: Maximum age in seconds of the last (delta or full) sync to
+                accept; issues deleted since the last full sync may still be listed
+
+        Returns:
+            Response data shaped like Plane's, or None when the request must go to Plane
+            (unknown path or parameters, stale data, or object not mirrored)
+        """
+        if max_staleness <= 0:
+            return None
+        path, _, query = path.partition("?")
+        params = {key: values[-1] for key, values in parse_qs(query).items()}
+        if set(params) - _PAGE_PARAMS:
+            return None
+
+        kind, project_id, item_id, parent_id = None, WORKSPACE_SCOPE, None, None
+        if match := _WORKLOGS_PATH.match(path):
+            kind, project_id, parent_id = "worklogs", match.group("project"), match.group("issue")
+        elif match := _COLLECTION_PATH.match(path):
+            kind, project_id, item_id = match.group("kind"), match.group("project"), match.group("item")
+        elif match := _PROJECTS_PATH.match(path):
+            kind, item_id = "projects", match.group("project")
+        if kind is None or not self.is_fresh(kind, project_id, max_staleness):
+            return None
+
+        if parent_id is not None:
+            # Plane returns worklogs as a plain list
+            return self.items(kind, project_id, parent_id)
+        if item_id is not None:
+            return self.item(kind, item_id)
+        per_page = max(1, min(int(params.get("per_page", 100)), 100))
+        return self.page(kind, project_id, per_page, params.get("cursor"))
+
+
+_mirror: Optional[Mirror] = None
+
+
+def get_mirror() -> Optional[Mirror]:
+    """
+    Get the process-wide mirror, or None when it is not configured.
+
+    The mirror holds the environment's workspace only, so it is never used
+    for requests made with a tenant's own credentials.
+
+    Environment variables:
+        PLANE_MIRROR_PATH: SQLite file of the mirror (unset disables the mirror)
+    """
+    global _mirror
+    path = os.getenv("PLANE_MIRROR_PATH")
+    if not path or current_tenant() is not None:
+        return None
+    if _mirror is None:
+        _mirror = Mirror(path)
+    return _mirror
+
+
+def default_max_staleness() -> float:
+    """Staleness bound for reads that do not set one (PLANE_MIRROR_MAX_STALENESS, default 300 seconds)."""
+    return float(os.getenv("PLANE_MIRROR_MAX_STALENESS", "300"))
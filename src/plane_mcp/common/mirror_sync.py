@@ -0,0 +1,265 @@
+"""Initial and incremental sync of the local mirror from Plane."""
+
+import asyncio
+import os
+import sys
+import time
+from contextlib import aclosing, asynccontextmanager, suppress
+from typing import IO, Any, AsyncIterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock; one process per mirror there
+    fcntl = None
+
+from plane_mcp.common.concurrency import map_bounded
+from plane_mcp.common.identifiers import resolve_project_id
+from plane_mcp.common.mirror import WORKSPACE_SCOPE, Mirror, get_mirror
+from plane_mcp.common.rate_limit import background_requests
+from plane_mcp.common.request_helper import PlaneAPIError, make_plane_request, paginate
+from plane_mcp.common.tenant import get_workspace_slug
+
+# Small collections are re-read in full on every sync
+_SMALL_KINDS = ("states", "labels", "cycles", "modules")
+
+_sync_lock: Optional[asyncio.Lock] = None
+_sync_task: Optional[asyncio.Task] = None
+_lifespan_users = 0
+
+
+def _full_sync_interval() -> float:
+    return float(os.getenv("PLANE_MIRROR_FULL_SYNC_INTERVAL", "3600"))
+
+
+def _sync_concurrency() -> int:
+    return int(os.getenv("PLANE_MIRROR_CONCURRENCY", "8"))
+
+
+def _worklogs_enabled() -> bool:
+    return os.getenv("PLANE_MIRROR_WORKLOGS", "true").lower() in ("1", "true", "yes")
+
+
+async def _fetch_all(path: str) -> list[dict[str, Any]]:
+    """Read every page of a list endpoint straight from Plane."""
+    items: list[dict[str, Any]] = []
+    async for page in paginate(path, max_staleness=0, use_cache=False):
+        items.extend(page["results"])
+    return items
+
+
+def _latest(items: list[dict[str, Any]], watermark: Optional[str]) -> Optional[str]:
+    """Newest updated_at among items and the previous watermark."""
+    stamps = [item["updated_at"] for item in items if item.get("updated_at")]
+    if watermark:
+        stamps.append(watermark)
+    return max(stamps) if stamps else None
+
+
+async def _sync_issues(mirror: Mirror, base: str, project_id: str, full: bool) -> list[str]:
+    """
+    Sync a project's issues and return the IDs of issues that changed.
+
+    A delta sync lists issues by most recent update and stops at the first
+    page reaching past the previous watermark. Issues updated at the
+    watermark itself are read again, so one updated in the same instant as
+    the last synced issue is not missed. Deleted issues are only dropped by
+    full syncs, which replace the project's issues entirely.
+    """
+    path = f"{base}/issues/"
+    state = mirror.sync_state("issues", project_id)
+    full = (
+        full
+        or state is None
+        or not state.watermark
+        or time.time() - state.full_synced_at > _full_sync_interval()
+    )
+
+    if full:
+        issues = await _fetch_all(path)
+        mirror.replace("issues", project_id, issues)
+        mirror.mark_synced("issues", project_id, full=True, watermark=_latest(issues, None))
+        return [issue["id"] for issue in issues if issue.get("id")]
+
+    # By ID: an issue updated while paging moves to the front and may be listed twice
+    by_id: dict[str, dict[str, Any]] = {}
+    pages = paginate(path, params={"order_by": "-updated_at"}, max_staleness=0, use_cache=False)
+    async with aclosing(pages):
+        async for page in pages:
+            newer = [issue for issue in page["results"] if (issue.get("updated_at") or "") >= state.watermark]
+            for issue in newer:
+                by_id.setdefault(issue.get("id"), issue)
+            if len(newer) < len(page["results"]):
+                break
+    changed = list(by_id.values())
+    mirror.upsert("issues", project_id, changed)
+    mirror.mark_synced("issues", project_id, full=False, watermark=_latest(changed, state.watermark))
+    return [issue["id"] for issue in changed if issue.get("id")]
+
+
+async def _sync_worklogs(mirror: Mirror, base: str, project_id: str, issue_ids: list[str], full: bool) -> None:
+    """Re-read the worklogs of the given issues (worklogs have no project-wide listing)."""
+
+    async def fetch(issue_id: str) -> None:
+        worklogs = await make_plane_request(
+            "GET", f"{base}/issues/{issue_id}/worklogs/", use_cache=False, max_staleness=0
+        )
+        mirror.replace("worklogs", project_id, worklogs if isinstance(worklogs, list) else [], parent_id=issue_id)
+
+    results = await map_bounded(fetch, issue_ids, _sync_concurrency())
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+    # A delta pass only re-reads worklogs of changed issues, but worklogs can be
+    # logged without changing their issue, so only a full pass makes them fresh
+    if full:
+        mirror.mark_synced("worklogs", project_id, full=True)
+
+
+async def sync_project(project_id: str, full: bool = False) -> dict[str, int]:
+    """
+    Sync one project into the mirror.
+
+    Args:
+        project_id: Project UUID
+        full: Re-read everything instead of only issues updated since the last sync
+
+    Returns:
+        Number of mirrored objects per kind after the sync
+    """
+    mirror = get_mirror()
+    if mirror is None:
+        raise PlaneAPIError("Local mirror is disabled (set PLANE_MIRROR_PATH)")
+    workspace_slug = get_workspace_slug()
+    base = f"workspaces/{workspace_slug}/projects/{project_id}"
+
+    async def sync_small(kind: str) -> None:
+        mirror.replace(kind, project_id, await _fetch_all(f"{base}/{kind}/"))
+        mirror.mark_synced(kind, project_id, full=True)
+
+    await asyncio.gather(*(sync_small(kind) for kind in _SMALL_KINDS))
+    worklogs_state = mirror.sync_state("worklogs", project_id)
+    changed = await _sync_issues(mirror, base, project_id, full)
+    if _worklogs_enabled():
+        if full or worklogs_state is None or time.time() - worklogs_state.full_synced_at > _full_sync_interval():
+            await _sync_worklogs(mirror, base, project_id, mirror.ids("issues", project_id), full=True)
+        else:
+            await _sync_worklogs(mirror, base, project_id, changed, full=False)
+
+    kinds = ("issues", *_SMALL_KINDS, "worklogs")
+    return {kind: mirror.count(kind, project_id) for kind in kinds}
+
+
+async def sync_workspace(full: bool = False, projects: Optional[list[str]] = None) -> dict[str, Any]:
+    """
+    Sync the project list and the selected projects into the mirror.
+
+    Only one sync runs at a time; concurrent callers wait for the running one.
+
+    Args:
+        full: Force a full re-read of every project
+        projects: Project UUIDs or identifiers; defaults to PLANE_MIRROR_PROJECTS, or all projects
+
+    Returns:
+        Per-project object counts and errors
+    """
+    global _sync_lock
+    mirror = get_mirror()
+    if mirror is None:
+        raise PlaneAPIError("Local mirror is disabled (set PLANE_MIRROR_PATH)")
+    if _sync_lock is None:
+        _sync_lock = asyncio.Lock()
+
+    async with _sync_lock:
+        workspace_slug = get_workspace_slug()
+        all_projects = await _fetch_all(f"workspaces/{workspace_slug}/projects/")
+        mirror.replace("projects", WORKSPACE_SCOPE, all_projects)
+        mirror.mark_synced("projects", WORKSPACE_SCOPE, full=True)
+
+        if projects is None:
+            configured = os.getenv("PLANE_MIRROR_PROJECTS", "")
+            projects = [item.strip() for item in configured.split(",") if item.strip()]
+        if projects:
+            project_ids = [await resolve_project_id(project) for project in projects]
+        else:
+            project_ids = [project["id"] for project in all_projects if project.get("id")]
+
+        result: dict[str, Any] = {"projects": {}, "errors": {}}
+        for project_id in project_ids:
+            try:
+                result["projects"][project_id] = await sync_project(project_id, full)
+            except PlaneAPIError as e:
+                result["errors"][project_id] = str(e)
+        return result
+
+
+def _acquire_sync_lock(mirror: Mirror) -> Optional[IO]:
+    """
+    Try to become the process that runs the background sync of a mirror file.
+
+    With several worker processes sharing the mirror only the lock holder
+    syncs; the lock is released by the OS when the holder exits, and another
+    worker takes over on its next attempt.
+
+    Returns:
+        The open lock file to keep while syncing, or None if another process holds it
+    """
+    if fcntl is None:
+        return open(os.devnull)
+    lock = open(f"{mirror.path}.sync-lock", "a")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return None
+    return lock
+
+
+async def _sync_loop() -> None:
+    """Keep the mirror current until cancelled."""
+    interval = float(os.getenv("PLANE_MIRROR_SYNC_INTERVAL", "60"))
+    lock = None
+    try:
+        while True:
+            start = time.monotonic()
+            if lock is None:
+                lock = _acquire_sync_lock(get_mirror())
+            if lock is not None:
+                try:
+                    with background_requests():
+                        result = await sync_workspace()
+                    for project_id, error in result["errors"].items():
+                        print(f"WARNING: Mirror sync of project {project_id} failed: {error}", file=sys.stderr)
+                except PlaneAPIError as e:
+                    print(f"WARNING: Mirror sync failed: {e}", file=sys.stderr)
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - start)))
+    finally:
+        if lock is not None:
+            lock.close()
+
+
+@asynccontextmanager
+async def mirror_lifespan(server: Any) -> AsyncIterator[dict[str, Any]]:
+    """
+    FastMCP lifespan that runs the background mirror sync.
+
+    Like the HTTP client lifespan, the sync task is shared by all sessions:
+    the first one starts it and the last one to end stops it. Nothing runs
+    when the mirror is not configured.
+    """
+    global _lifespan_users, _sync_task
+    if get_mirror() is None:
+        yield {}
+        return
+
+    _lifespan_users += 1
+    if _sync_task is None:
+        _sync_task = asyncio.create_task(_sync_loop())
+    try:
+        yield {}
+    finally:
+        _lifespan_users -= 1
+        if _lifespan_users == 0 and _sync_task is not None:
+            task, _sync_task = _sync_task, None
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
@@ -0,0 +1,184 @@
+"""Response projection and JSON formatting for tool outputs."""
+
+from typing import Any, Mapping, Optional, Union
+
+from plane_mcp.common import serializer
+from plane_mcp.common.continuation import fit_output
+
+# Fields dropped in compact mode: large bodies and bookkeeping that rarely
+# matter to an agent but cost a lot of context.
+COMPACT_EXCLUDE = frozenset({
+    "description_binary",
+    "description_html",
+    "description_stripped",
+    "comment_json",
+    "logo_props",
+    "workspace",
+    "created_by",
+    "updated_by",
+    "deleted_at",
+    "archived_at",
+    "external_id",
+    "external_source",
+    "sort_order",
+})
+
+# Pagination metadata kept alongside projected results
+PAGINATION_KEYS = ("total_count", "count", "next_cursor", "next_page_results")
+
+# Summary spec: output key -> source field, or tuple of fallbacks tried in order
+SummarySpec = Mapping[str, Union[str, tuple[str, ...]]]
+
+ISSUE_SUMMARY: SummarySpec = {
+    "id": "id",
+    "name": "name",
+    "sequence_id": "sequence_id",
+    "state": ("state_detail", "state"),
+    "priority": ("priority_detail", "priority"),
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+PROJECT_SUMMARY: SummarySpec = {
+    "name": "name",
+    "id": "id",
+    "identifier": "identifier",
+    "description": "description",
+    "project_lead": "project_lead",
+}
+
+
+def get_path(item: Mapping[str, Any], path: str) -> Any:
+    """Read a dotted path (e.g. 'state_detail.name') from nested dicts."""
+    value: Any = item
+    for key in path.split("."):
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _select(item: Mapping[str, Any], fields: list[str]) -> dict[str, Any]:
+    """Keep only the requested fields, rebuilding nesting for dotted paths."""
+    result: dict[str, Any] = {}
+    for field in fields:
+        value = get_path(item, field)
+        *parents, leaf = field.split(".")
+        target = result
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[leaf] = value
+    return result
+
+
+def _summarize(item: Mapping[str, Any], summary: SummarySpec) -> dict[str, Any]:
+    """Build a summary dict using the first non-empty source for each key."""
+    result = {}
+    for key, sources in summary.items():
+        if isinstance(sources, str):
+            result[key] = item.get(sources)
+        else:
+            result[key] = next((item[source] for source in sources if item.get(source)), None)
+    return result
+
+
+def _compact(value: Any) -> Any:
+    """Recursively drop bulky fields and empty values."""
+    if isinstance(value, Mapping):
+        return {
+            key: _compact(val)
+            for key, val in value.items()
+            if key not in COMPACT_EXCLUDE and val not in (None, "", [], {})
+        }
+    if isinstance(value, list):
+        return [_compact(val) for val in value]
+    return value
+
+
+def source_keys(fields: Optional[list[str]] = None, summary: Optional[SummarySpec] = None) -> Optional[set[str]]:
+    """
+    Top-level item fields that project_item reads for these fields or summary.
+
+    Returns:
+        Field names, or None when the whole item is needed (no fields or summary)
+    """
+    if fields:
+        return {field.split(".", 1)[0] for field in fields}
+    if summary is not None:
+        keys: set[str] = set()
+        for source in summary.values():
+            keys.update((source,) if isinstance(source, str) else source)
+        return {key.split(".", 1)[0] for key in keys}
+    return None
+
+
+def project_item(
+    item: Any,
+    fields: Optional[list[str]] = None,
+    compact: bool = False,
+    summary: Optional[SummarySpec] = None,
+) -> Any:
+    """
+    Project a single Plane object.
+
+    Explicit fields take precedence over the tool's summary spec; compact
+    mode is applied on top of either.
+    """
+    if not isinstance(item, Mapping):
+        return item
+    if fields:
+        item = _select(item, fields)
+    elif summary is not None:
+        item = _summarize(item, summary)
+    return _compact(item) if compact else item
+
+
+def project(
+    data: Any,
+    fields: Optional[list[str]] = None,
+    compact: bool = False,
+    summary: Optional[SummarySpec] = None,
+) -> Any:
+    """
+    Project a Plane response: a single object, a list, or a paginated page.
+
+    Args:
+        data: Response data from make_plane_request
+        fields: Fields to keep for each item (dotted paths allowed)
+        compact: Drop bulky fields and empty values
+        summary: Default summary spec used when no fields are given
+
+    Returns:
+        Projected data; paginated pages keep their pagination metadata
+    """
+    if not (fields or compact or summary):
+        return data
+    if isinstance(data, list):
+        return [project_item(item, fields, compact, summary) for item in data]
+    if isinstance(data, Mapping) and isinstance(data.get("results"), list):
+        page = {key: data[key] for key in PAGINATION_KEYS if key in data}
+        page["results"] = [project_item(item, fields, compact, summary) for item in data["results"]]
+        return page
+    return project_item(data, fields, compact, summary)
+
+
+def dump_json(data: Any, pretty: bool = False) -> str:
+    """Serialize tool output, minified unless pretty output is requested."""
+    return serializer.dumps(data, pretty)
+
+
+def format_response(
+    data: Any,
+    fields: Optional[list[str]] = None,
+    compact: bool = False,
+    pretty: bool = False,
+    summary: Optional[SummarySpec] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    """
+    Project a Plane response and serialize it as tool output.
+
+    Output over the budget (max_bytes, or MCP_OUTPUT_BUDGET by default) is
+    cut at an item boundary and carries a continuation handle for the rest.
+    """
+    return fit_output(project(data, fields, compact, summary), pretty, max_bytes)
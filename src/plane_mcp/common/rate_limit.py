@@ -0,0 +1,195 @@
+"""Client-side rate limiting and retry policy for Plane API requests."""
+
+import asyncio
+import os
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterator, Optional
+
+from plane_mcp.common.tenant import tenant_local
+
+
+class TokenBucket:
+    """
+    Token-bucket limiter shared by all outgoing Plane API requests.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Waiters are served in FIFO order, so no request is dropped; a burst
+    of calls is simply spread out to stay under the API quota.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for `seconds` (used when Plane answers 429)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        # Resume with a single token once the pause is over
+        self._tokens = 1.0
+        self._updated = self._paused_until
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Which failed requests are retried and how long to wait between attempts."""
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset({"GET", "DELETE"})
+
+    def should_retry(
+        self,
+        method: str,
+        status_code: Optional[int],
+        attempt: int,
+        force: Optional[bool] = None,
+    ) -> bool:
+        """
+        Decide whether to retry a failed attempt.
+
+        Args:
+            method: HTTP method of the request
+            status_code: Response status, or None for a network error
+            attempt: Number of retries already made
+            force: True to retry any method, False to never retry, None for the default
+
+        Only idempotent methods are retried by default. A 429 is the exception:
+        Plane rejects the request before processing it, so resending is safe
+        for any method.
+        """
+        if force is False or attempt >= self.max_retries:
+            return False
+        if status_code is not None and status_code not in self.retry_statuses:
+            return False
+        return force is True or method in self.idempotent_methods or status_code == 429
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before the next attempt (Retry-After or exponential backoff with full jitter)."""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max) + random.uniform(0, self.backoff_base)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_limiter: Optional[TokenBucket] = None
+_background_limiter: Optional[TokenBucket] = None
+_retry_policy: Optional[RetryPolicy] = None
+
+# Set while the background mirror sync runs, so its requests use their own budget
+_background: ContextVar[bool] = ContextVar("plane_background_requests", default=False)
+
+
+@contextmanager
+def background_requests() -> Iterator[None]:
+    """Send the Plane requests made inside the block (and tasks started from it) through the background budget."""
+    token = _background.set(True)
+    try:
+        yield
+    finally:
+        _background.reset(token)
+
+
+def _background_share() -> float:
+    """Share of the rate reserved for the background mirror sync (none without a mirror)."""
+    if not os.getenv("PLANE_MIRROR_PATH"):
+        return 0.0
+    return min(0.9, max(0.0, float(os.getenv("PLANE_MIRROR_RATE_SHARE", "0.2"))))
+
+
+def get_rate_limiter() -> Optional[TokenBucket]:
+    """
+    Get the current tenant's rate limiter (the process-wide one by default), or None when limiting is disabled.
+
+    Each tenant is limited separately, since Plane limits each API key separately.
+    With several worker processes (MCP_WORKERS) each one gets an equal share of the rate.
+    With a mirror configured, the background sync gets its own smaller bucket
+    (PLANE_MIRROR_RATE_SHARE of the rate) and tool calls the rest, so a long
+    sync does not queue ahead of interactive requests.
+
+    Environment variables:
+        PLANE_RATE_LIMIT_PER_MINUTE: Sustained request rate (default 60, 0 disables)
+        PLANE_RATE_LIMIT_BURST: Requests allowed back-to-back before throttling (default 10)
+        PLANE_MIRROR_RATE_SHARE: Share of the rate for the background mirror sync (default 0.2)
+    """
+    global _limiter, _background_limiter
+    workers = max(1, int(os.getenv("MCP_WORKERS", "1")))
+    per_minute = float(os.getenv("PLANE_RATE_LIMIT_PER_MINUTE", "60")) / workers
+    if per_minute <= 0:
+        return None
+    burst = float(os.getenv("PLANE_RATE_LIMIT_BURST", "10")) / workers
+
+    def create() -> TokenBucket:
+        return TokenBucket(rate=per_minute / 60, capacity=max(1.0, burst))
+
+    limiter = tenant_local("rate_limiter", create)
+    if limiter is not None:
+        return limiter
+    # The mirror only serves the environment's workspace, so only its limiter is split
+    share = _background_share()
+    if share > 0 and _background.get():
+        if _background_limiter is None:
+            _background_limiter = TokenBucket(rate=per_minute * share / 60, capacity=max(1.0, burst * share))
+        return _background_limiter
+    if _limiter is None:
+        _limiter = TokenBucket(rate=per_minute * (1 - share) / 60, capacity=max(1.0, burst * (1 - share)))
+    return _limiter
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    Get the retry policy configured from environment.
+
+    Environment variables:
+        PLANE_RETRY_MAX: Maximum number of retries per request (default 3)
+        PLANE_RETRY_BACKOFF: Base backoff in seconds (default 0.5)
+        PLANE_RETRY_MAX_BACKOFF: Upper bound for a single wait in seconds (default 30)
+    """
+    global _retry_policy
+    if _retry_policy is None:
+        _retry_policy = RetryPolicy(
+            max_retries=int(os.getenv("PLANE_RETRY_MAX", "3")),
+            backoff_base=float(os.getenv("PLANE_RETRY_BACKOFF", "0.5")),
+            backoff_max=float(os.getenv("PLANE_RETRY_MAX_BACKOFF", "30")),
+        )
+    return _retry_policy
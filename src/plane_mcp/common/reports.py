@@ -0,0 +1,250 @@
+"""Aggregations over Plane data for reporting tools."""
+
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Callable, Optional
+
+from plane_mcp.common.request_helper import PlaneAPIError, paginate
+
+WORKLOG_GROUPS = ("user", "issue", "day", "week")
+
+
+def member_names(members: Any) -> dict[str, str]:
+    """Display name (or email) per user UUID from a workspace members response."""
+    names = {}
+    for member in members if isinstance(members, list) else []:
+        member = member.get("member", member) if isinstance(member, dict) else {}
+        if member.get("id"):
+            names[member["id"]] = member.get("display_name") or member.get("email") or member["id"]
+    return names
+
+
+def _results(data: Any) -> list[dict[str, Any]]:
+    """Objects of a list or paginated response."""
+    if isinstance(data, dict):
+        data = data.get("results")
+    return [item for item in data if isinstance(item, dict)] if isinstance(data, list) else []
+
+
+def ref_id(value: Any) -> Any:
+    """UUID of a reference that may be expanded into an object."""
+    return value.get("id") if isinstance(value, dict) else value
+
+
+def issue_context(
+    issue: dict[str, Any],
+    project: Any,
+    states: Any,
+    labels: Any,
+    members: Any,
+    comments: Any = None,
+    worklogs: Any = None,
+) -> dict[str, Any]:
+    """
+    Denormalize an issue with its discussion and logged time into one document.
+
+    State, label and user UUIDs are resolved to names from the metadata
+    responses; UUIDs that cannot be resolved are kept with a null name.
+
+    Args:
+        issue: Issue response
+        project: Project response (for the readable ID)
+        states: Project states response
+        labels: Project labels response
+        members: Workspace members response
+        comments: Issue comments response, None to leave comments out
+        worklogs: Issue worklogs response, None to leave worklogs out
+    """
+    names = member_names(members)
+    states_by_id = {state.get("id"): state for state in _results(states)}
+    labels_by_id = {label.get("id"): label for label in _results(labels)}
+    project = project if isinstance(project, dict) else {}
+
+    def user(value: Any) -> Optional[dict[str, Any]]:
+        user_id = ref_id(value)
+        return {"id": user_id, "name": names.get(user_id)} if user_id else None
+
+    state_id = ref_id(issue.get("state"))
+    state = states_by_id.get(state_id) or issue.get("state_detail") or {}
+    identifier = project.get("identifier")
+    sequence_id = issue.get("sequence_id")
+    document: dict[str, Any] = {
+        "issue": {
+            "id": issue.get("id"),
+            "readable_id": f"{identifier}-{sequence_id}" if identifier and sequence_id is not None else None,
+            "name": issue.get("name"),
+            "description": issue.get("description_stripped") or issue.get("description_html"),
+            "state": {"id": state_id, "name": state.get("name"), "group": state.get("group")},
+            "priority": issue.get("priority"),
+            "labels": [
+                {"id": label_id, "name": labels_by_id.get(label_id, {}).get("name")}
+                for label_id in map(ref_id, issue.get("labels") or [])
+            ],
+            "assignees": [user(assignee) for assignee in issue.get("assignees") or []],
+            "parent": ref_id(issue.get("parent")),
+            "start_date": issue.get("start_date"),
+            "target_date": issue.get("target_date"),
+            "completed_at": issue.get("completed_at"),
+            "created_by": user(issue.get("created_by")),
+            "created_at": issue.get("created_at"),
+            "updated_at": issue.get("updated_at"),
+        },
+        "project": {"id": project.get("id"), "identifier": identifier, "name": project.get("name")},
+    }
+    if comments is not None:
+        document["comments"] = [
+            {
+                "id": comment.get("id"),
+                "author": user(comment.get("actor") or comment.get("created_by")),
+                "comment": comment.get("comment_stripped") or comment.get("comment_html"),
+                "created_at": comment.get("created_at"),
+            }
+            for comment in _results(comments)
+        ]
+    if worklogs is not None:
+        entries = _results(worklogs)
+        document["worklogs"] = {
+            # Plane stores durations in minutes
+            "total_minutes": sum(worklog.get("duration") or 0 for worklog in entries),
+            "entries": [
+                {
+                    "id": worklog.get("id"),
+                    "user": user(worklog.get("logged_by") or worklog.get("created_by")),
+                    "duration": worklog.get("duration"),
+                    "description": worklog.get("description"),
+                    "logged_at": worklog.get("logged_at") or worklog.get("created_at"),
+                }
+                for worklog in entries
+            ],
+        }
+    return document
+
+
+def issue_of(item: dict[str, Any]) -> dict[str, Any]:
+    """The issue object itself, unwrapping cycle/module membership records."""
+    detail = item.get("issue_detail")
+    return detail if isinstance(detail, dict) else item
+
+
+def scope_path(base: str, cycle_id: Optional[str] = None, module_id: Optional[str] = None) -> str:
+    """
+    List endpoint for the issues of a project, cycle or module.
+
+    Args:
+        base: Project path, 'workspaces/<slug>/projects/<project_id>'
+        cycle_id: Restrict to a cycle
+        module_id: Restrict to a module
+    """
+    if cycle_id and module_id:
+        raise PlaneAPIError("Pass either cycle_id or module_id, not both")
+    if cycle_id:
+        return f"{base}/cycles/{cycle_id}/cycle-issues/"
+    if module_id:
+        return f"{base}/modules/{module_id}/module-issues/"
+    return f"{base}/issues/"
+
+
+async def collect_issues(path: str, max_staleness: Optional[float] = None) -> list[dict[str, Any]]:
+    """Read every issue of a scope endpoint (see scope_path), unwrapped."""
+    issues = []
+    async for page in paginate(path, max_staleness=max_staleness):
+        issues.extend(issue_of(item) for item in page["results"] if isinstance(item, dict))
+    return issues
+
+
+def _day(worklog: dict[str, Any]) -> Optional[date]:
+    """Day the work was done (logged_at, falling back to when it was recorded)."""
+    stamp = worklog.get("logged_at") or worklog.get("started_at") or worklog.get("created_at")
+    if not stamp:
+        return None
+    try:
+        return datetime.fromisoformat(stamp.replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
+
+
+def _week(day: date) -> str:
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+class WorklogAggregator:
+    """
+    Sums worklog durations by any combination of user, issue, day and week.
+
+    Worklogs are folded in as they arrive, so only one running total per
+    group is kept no matter how many worklogs are read.
+
+    Args:
+        group_by: Grouping keys from WORKLOG_GROUPS, in output column order
+        start: Only count worklogs logged on or after this day
+        end: Only count worklogs logged on or before this day
+        user_label: Maps a user UUID to the label shown in the report
+        issue_label: Maps an issue UUID to the label shown in the report
+    """
+
+    def __init__(
+        self,
+        group_by: list[str],
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        user_label: Callable[[str], str] = str,
+        issue_label: Callable[[str], str] = str,
+    ) -> None:
+        unknown = [key for key in group_by if key not in WORKLOG_GROUPS]
+        if unknown or not group_by:
+            raise PlaneAPIError(f"group_by must use {', '.join(WORKLOG_GROUPS)}; got {group_by}")
+        self.group_by = list(group_by)
+        self.start = start
+        self.end = end
+        self.user_label = user_label
+        self.issue_label = issue_label
+        self.minutes: dict[tuple, float] = defaultdict(float)
+        self.entries: dict[tuple, int] = defaultdict(int)
+        self.worklogs = 0
+
+    def add(self, issue_id: str, worklogs: list[dict[str, Any]]) -> None:
+        """Fold one issue's worklogs into the totals."""
+        for worklog in worklogs:
+            day = _day(worklog)
+            if (self.start or self.end) and day is None:
+                continue
+            if (self.start and day < self.start) or (self.end and day > self.end):
+                continue
+            values = {
+                "user": worklog.get("logged_by") or worklog.get("user") or worklog.get("created_by"),
+                "issue": issue_id,
+                "day": day,
+                "week": _week(day) if day else None,
+            }
+            key = tuple(values[group] for group in self.group_by)
+            # Plane stores durations in minutes
+            self.minutes[key] += worklog.get("duration") or 0
+            self.entries[key] += 1
+            self.worklogs += 1
+
+    def _label(self, group: str, value: Any) -> Any:
+        if value is None:
+            return None
+        if group == "user":
+            return self.user_label(value)
+        if group == "issue":
+            return self.issue_label(value)
+        return value.isoformat() if isinstance(value, date) else value
+
+    def table(self) -> dict[str, Any]:
+        """Report as a compact table: column names plus one row per group, sorted by group values."""
+        rows = [
+            [self._label(group, value) for group, value in zip(self.group_by, key)]
+            + [round(minutes), round(minutes / 60, 2), self.entries[key]]
+            for key, minutes in self.minutes.items()
+        ]
+        rows.sort(key=lambda row: tuple("" if value is None else str(value) for value in row[:len(self.group_by)]))
+        total = sum(self.minutes.values())
+        return {
+            "columns": [*self.group_by, "minutes", "hours", "entries"],
+            "rows": rows,
+            "total_minutes": round(total),
+            "total_hours": round(total / 60, 2),
+            "worklogs": self.worklogs,
+        }
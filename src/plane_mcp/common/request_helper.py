@@ -1,29 +1,143 @@
 """HTTP request helper for Plane API."""
 
+import asyncio
 import os
-from typing import Any, Optional
+import time
+from typing import Any, AsyncIterator, Callable, Collection, Optional
+from urllib.parse import urlencode
 
 import httpx
 
+from plane_mcp.common.cache import get_response_cache, invalidate_tenant_cache
+from plane_mcp.common.concurrency import SingleFlight
+from plane_mcp.common.decoding import decode_response
+from plane_mcp.common.http_client import get_http_client
+from plane_mcp.common.id_index import get_identifier_index
+from plane_mcp.common.mirror import default_max_staleness, get_mirror
+from plane_mcp.common.metrics import (
+    API_COALESCED,
+    API_DURATION,
+    API_IN_FLIGHT,
+    API_REQUESTS,
+    API_RETRIES,
+    CACHE_LOOKUPS,
+    MIRROR_LOOKUPS,
+    path_template,
+)
+from plane_mcp.common.rate_limit import get_rate_limiter, get_retry_policy, parse_retry_after
+from plane_mcp.common.streaming import PageParser, streaming_enabled, transform_items
+from plane_mcp.common.tenant import API_KEY_HEADER, current_tenant_key, get_api_key
+from plane_mcp.common.workers import get_shared_state
+
 
 class PlaneAPIError(Exception):
     """Exception raised for Plane API errors."""
 
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+# Concurrent identical GETs share one upstream request
+_in_flight = SingleFlight()
+
+
+async def _send_with_retry(
+    method: str,
+    path: str,
+    url: str,
+    headers: dict[str, str],
+    body: Optional[dict[str, Any]],
+    timeout: float,
+    retry: Optional[bool],
+    stream: bool = False,
+) -> httpx.Response:
+    """
+    Send a request through the rate limiter, retrying transient failures.
+
+    With stream, the returned response's body has not been read yet and
+    the caller must close it.
+    """
+    client = get_http_client()
+    limiter = get_rate_limiter()
+    policy = get_retry_policy()
+    template = path_template(path)
+    attempt = 0
+
+    while True:
+        if limiter is not None:
+            await limiter.acquire()
+
+        API_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            request = client.build_request(method, url, headers=headers, json=body, timeout=timeout)
+            response = await client.send(request, stream=stream)
+        except httpx.TransportError as e:
+            API_REQUESTS.inc(method, template, "error")
+            if not policy.should_retry(method, None, attempt, retry):
+                raise
+            API_RETRIES.inc(method, template, type(e).__name__)
+            delay = policy.delay(attempt)
+        else:
+            API_REQUESTS.inc(method, template, str(response.status_code))
+            if not policy.should_retry(method, response.status_code, attempt, retry):
+                return response
+            API_RETRIES.inc(method, template, str(response.status_code))
+            if stream:
+                await response.aclose()
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if response.status_code == 429 and limiter is not None:
+                # Slow down every caller, not just this one
+                limiter.pause(retry_after if retry_after is not None else policy.delay(attempt))
+            delay = policy.delay(attempt, retry_after)
+        finally:
+            API_DURATION.observe(time.perf_counter() - start, method, template)
+            API_IN_FLIGHT.dec()
+
+        attempt += 1
+        await asyncio.sleep(delay)
+
 
 async def make_plane_request(
     method: str,
     path: str,
     body: Optional[dict[str, Any]] = None,
     timeout: float = 30.0,
+    use_cache: bool = True,
+    params: Optional[dict[str, Any]] = None,
+    retry: Optional[bool] = None,
+    max_staleness: Optional[float] = None,
+    item: Optional[Callable[[Any], Any]] = None,
+    keys: Optional[Collection[str]] = None,
 ) -> Any:
     """
     Make an HTTP request to Plane API.
 
+    Outgoing requests pass through the shared rate limiter. Network errors,
+    429 and 5xx responses are retried with backoff (honoring Retry-After)
+    for idempotent methods; see RetryPolicy for details. Concurrent
+    identical GETs (same URL and API key) share a single upstream request.
+    When the local mirror is enabled, GETs it can answer are served from it
+    if it was synced within max_staleness seconds.
+
     Args:
         method: HTTP method (GET, POST, PATCH, DELETE)
         path: API path (without /api/ prefix)
         body: Request body for POST/PATCH requests
         timeout: Request timeout in seconds
+        use_cache: Serve GET requests from the response cache when possible
+        params: Query string parameters
+        retry: True to retry non-idempotent methods too, False to disable retries
+        max_staleness: Oldest mirror sync (seconds) acceptable for this read, 0 to bypass
+            the mirror; defaults to PLANE_MIRROR_MAX_STALENESS
+        item: For GETs of list endpoints, maps each result to what is kept (None drops it)
+        keys: For GETs of list endpoints, the only result fields to parse (see streaming.PageParser)
+
+    With item or keys, the response is read as a page ({"results": [...], ...})
+    parsed incrementally as it arrives, so unneeded items and fields are
+    never held in memory; such reads skip request coalescing and are not
+    stored in the response cache.
 
     Returns:
         Response data as dict/list
@@ -33,42 +147,121 @@ async def make_plane_request(
     """
     host_url = os.getenv("PLANE_API_HOST_URL", "https://api.plane.so/")
     host = host_url if host_url.endswith("/") else f"{host_url}/"
+    query = {key: value for key, value in (params or {}).items() if value is not None}
+    if query:
+        path = f"{path}?{urlencode(query)}"
     url = f"{host}api/v1/{path}"
 
-    api_key = os.getenv("PLANE_API_KEY", "")
+    api_key = get_api_key()
     if not api_key:
-        raise PlaneAPIError("PLANE_API_KEY environment variable is not set")
+        raise PlaneAPIError(f"No Plane API key: set PLANE_API_KEY or send the {API_KEY_HEADER} header")
 
     headers = {
         "X-API-Key": api_key,
     }
 
+    method = method.upper()
+    if method not in ("GET", "POST", "PATCH", "DELETE"):
+        raise PlaneAPIError(f"Unsupported HTTP method: {method}")
+
     # Add Content-Type for non-GET requests
-    if method.upper() != "GET":
+    if method != "GET":
         headers["Content-Type"] = "application/json"
 
+    streaming = method == "GET" and (item is not None or keys is not None)
+
+    # Serve from the local mirror when it was synced recently enough
+    mirror = get_mirror()
+    if mirror is not None and method == "GET":
+        mirrored = mirror.lookup(path, default_max_staleness() if max_staleness is None else max_staleness)
+        MIRROR_LOOKUPS.inc("miss" if mirrored is None else "hit")
+        if mirrored is not None:
+            get_identifier_index().observe(path, mirrored)
+            return transform_items(mirrored, item, keys) if streaming else mirrored
+
+    # Apply writes made through other worker processes before trusting the cache
+    shared = get_shared_state()
+    if shared is not None:
+        for tenant_key, written in shared.poll():
+            invalidate_tenant_cache(tenant_key, written)
+
+    # Serve fresh GET responses from cache, revalidate stale ones
+    cache = get_response_cache()
+    cached = cache.get(path) if cache is not None and use_cache and method == "GET" else None
+    if cached is not None:
+        if cached.is_fresh:
+            CACHE_LOOKUPS.inc("hit")
+            return transform_items(cached.data, item, keys) if streaming else cached.data
+        headers.update(cached.conditional_headers())
+    elif cache is not None and use_cache and method == "GET":
+        CACHE_LOOKUPS.inc("miss")
+
+    async def fetch_streaming() -> Any:
+        response = await _send_with_retry(
+            method,
+            path,
+            url,
+            headers=headers,
+            body=None,
+            timeout=timeout,
+            retry=retry,
+            stream=True,
+        )
+        try:
+            if response.status_code == 304 and cached is not None:
+                CACHE_LOOKUPS.inc("revalidated")
+                cache.refresh(path)
+                return transform_items(cached.data, item, keys)
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            index = get_identifier_index()
+            parser = PageParser(item, keys, observe=lambda entry: index.observe(path, [entry]))
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+            return parser.close()
+        finally:
+            await response.aclose()
+
+    async def fetch() -> Any:
+        response = await _send_with_retry(
+            method,
+            path,
+            url,
+            headers=headers,
+            body=body if method in ("POST", "PATCH") else None,
+            timeout=timeout,
+            retry=retry,
+        )
+        if response.status_code == 304 and cached is not None:
+            CACHE_LOOKUPS.inc("revalidated")
+            cache.refresh(path)
+            return cached.data
+
+        response.raise_for_status()
+        # DELETE and some PATCH endpoints answer 204 without a body
+        data = decode_response(path, response.content) if response.content else None
+        get_identifier_index().observe(path, data)
+        if cache is not None and use_cache and method == "GET":
+            cache.store(path, data, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return transform_items(data, item, keys) if streaming else data
+
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            if method.upper() == "GET":
-                response = await client.get(url, headers=headers)
-            elif method.upper() == "POST":
-                response = await client.post(url, headers=headers, json=body)
-            elif method.upper() == "PATCH":
-                response = await client.patch(url, headers=headers, json=body)
-            elif method.upper() == "DELETE":
-                response = await client.delete(url, headers=headers)
-            else:
-                raise PlaneAPIError(f"Unsupported HTTP method: {method}")
-
-            response.raise_for_status()
-            return response.json()
+        if streaming and streaming_enabled():
+            return await fetch_streaming()
+        if method != "GET" or streaming:
+            return await fetch()
+        data, coalesced = await _in_flight.do((method, url, api_key), fetch)
+        if coalesced:
+            API_COALESCED.inc(path_template(path))
+        return data
 
     except httpx.HTTPStatusError as e:
         status_code = e.response.status_code
         error_text = e.response.text
         
         # Log the full request details for debugging
-        print(f"HTTP Request: {method.upper()} {url} \"{e.response.status_code} {e.response.reason_phrase}\"")
+        print(f"HTTP Request: {method} {url} \"{e.response.status_code} {e.response.reason_phrase}\"")
 
         if status_code == 403:
             error_msg = f"HTTP 403 Forbidden: Access denied. Check project permissions and API key."
@@ -79,8 +272,77 @@ async def make_plane_request(
         else:
             error_msg = f"HTTP {status_code}: {error_text}"
 
-        raise PlaneAPIError(error_msg) from e
+        raise PlaneAPIError(error_msg, status_code=status_code) from e
     except httpx.RequestError as e:
         raise PlaneAPIError(f"Request failed: {str(e)}") from e
+    except PlaneAPIError:
+        raise
     except Exception as e:
         raise PlaneAPIError(f"Unexpected error: {str(e)}") from e
+    finally:
+        # Writes invalidate cached and mirrored reads of the affected resources
+        if cache is not None and method != "GET":
+            cache.invalidate_for_write(path)
+        if mirror is not None and method != "GET":
+            mirror.invalidate_for_write(path)
+        if shared is not None and method != "GET":
+            shared.publish(current_tenant_key(), path)
+
+
+async def paginate(
+    path: str,
+    per_page: int = 100,
+    cursor: Optional[str] = None,
+    params: Optional[dict[str, Any]] = None,
+    use_cache: bool = True,
+    max_staleness: Optional[float] = None,
+    item: Optional[Callable[[Any], Any]] = None,
+    keys: Optional[Collection[str]] = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Iterate over the pages of a cursor-paginated Plane list endpoint.
+
+    The next page is requested as soon as the current one arrives, so the
+    network round trip overlaps with the caller's processing. At most two
+    pages are held in memory at a time.
+
+    Args:
+        path: API path of the list endpoint
+        per_page: Page size (Plane accepts 1-100)
+        cursor: Cursor to start from (e.g. a previous page's next_cursor)
+        params: Extra query string parameters
+        use_cache: Serve pages from the response cache when possible
+        max_staleness: Staleness bound for serving pages from the local mirror (see make_plane_request)
+        item: Maps each result to what is kept, as the page is parsed (see make_plane_request)
+        keys: Only result fields to parse (see make_plane_request)
+
+    Yields:
+        Page responses (with results, next_cursor, next_page_results, ...); with
+        item or keys, results hold only what they kept
+
+    Raises:
+        PlaneAPIError: If a page request fails
+    """
+    per_page = max(1, min(per_page, 100))
+
+    def fetch(page_cursor: Optional[str]) -> asyncio.Task:
+        page_params = {**(params or {}), "per_page": per_page, "cursor": page_cursor}
+        return asyncio.ensure_future(make_plane_request(
+            "GET", path, use_cache=use_cache, params=page_params, max_staleness=max_staleness, item=item, keys=keys,
+        ))
+
+    pending: Optional[asyncio.Task] = fetch(cursor)
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            if not isinstance(page, dict) or "results" not in page:
+                # Endpoint is not paginated, treat the whole response as one page
+                yield {"results": page if isinstance(page, list) else [page]}
+                return
+            if page.get("next_page_results") and page.get("next_cursor"):
+                pending = fetch(page["next_cursor"])
+            yield page
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,32 @@
+"""JSON serialization with an optional orjson fast path.
+
+orjson is used when installed (pip install "plane-mcp[orjson]"); otherwise the
+standard library is used. Both backends emit UTF-8 without ASCII escaping.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, pretty: bool = False) -> str:
+    """Serialize data to a JSON string, indented with two spaces when pretty."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, option=option).decode()
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
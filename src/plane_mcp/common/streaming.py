@@ -0,0 +1,193 @@
+"""Incremental parsing of Plane list responses.
+
+A list response (a paginated page or a plain list) is parsed as its body
+arrives: each item of its results is assembled on its own, handed to a
+per-item callback (which typically filters and projects it) and dropped,
+and only the top-level fields the caller asked for are built at all. Peak
+memory therefore depends on the largest item rather than the page size.
+
+Parsing uses ijson (pip install "plane-mcp[streaming]"); without it,
+streaming reads fall back to parsing the whole body and applying the
+same callback afterwards.
+"""
+
+import os
+from typing import Any, Callable, Collection, Optional
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on the environment
+    ijson = None
+
+# Item fields always built, so streamed issues still feed the identifier index
+INDEX_FIELDS = frozenset({"id", "sequence_id", "project", "project_id"})
+
+_OPEN = frozenset({"start_map", "start_array"})
+_CLOSE = frozenset({"end_map", "end_array"})
+
+
+def streaming_enabled() -> bool:
+    """Whether list reads are parsed incrementally (ijson installed and PLANE_STREAMING_PARSE, default true)."""
+    return ijson is not None and os.getenv("PLANE_STREAMING_PARSE", "true").lower() in ("1", "true", "yes")
+
+
+def item_keys(keys: Optional[Collection[str]]) -> Optional[frozenset[str]]:
+    """Top-level item fields to build for a streaming read; None builds every field."""
+    return None if keys is None else frozenset(keys) | INDEX_FIELDS
+
+
+def transform_items(
+    data: Any,
+    item: Optional[Callable[[Any], Any]],
+    keys: Optional[Collection[str]],
+) -> dict[str, Any]:
+    """
+    Apply a streaming read's per-item callback to an already parsed response.
+
+    Used for responses served by the cache or mirror, and when incremental
+    parsing is unavailable, so callers get the same result either way. A
+    response that is not a page or a list (e.g. a single object) is treated
+    as a page with that one item, as PageParser does.
+    """
+    if isinstance(data, dict) and isinstance(data.get("results"), list):
+        page = data
+    else:
+        page = {"results": data if isinstance(data, list) else [data]}
+    keys = item_keys(keys)
+    results = []
+    for entry in page["results"]:
+        if keys is not None and isinstance(entry, dict):
+            entry = {key: value for key, value in entry.items() if key in keys}
+        if item is not None:
+            entry = item(entry)
+        if entry is not None:
+            results.append(entry)
+    return {**page, "results": results}
+
+
+class PageParser:
+    """
+    Push parser for a list response: feed() body chunks, then close().
+
+    Args:
+        item: Maps each parsed item to what is kept (None drops the item); items are kept as-is by default
+        keys: Top-level item fields to build (plus INDEX_FIELDS); other fields are skipped unparsed
+        observe: Called with each parsed item before the item callback (e.g. to index it)
+    """
+
+    def __init__(
+        self,
+        item: Optional[Callable[[Any], Any]] = None,
+        keys: Optional[Collection[str]] = None,
+        observe: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        if ijson is None:
+            raise RuntimeError("Streaming parse requires ijson")
+        self.item = item
+        self.keys = item_keys(keys)
+        self.observe = observe
+        self.page: dict[str, Any] = {}
+        self.results: list[Any] = []
+        self._depth = 0
+        self._is_object = False
+        self._is_page = False
+        self._items_depth: Optional[int] = None
+        self._entry: Optional[dict[str, Any]] = None
+        self._key: Optional[str] = None
+        # Value being built or skipped: (builder or None, start depth, assign)
+        self._value: Optional[tuple[Any, int, Optional[Callable[[Any], None]]]] = None
+        self._parser = ijson.basic_parse_coro(self, use_float=True)
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the body."""
+        self._parser.send(chunk)
+
+    def close(self) -> dict[str, Any]:
+        """
+        Finish parsing and return the page, with the kept items as results.
+
+        A response that is not a page or a list (an object without a results
+        list, or a scalar) becomes a page with that one item, like transform_items.
+        """
+        self._parser.close()
+        if self._is_object and not self._is_page:
+            entry, self.page = self.page, {}
+            if self.keys is not None:
+                entry = {key: value for key, value in entry.items() if key in self.keys}
+            self._emit(entry)
+        return {**self.page, "results": self.results}
+
+    def _emit(self, entry: Any) -> None:
+        if self.observe is not None:
+            self.observe(entry)
+        if self.item is not None:
+            entry = self.item(entry)
+        if entry is not None:
+            self.results.append(entry)
+
+    def _set_page(self, key: str) -> Callable[[Any], None]:
+        return lambda value: self.page.__setitem__(key, value)
+
+    def _set_field(self, key: str) -> Callable[[Any], None]:
+        entry = self._entry
+        return lambda value: entry.__setitem__(key, value)
+
+    def _start_value(self, event: str, value: Any, depth: int, assign: Optional[Callable[[Any], None]]) -> None:
+        self._value = (ijson.ObjectBuilder() if assign is not None else None, depth, assign)
+        self._feed_value(event, value)
+
+    def _feed_value(self, event: str, value: Any) -> None:
+        builder, depth, assign = self._value
+        if builder is not None:
+            builder.event(event, value)
+        if self._depth == depth:
+            self._value = None
+            if assign is not None:
+                assign(builder.value)
+
+    def send(self, event_value: tuple[str, Any]) -> None:
+        """Receive one parse event (ijson coroutine target protocol)."""
+        event, value = event_value
+        depth = self._depth
+        if event in _OPEN:
+            self._depth += 1
+        elif event in _CLOSE:
+            self._depth -= 1
+
+        if self._value is not None:
+            self._feed_value(event, value)
+        elif depth == 0:
+            if event == "start_array":
+                # Plain list response
+                self._is_page = True
+                self._items_depth = 1
+            elif event == "start_map":
+                self._is_object = True
+            else:
+                # Scalar response
+                self._is_page = True
+                self._emit(value)
+        elif depth == self._items_depth:
+            if event == "start_map":
+                self._entry = {}
+            elif event == "end_array":
+                self._items_depth = None
+            else:
+                self._start_value(event, value, depth, self._emit)
+        elif self._entry is not None and depth == self._items_depth + 1:
+            if event == "map_key":
+                self._key = value
+            elif event == "end_map":
+                entry, self._entry = self._entry, None
+                self._emit(entry)
+            else:
+                keep = self.keys is None or self._key in self.keys
+                self._start_value(event, value, depth, self._set_field(self._key) if keep else None)
+        elif depth == 1:
+            if event == "map_key":
+                self._key = value
+            elif event == "start_array" and self._key == "results":
+                self._is_page = True
+                self._items_depth = 2
+            elif event != "end_map":
+                self._start_value(event, value, depth, self._set_page(self._key))
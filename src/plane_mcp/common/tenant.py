@@ -0,0 +1,197 @@
+"""Per-request Plane credentials and per-tenant resources for multi-tenant servers."""
+
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Mapping, Optional
+
+# Request headers carrying a tenant's credentials (SSE/HTTP transports)
+API_KEY_HEADER = "X-Plane-API-Key"
+WORKSPACE_HEADER = "X-Plane-Workspace-Slug"
+
+
+@dataclass(frozen=True)
+class Tenant:
+    """Plane credentials of one client, taken from its request headers."""
+
+    api_key: str
+    workspace_slug: str
+
+    @property
+    def key(self) -> str:
+        """Stable identifier of the tenant that does not reveal the API key."""
+        return hashlib.sha256(f"{self.workspace_slug}\0{self.api_key}".encode()).hexdigest()[:16]
+
+    def __repr__(self) -> str:
+        return f"Tenant(workspace_slug={self.workspace_slug!r}, key={self.key})"
+
+
+# Tenant of the tool call being handled; None means the process-wide
+# credentials from the environment.
+_current: ContextVar[Optional[Tenant]] = ContextVar("plane_tenant", default=None)
+
+
+def multi_tenant_enabled() -> bool:
+    """Whether credentials may be passed per request (MCP_MULTI_TENANT, default false)."""
+    return os.getenv("MCP_MULTI_TENANT", "false").lower() in ("1", "true", "yes")
+
+
+def default_tenant_allowed() -> bool:
+    """Whether requests without credential headers may use the environment's credentials (MCP_ALLOW_DEFAULT_TENANT, default false)."""
+    return os.getenv("MCP_ALLOW_DEFAULT_TENANT", "false").lower() in ("1", "true", "yes")
+
+
+def tenant_from_headers(headers: Mapping[str, str]) -> Optional[Tenant]:
+    """
+    Get the tenant named by request headers.
+
+    Returns:
+        The tenant, or None when the headers carry the same credentials as the
+        environment (so such clients share the default resources), or carry
+        none and MCP_ALLOW_DEFAULT_TENANT is enabled
+
+    Raises:
+        ValueError: If only one of the two headers is present, or neither is
+            and requests may not fall back to the environment's credentials
+    """
+    api_key = headers.get(API_KEY_HEADER, "").strip()
+    workspace_slug = headers.get(WORKSPACE_HEADER, "").strip()
+    if not api_key and not workspace_slug:
+        if default_tenant_allowed():
+            return None
+        raise ValueError(f"Send your Plane credentials in the {API_KEY_HEADER} and {WORKSPACE_HEADER} headers")
+    if not api_key or not workspace_slug:
+        raise ValueError(f"Send both {API_KEY_HEADER} and {WORKSPACE_HEADER} headers")
+    if api_key == os.getenv("PLANE_API_KEY") and workspace_slug == os.getenv("PLANE_WORKSPACE_SLUG"):
+        return None
+    return Tenant(api_key=api_key, workspace_slug=workspace_slug)
+
+
+def current_tenant() -> Optional[Tenant]:
+    """Tenant of the current tool call, or None for the environment's credentials."""
+    return _current.get()
+
+
+def current_tenant_key() -> str:
+    """Key of the current tenant, '' for the environment's credentials."""
+    tenant = _current.get()
+    return tenant.key if tenant is not None else ""
+
+
+@contextmanager
+def use_tenant(tenant: Optional[Tenant]) -> Iterator[None]:
+    """
+    Make Plane requests within the block (and tasks it starts) use the tenant's credentials.
+
+    The tenant's resources stay open while the block runs, even if they are
+    evicted meanwhile; they are closed when the last block using them ends.
+    """
+    token = _current.set(tenant)
+    if tenant is not None:
+        _users[tenant.key] = _users.get(tenant.key, 0) + 1
+    try:
+        yield
+    finally:
+        _current.reset(token)
+        if tenant is not None:
+            _users[tenant.key] -= 1
+            if not _users[tenant.key]:
+                del _users[tenant.key]
+                for resources in _evicted.pop(tenant.key, []):
+                    _close_later(resources)
+
+
+def get_api_key() -> str:
+    """Plane API key of the current tenant."""
+    tenant = _current.get()
+    return tenant.api_key if tenant is not None else os.getenv("PLANE_API_KEY", "")
+
+
+def get_workspace_slug() -> Optional[str]:
+    """Workspace slug of the current tenant."""
+    tenant = _current.get()
+    return tenant.workspace_slug if tenant is not None else os.getenv("PLANE_WORKSPACE_SLUG")
+
+
+# Resources (HTTP client, rate limiter, cache, ...) of recently active tenants
+_resources: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_closing: set[asyncio.Task] = set()
+# Tool calls running per tenant, and evicted resources waiting for them to end
+_users: dict[str, int] = {}
+_evicted: dict[str, list[dict[str, Any]]] = {}
+
+
+def _max_tenants() -> int:
+    return int(os.getenv("MCP_MAX_TENANTS", "100"))
+
+
+async def _close(resources: dict[str, Any]) -> None:
+    for resource in resources.values():
+        close = getattr(resource, "aclose", None)
+        if close is not None:
+            await close()
+
+
+def _close_later(resources: dict[str, Any]) -> None:
+    task = asyncio.ensure_future(_close(resources))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+def tenant_local(name: str, factory: Callable[[], Any]) -> Optional[Any]:
+    """
+    Get the current tenant's own instance of a resource, creating it on first use.
+
+    Resources of the least recently active tenants are dropped beyond
+    MCP_MAX_TENANTS tenants, and closed (if they have aclose()) once no tool
+    call of that tenant is running.
+
+    Args:
+        name: Resource name, unique per kind of resource
+        factory: Creates the resource for a tenant
+
+    Returns:
+        The tenant's resource, or None for the default tenant, whose
+        process-wide resource the caller should use instead
+    """
+    tenant = _current.get()
+    if tenant is None:
+        return None
+    resources = _resources.get(tenant.key)
+    if resources is None:
+        resources = _resources[tenant.key] = {}
+        while len(_resources) > max(1, _max_tenants()):
+            key, evicted = _resources.popitem(last=False)
+            if _users.get(key):
+                _evicted.setdefault(key, []).append(evicted)
+            else:
+                _close_later(evicted)
+    _resources.move_to_end(tenant.key)
+    if name not in resources:
+        resources[name] = factory()
+    return resources[name]
+
+
+def tenant_resource(key: str, name: str) -> Optional[Any]:
+    """A resource of the tenant with this key, if the tenant has one in memory."""
+    return _resources.get(key, {}).get(name)
+
+
+def tenant_count() -> int:
+    """Number of tenants with resources in memory."""
+    return len(_resources)
+
+
+async def close_tenants() -> None:
+    """Drop every tenant's resources, closing those that hold connections."""
+    while _resources:
+        _, resources = _resources.popitem()
+        await _close(resources)
+    while _evicted:
+        _, pending = _evicted.popitem()
+        for resources in pending:
+            await _close(resources)
@@ -0,0 +1,201 @@
+"""Receiver for Plane webhooks that keeps cached reads in step with changes made elsewhere.
+
+Plane signs each delivery with the webhook's secret (HMAC-SHA256 of the
+raw body, hex encoded, in the X-Plane-Signature header). Verified issue,
+cycle, module, comment and project events are applied like a write made
+through this server: affected response cache entries are dropped, the
+mirror marks them stale (and removes deleted objects), the readable-ID
+index learns or forgets identifiers, and other worker processes are told
+through the shared state. Events apply to the environment's workspace
+(PLANE_WORKSPACE_SLUG); per-request tenants are not affected.
+"""
+
+import hashlib
+import hmac
+import os
+from typing import Any, Optional
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from plane_mcp.common import serializer
+from plane_mcp.common.cache import get_response_cache
+from plane_mcp.common.id_index import get_identifier_index
+from plane_mcp.common.metrics import WEBHOOK_EVENTS
+from plane_mcp.common.mirror import get_mirror
+from plane_mcp.common.tenant import get_workspace_slug
+from plane_mcp.common.workers import get_shared_state
+
+SIGNATURE_HEADER = "X-Plane-Signature"
+WEBHOOK_PATH = "/webhooks/plane"
+
+# Webhook event -> project-level collection the event's object lives in
+EVENT_COLLECTIONS: dict[str, str] = {
+    "issue": "issues",
+    "cycle": "cycles",
+    "module": "modules",
+    "issue_comment": "issues",
+}
+
+# Larger deliveries are rejected without being parsed
+MAX_BODY_BYTES = 1024 * 1024
+
+
+def webhook_secret() -> Optional[str]:
+    """Secret of the Plane webhook (PLANE_WEBHOOK_SECRET); None disables the endpoint."""
+    return os.getenv("PLANE_WEBHOOK_SECRET") or None
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check a delivery's X-Plane-Signature against the HMAC-SHA256 of its body."""
+    if not signature:
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.strip().lower())
+
+
+def _is_delete(action: Any) -> bool:
+    # Plane sends create/update/delete; older versions sent the HTTP method
+    return str(action).lower() in ("delete", "deleted")
+
+
+def _project_ids(event: str, data: dict[str, Any], deleted: bool) -> list[str]:
+    """Projects the event's object belongs to, as far as they can be told."""
+    project_id = data.get("project_id") or data.get("project")
+    if isinstance(project_id, str):
+        return [project_id]
+    # Delete events may carry only the object's ID
+    item_id = data.get("id")
+    mirror = get_mirror()
+    if item_id and mirror is not None and event in ("issue", "cycle", "module"):
+        mirrored = mirror.item(EVENT_COLLECTIONS[event], item_id)
+        project_id = mirrored and (mirrored.get("project_id") or mirrored.get("project"))
+        if isinstance(project_id, str):
+            return [project_id]
+    if item_id and event == "issue" and deleted:
+        indexed = get_identifier_index().forget_issue(item_id)
+        if indexed is not None:
+            return [indexed]
+    cache = get_response_cache()
+    return sorted(cache.project_ids()) if cache is not None else []
+
+
+def event_paths(event: str, data: dict[str, Any], workspace_slug: str, project_ids: list[str]) -> list[str]:
+    """API paths a write causing the event would have been made to."""
+    item_id = data.get("id")
+    if event == "project":
+        return [f"workspaces/{workspace_slug}/projects/{item_id}/" if item_id else f"workspaces/{workspace_slug}/projects/"]
+    paths = []
+    for project_id in project_ids:
+        base = f"workspaces/{workspace_slug}/projects/{project_id}/"
+        if event == "issue_comment" and data.get("issue"):
+            comment = f"{item_id}/" if item_id else ""
+            paths.append(f"{base}issues/{data['issue']}/comments/{comment}")
+        elif item_id:
+            paths.append(f"{base}{EVENT_COLLECTIONS[event]}/{item_id}/")
+        else:
+            paths.append(f"{base}{EVENT_COLLECTIONS[event]}/")
+    return paths
+
+
+def _update_index(event: str, data: dict[str, Any], deleted: bool, project_ids: list[str]) -> None:
+    index = get_identifier_index()
+    item_id = data.get("id")
+    if event == "project":
+        if deleted and item_id:
+            index.forget_project(item_id)
+        elif data.get("identifier") and item_id:
+            index.add_project(data["identifier"], item_id)
+    elif event == "issue":
+        if deleted and item_id:
+            index.forget_issue(item_id)
+        elif item_id and data.get("sequence_id") is not None and len(project_ids) == 1:
+            index.add_issue(project_ids[0], data["sequence_id"], item_id)
+            project = data.get("project_detail")
+            if isinstance(project, dict) and project.get("identifier"):
+                index.add_project(project["identifier"], project_ids[0])
+
+
+def apply_event(payload: dict[str, Any]) -> list[str]:
+    """
+    Apply a Plane webhook event to the cache, mirror and identifier index.
+
+    Args:
+        payload: Decoded webhook body with event, action and data
+
+    Returns:
+        API paths treated as written; empty when the event is not one this server caches
+
+    Raises:
+        ValueError: If the payload is malformed
+    """
+    event = payload.get("event")
+    data = payload.get("data")
+    if not isinstance(event, str) or not isinstance(data, dict):
+        raise ValueError("Webhook payload needs 'event' and an object in 'data'")
+    if event not in EVENT_COLLECTIONS and event != "project":
+        return []
+    workspace_slug = get_workspace_slug()
+    if not workspace_slug:
+        return []
+
+    deleted = _is_delete(payload.get("action"))
+    project_ids = [] if event == "project" else _project_ids(event, data, deleted)
+    paths = event_paths(event, data, workspace_slug, project_ids)
+
+    mirror = get_mirror()
+    if mirror is not None and deleted and data.get("id") and event in ("issue", "cycle", "module"):
+        mirror.delete(EVENT_COLLECTIONS[event], data["id"])
+    _update_index(event, data, deleted, project_ids)
+
+    cache = get_response_cache()
+    shared = get_shared_state()
+    for path in paths:
+        if cache is not None:
+            cache.invalidate_for_write(path)
+        if mirror is not None:
+            mirror.invalidate_for_write(path)
+        if shared is not None:
+            shared.publish("", path)
+    return paths
+
+
+async def _read_body(request: Request) -> Optional[bytes]:
+    """Read a delivery's body, or None as soon as it is known to exceed MAX_BODY_BYTES."""
+    length = request.headers.get("content-length", "")
+    if length.isdigit() and int(length) > MAX_BODY_BYTES:
+        return None
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def handle_webhook(request: Request) -> JSONResponse:
+    """Starlette endpoint receiving Plane webhook deliveries."""
+    secret = webhook_secret()
+    # Deliveries are unauthenticated until verified, so never buffer more than the cap
+    body = await _read_body(request)
+    if body is None:
+        WEBHOOK_EVENTS.inc("unknown", "rejected")
+        return JSONResponse({"error": "Payload too large"}, status_code=413)
+    if secret is None or not verify_signature(secret, body, request.headers.get(SIGNATURE_HEADER)):
+        WEBHOOK_EVENTS.inc("unknown", "rejected")
+        return JSONResponse({"error": "Invalid signature"}, status_code=401)
+
+    try:
+        payload = serializer.loads(body)
+        if not isinstance(payload, dict):
+            raise ValueError("Webhook payload must be a JSON object")
+        paths = apply_event(payload)
+    except ValueError as e:
+        WEBHOOK_EVENTS.inc("unknown", "rejected")
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    event = payload["event"] if payload["event"] in EVENT_COLLECTIONS or payload["event"] == "project" else "other"
+    WEBHOOK_EVENTS.inc(event, "applied" if paths else "ignored")
+    return JSONResponse({"event": payload["event"], "invalidated": paths})
@@ -0,0 +1,442 @@
+"""Multi-process serving of the SSE/streamable-HTTP transports.
+
+Workers share one listening port, so the kernel spreads connections
+between them. MCP sessions are stateful: an SSE stream and the messages
+posted to it (or a streamable-HTTP session and its later requests) must
+be handled by the same worker. Each worker therefore also listens on its
+own Unix socket and records the sessions it owns in a SQLite file shared
+by all workers; a request for a session owned by another worker is
+forwarded to that worker's socket.
+
+The same file carries cache invalidations: a write made through one
+worker is published there and applied to the response caches of the
+others the next time they make a request. It also lists the workers'
+sockets, so a /metrics scrape handled by one worker collects the
+metrics of all of them.
+"""
+
+import asyncio
+import os
+import re
+import sqlite3
+import stat
+import sys
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import parse_qs
+
+import httpx
+
+from plane_mcp.common.metrics import REGISTRY, merge_expositions
+
+# Set by the worker factory; None in single-process mode
+_state: Optional["SharedState"] = None
+
+# Marks requests one worker forwarded to another, so they are never forwarded again
+FORWARDED_HEADER = "x-plane-mcp-forwarded"
+SESSION_HEADER = "mcp-session-id"
+
+_SSE_SESSION = re.compile(rb"session_id=([0-9a-f]{32})")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    socket TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS workers (
+    socket TEXT PRIMARY KEY,
+    started_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS invalidations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tenant TEXT NOT NULL,
+    path TEXT NOT NULL,
+    origin INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+def worker_count() -> int:
+    """Number of server processes (MCP_WORKERS, default 1)."""
+    return max(1, int(os.getenv("MCP_WORKERS", "1")))
+
+
+def state_dir() -> str:
+    """Directory of the shared SQLite file and worker sockets (MCP_WORKER_STATE_DIR)."""
+    default = os.path.join(tempfile.gettempdir(), f"plane-mcp-{os.getenv('MCP_PORT', '8000')}")
+    return os.getenv("MCP_WORKER_STATE_DIR", default)
+
+
+def prepare_state_dir(directory: str) -> str:
+    """
+    Create the state directory readable only by this user, or check an existing one.
+
+    The default location under the system temp directory is predictable, so
+    a directory created by someone else (or a symlink planted in its place)
+    is refused rather than used: workers open sockets there and the launcher
+    deletes files in it.
+
+    Raises:
+        RuntimeError: If the path is a symlink, is owned by another user, or is accessible to others
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if stat.S_ISLNK(info.st_mode) or not stat.S_ISDIR(info.st_mode):
+        raise RuntimeError(f"Worker state directory {directory} is not a directory (symlinks are refused)")
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        raise RuntimeError(f"Worker state directory {directory} is owned by another user; set MCP_WORKER_STATE_DIR")
+    if info.st_mode & 0o077:
+        raise RuntimeError(
+            f"Worker state directory {directory} is accessible to other users "
+            f"(mode {stat.S_IMODE(info.st_mode):o}); run chmod 700 on it or set MCP_WORKER_STATE_DIR"
+        )
+    return directory
+
+
+class SharedState:
+    """
+    SQLite file shared by the workers: live workers, session ownership and cache invalidations.
+
+    Args:
+        path: SQLite file
+        socket: Unix socket of this worker
+        poll_interval: Seconds between checks for invalidations from other workers
+    """
+
+    def __init__(self, path: str, socket: str, poll_interval: float = 0.5) -> None:
+        self.socket = socket
+        self.poll_interval = poll_interval
+        self._db = sqlite3.connect(path, isolation_level=None, timeout=5)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.execute(
+            "INSERT OR REPLACE INTO workers (socket, started_at) VALUES (?, ?)", (self.socket, time.time())
+        )
+        row = self._db.execute("SELECT COALESCE(MAX(id), 0) FROM invalidations").fetchone()
+        self._last_seen = row[0]
+        self._next_poll = 0.0
+
+    def close(self) -> None:
+        """Forget this worker and its sessions and close the database."""
+        self._db.execute("DELETE FROM sessions WHERE socket = ?", (self.socket,))
+        self._db.execute("DELETE FROM workers WHERE socket = ?", (self.socket,))
+        self._db.close()
+
+    def other_workers(self) -> list[str]:
+        """Sockets of the other live workers."""
+        rows = self._db.execute("SELECT socket FROM workers WHERE socket != ?", (self.socket,)).fetchall()
+        return [row[0] for row in rows]
+
+    # Sessions
+
+    def claim(self, session_id: str) -> None:
+        """Record that this worker owns a session."""
+        self._db.execute(
+            "INSERT OR REPLACE INTO sessions (session_id, socket, created_at) VALUES (?, ?, ?)",
+            (session_id, self.socket, time.time()),
+        )
+
+    def release(self, session_id: str, any_worker: bool = False) -> None:
+        """Forget a session of this worker (or of whichever worker owns it)."""
+        if any_worker:
+            self._db.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        else:
+            self._db.execute("DELETE FROM sessions WHERE session_id = ? AND socket = ?", (session_id, self.socket))
+
+    def owner(self, session_id: str) -> Optional[str]:
+        """Socket of the worker owning a session, if known."""
+        row = self._db.execute("SELECT socket FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        return row[0] if row else None
+
+    # Invalidations
+
+    def publish(self, tenant: str, path: str) -> None:
+        """Tell the other workers that a write to path happened for a tenant ('' is the default tenant)."""
+        self._db.execute(
+            "INSERT INTO invalidations (tenant, path, origin, created_at) VALUES (?, ?, ?, ?)",
+            (tenant, path, os.getpid(), time.time()),
+        )
+
+    def poll(self) -> list[tuple[str, str]]:
+        """
+        Invalidations published by other workers since the last poll.
+
+        Checks at most every poll_interval seconds and returns nothing in between.
+        """
+        now = time.monotonic()
+        if now < self._next_poll:
+            return []
+        self._next_poll = now + self.poll_interval
+        rows = self._db.execute(
+            "SELECT id, tenant, path, origin FROM invalidations WHERE id > ? ORDER BY id", (self._last_seen,)
+        ).fetchall()
+        if rows:
+            self._last_seen = rows[-1][0]
+        pid = os.getpid()
+        return [(tenant, path) for _, tenant, path, origin in rows if origin != pid]
+
+    def prune(self, max_age: float = 3600) -> None:
+        """Drop invalidations every worker has long since applied."""
+        self._db.execute("DELETE FROM invalidations WHERE created_at < ?", (time.time() - max_age,))
+
+
+def get_shared_state() -> Optional[SharedState]:
+    """Shared state of this worker, or None when not running with several workers."""
+    return _state
+
+
+async def render_metrics(headers: Any) -> str:
+    """
+    Prometheus exposition for a /metrics request.
+
+    In single-process mode this is the process's registry. With several
+    workers every series is labelled with the worker's PID and, unless the
+    request was forwarded by another worker, the metrics of the other
+    workers are fetched over their sockets and merged in; a worker that
+    does not answer is left out.
+
+    Args:
+        headers: Headers of the scrape request (its Authorization is passed on)
+    """
+    state = get_shared_state()
+    if state is None:
+        return REGISTRY.render()
+    own = REGISTRY.render(worker=str(os.getpid()))
+    if headers.get(FORWARDED_HEADER):
+        return own
+
+    forwarded = {FORWARDED_HEADER: "1"}
+    if headers.get("authorization"):
+        forwarded["authorization"] = headers["authorization"]
+
+    async def scrape(socket: str) -> str:
+        try:
+            async with httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(uds=socket), timeout=5.0) as client:
+                response = await client.get("http://worker/metrics", headers=forwarded)
+                response.raise_for_status()
+                return response.text
+        except httpx.HTTPError:
+            return ""
+
+    others = await asyncio.gather(*(scrape(socket) for socket in state.other_workers()))
+    return merge_expositions([own, *others])
+
+
+def _session_id(scope: Scope) -> Optional[str]:
+    """Session a request belongs to (SSE message posts and streamable-HTTP follow-ups)."""
+    for name, value in scope.get("headers", []):
+        if name == SESSION_HEADER.encode():
+            return value.decode()
+    values = parse_qs(scope.get("query_string", b"").decode()).get("session_id")
+    return values[0] if values else None
+
+
+class SessionAffinity:
+    """
+    ASGI middleware routing each request to the worker that owns its session.
+
+    New sessions are claimed by the worker that opened them: for SSE the
+    session ID is read from the endpoint event at the start of the stream,
+    for streamable HTTP from the mcp-session-id response header. Requests
+    for sessions owned by another worker are proxied to its Unix socket,
+    streaming the response back. The worker's socket server is started
+    and stopped with the app's lifespan.
+
+    Args:
+        app: The worker's MCP Starlette app
+        state: Shared state of this worker
+    """
+
+    def __init__(self, app: Any, state: SharedState) -> None:
+        self.app = app
+        self.state = state
+        self._socket_server: Any = None
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(scope, receive, send)
+            return
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        session_id = _session_id(scope)
+        if session_id is not None and not self._forwarded(scope):
+            owner = self.state.owner(session_id)
+            if owner is not None and owner != self.state.socket:
+                await self._forward(owner, scope, receive, send)
+                if scope["method"] == "DELETE":
+                    self.state.release(session_id, any_worker=True)
+                return
+
+        streams: list[str] = []
+        try:
+            await self.app(scope, receive, self._claiming_send(send, streams))
+        finally:
+            # An SSE session lives as long as its stream; a streamable-HTTP one until it is deleted
+            for stream_session in streams:
+                self.state.release(stream_session)
+            if scope["method"] == "DELETE" and session_id is not None:
+                self.state.release(session_id)
+
+    @staticmethod
+    def _forwarded(scope: Scope) -> bool:
+        return any(name == FORWARDED_HEADER.encode() for name, _ in scope.get("headers", []))
+
+    def _claiming_send(self, send: Send, streams: list[str]) -> Send:
+        """Wrap send to claim the session a response opens; SSE sessions are added to streams."""
+        is_stream = False
+
+        async def wrapped(message: dict[str, Any]) -> None:
+            nonlocal is_stream
+            if message["type"] == "http.response.start":
+                for name, value in message.get("headers", []):
+                    if name.lower() == SESSION_HEADER.encode():
+                        self.state.claim(value.decode())
+                    elif name.lower() == b"content-type" and value.startswith(b"text/event-stream"):
+                        is_stream = True
+            elif message["type"] == "http.response.body" and is_stream and not streams:
+                # The endpoint event announcing the SSE session's message URL
+                if match := _SSE_SESSION.search(message.get("body", b"")):
+                    streams.append(match.group(1).decode())
+                    self.state.claim(streams[0])
+            await send(message)
+
+        return wrapped
+
+    async def _forward(self, socket: str, scope: Scope, receive: Receive, send: Send) -> None:
+        """Proxy a request to the worker listening on socket, streaming both ways."""
+        client = self._clients.get(socket)
+        if client is None:
+            client = self._clients[socket] = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=socket), timeout=None
+            )
+
+        async def body() -> Any:
+            while True:
+                message = await receive()
+                yield message.get("body", b"")
+                if not message.get("more_body", False):
+                    return
+
+        headers = [(name, value) for name, value in scope["headers"] if name.lower() != b"host"]
+        headers.append((FORWARDED_HEADER.encode(), b"1"))
+        query = scope.get("query_string", b"")
+        url = f"http://worker{scope['path']}" + (f"?{query.decode()}" if query else "")
+        try:
+            request = client.build_request(scope["method"], url, headers=headers, content=body())
+            response = await client.send(request, stream=True)
+        except httpx.TransportError:
+            # The owner is gone (worker restarted); nothing can serve this session
+            await send({"type": "http.response.start", "status": 404, "headers": []})
+            await send({"type": "http.response.body", "body": b"Session not found"})
+            return
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [(name.lower(), value) for name, value in response.headers.raw],
+            })
+            async for chunk in response.aiter_raw():
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            await response.aclose()
+
+    async def _lifespan(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the app's lifespan, starting this worker's socket server with it."""
+
+        async def wrapped_receive() -> dict[str, Any]:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self._start_socket_server()
+            elif message["type"] == "lifespan.shutdown":
+                await self._stop_socket_server()
+            return message
+
+        await self.app(scope, wrapped_receive, send)
+
+    async def _start_socket_server(self) -> None:
+        import uvicorn
+
+        if os.path.exists(self.state.socket):
+            os.remove(self.state.socket)
+        config = uvicorn.Config(self.app, uds=self.state.socket, lifespan="off", log_config=None)
+        config.load()
+        # Started without serve(), which would take over the process's signal handlers
+        self._socket_server = uvicorn.Server(config)
+        self._socket_server.lifespan = config.lifespan_class(config)
+        await self._socket_server.startup()
+        self.state.prune()
+
+    async def _stop_socket_server(self) -> None:
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+        if self._socket_server is not None:
+            server, self._socket_server = self._socket_server, None
+            server.should_exit = True
+            await server.shutdown()
+        self.state.close()
+        if os.path.exists(self.state.socket):
+            os.remove(self.state.socket)
+
+
+def create_worker_app() -> Any:
+    """
+    Uvicorn app factory for one worker process.
+
+    Builds the MCP server, its SSE or streamable-HTTP app (MCP_TRANSPORT) and
+    wraps it for session affinity between workers.
+    """
+    global _state
+    from plane_mcp.server import create_server
+
+    directory = prepare_state_dir(state_dir())
+    _state = SharedState(
+        os.path.join(directory, "shared.db"),
+        os.path.join(directory, f"worker-{os.getpid()}.sock"),
+        poll_interval=float(os.getenv("MCP_INVALIDATION_POLL_INTERVAL", "0.5")),
+    )
+    server = create_server()
+    transport = os.getenv("MCP_TRANSPORT", "sse")
+    app = server.sse_app() if transport == "sse" else server.streamable_http_app()
+    return SessionAffinity(app, _state)
+
+
+def run_workers(transport: str, host: str, port: int, workers: int) -> None:
+    """
+    Serve the SSE or streamable-HTTP transport from several worker processes on one port.
+
+    Args:
+        transport: 'sse' or 'streamable-http'
+        host: Address to listen on
+        port: Port to listen on
+        workers: Number of worker processes
+    """
+    import uvicorn
+
+    directory = prepare_state_dir(state_dir())
+    # Sessions from a previous run cannot be resumed
+    for name in os.listdir(directory):
+        if name.startswith("shared.db") or name.endswith(".sock"):
+            os.remove(os.path.join(directory, name))
+    os.environ.update({"MCP_TRANSPORT": transport, "MCP_WORKERS": str(workers), "MCP_WORKER_STATE_DIR": directory})
+    print(f"Starting {workers} workers (shared state in {directory})", file=sys.stderr)
+    uvicorn.run(
+        "plane_mcp.common.workers:create_worker_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        log_level="info",
+    )
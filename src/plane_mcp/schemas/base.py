@@ -4,29 +4,18 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
-
-
-def _serialize_datetime(v: datetime) -> str:
-    """Serialize datetime to ISO format."""
-    return v.isoformat()
-
-
-def _serialize_uuid(v: UUID) -> str:
-    """Serialize UUID to string."""
-    return str(v)
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PlaneBaseModel(BaseModel):
-    """Base model for all Plane entities."""
+    """
+    Base model for all Plane entities.
+
+    Fields Plane sends that a model does not declare are ignored; datetimes
+    and UUIDs serialize to ISO strings in JSON mode.
+    """
 
-    class Config:
-        """Pydantic configuration."""
-        populate_by_name = True
-        json_encoders = {
-            datetime: _serialize_datetime,
-            UUID: _serialize_uuid,
-        }
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
 
 class TimestampedModel(PlaneBaseModel):
@@ -58,7 +47,7 @@ class ProjectOwnedModel(WorkspaceOwnedModel):
 class SoftDeletableModel(PlaneBaseModel):
     """Model that supports soft deletion."""
 
-    deleted_at: datetime = Field(description="Timestamp when entity was deleted (soft delete)")
+    deleted_at: Optional[datetime] = Field(None, description="Timestamp when entity was deleted (soft delete)")
 
 
 class ArchivableModel(PlaneBaseModel):
@@ -18,7 +18,7 @@ class Issue(FullAuditModel):
     Attributes:
         name: Issue title/name (max 255 characters)
         description_html: HTML-formatted description
-        description_binary: Binary representation of description
+        description_stripped: Plain-text description
         sequence_id: Sequential number within project
         project: UUID of parent project (required)
         state: UUID of current state (e.g., "To Do", "In Progress")
@@ -33,11 +33,15 @@ class Issue(FullAuditModel):
         completed_at: Actual completion timestamp
         is_draft: Whether this is a draft issue
         type_id: UUID of issue type (bug, feature, etc.)
+        state_detail: Expanded state, when requested
+
+    The editor's binary description (description_binary) is deliberately
+    not declared, so decoding drops it.
     """
 
     name: str = Field(max_length=255, description="Issue title")
     description_html: Optional[str] = Field(None, description="HTML description")
-    description_binary: str = Field(description="Binary description representation")
+    description_stripped: Optional[str] = Field(None, description="Plain-text description")
     sequence_id: Optional[int] = Field(None, description="Sequential ID within project")
 
     project: UUID = Field(description="UUID of parent project")
@@ -57,6 +61,7 @@ class Issue(FullAuditModel):
 
     is_draft: Optional[bool] = Field(None, description="Draft status")
     type_id: Optional[UUID] = Field(None, description="UUID of issue type")
+    state_detail: Optional[Any] = Field(None, description="Expanded state")
 
 
 class IssueType(FullAuditModel):
@@ -1,68 +1,211 @@
 """Main MCP server implementation with FastMCP."""
 
+import hmac
+import ipaddress
 import os
 import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
 
-from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
+from plane_mcp.common.http_client import http_client_lifespan
+from plane_mcp.common.metrics import TOOL_CALLS, TOOL_DURATION, TOOLS_IN_FLIGHT
+from plane_mcp.common.request_helper import PlaneAPIError
+from plane_mcp.common.tenant import Tenant, multi_tenant_enabled, tenant_from_headers, use_tenant
+from plane_mcp.common.workers import render_metrics, run_workers, worker_count
 from plane_mcp.common.version import get_version
-from plane_mcp.tools.cycle_issues import register_cycle_issue_tools
-from plane_mcp.tools.cycles import register_cycle_tools
-from plane_mcp.tools.issues import register_issue_tools
-from plane_mcp.tools.metadata import register_metadata_tools
-from plane_mcp.tools.module_issues import register_module_issue_tools
-from plane_mcp.tools.modules import register_module_tools
-from plane_mcp.tools.projects import register_project_tools
-from plane_mcp.tools.user import register_user_tools
-from plane_mcp.tools.worklogs import register_worklog_tools
-
-# Load environment variables
-load_dotenv()
-
-# Validate required environment variables
-required_vars = ["PLANE_API_KEY", "PLANE_WORKSPACE_SLUG"]
-missing_vars = [var for var in required_vars if not os.getenv(var)]
-
-if missing_vars:
-    print(f"ERROR: Missing required environment variables: {', '.join(missing_vars)}", file=sys.stderr)
-    sys.exit(1)
-
-# Get configuration
-version = get_version()
-host = os.getenv("MCP_HOST", "0.0.0.0")
-port = int(os.getenv("MCP_PORT", "8000"))
-transport = os.getenv("MCP_TRANSPORT", "stdio")
-
-# Create FastMCP server
-mcp = FastMCP(
-    name="plane-mcp-server",
-    instructions=f"Plane MCP Server v{version} - Integration with Plane project management platform",
-    host=host,
-    port=port,
-)
-
-# Register all tools
-register_metadata_tools(mcp)
-register_user_tools(mcp)
-register_project_tools(mcp)
-register_issue_tools(mcp)
-register_module_tools(mcp)
-register_module_issue_tools(mcp)
-register_cycle_tools(mcp)
-register_cycle_issue_tools(mcp)
-register_worklog_tools(mcp)
+from plane_mcp.tools import parse_toolsets, register_toolsets
+
+REQUIRED_VARS = ["PLANE_API_KEY", "PLANE_WORKSPACE_SLUG"]
+
+
+class InstrumentedFastMCP(FastMCP):
+    """
+    FastMCP server that records per-tool call counts and latency.
+
+    With MCP_MULTI_TENANT enabled, each call runs with the Plane credentials
+    from the headers of the HTTP request that carried it; a request without
+    them is rejected unless MCP_ALLOW_DEFAULT_TENANT lets it use the
+    environment's credentials.
+    """
+
+    def _request_tenant(self) -> Optional[Tenant]:
+        if not multi_tenant_enabled():
+            return None
+        try:
+            request = self._mcp_server.request_context.request
+        except LookupError:
+            return None
+        # stdio sessions have no HTTP request
+        if request is None or not hasattr(request, "headers"):
+            return None
+        try:
+            return tenant_from_headers(request.headers)
+        except ValueError as e:
+            raise PlaneAPIError(str(e)) from e
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        # Keep label cardinality bounded when clients send arbitrary names
+        tool = name if self._tool_manager.get_tool(name) else "unknown"
+        TOOLS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        status = "error"
+        try:
+            with use_tenant(self._request_tenant()):
+                result = await super().call_tool(name, arguments)
+            status = "ok"
+            return result
+        finally:
+            TOOL_DURATION.observe(time.perf_counter() - start, tool)
+            TOOL_CALLS.inc(tool, status)
+            TOOLS_IN_FLIGHT.dec()
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Open the shared HTTP client, then start the mirror sync that uses it."""
+    # Imported here so the sync code loads only when a server starts; the mirror
+    # module itself (and sqlite3) is already imported by request_helper
+    from plane_mcp.common.mirror_sync import mirror_lifespan
+
+    async with http_client_lifespan(server), mirror_lifespan(server):
+        yield {}
+
+
+def load_environment() -> None:
+    """Load .env and exit with an error if required variables are missing."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    if multi_tenant_enabled():
+        # Credentials may come with each request instead
+        return
+    missing_vars = [var for var in REQUIRED_VARS if not os.getenv(var)]
+    if missing_vars:
+        print(f"ERROR: Missing required environment variables: {', '.join(missing_vars)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def metrics_allowed(headers: Any, client_host: Optional[str]) -> bool:
+    """
+    Whether a /metrics request may be served.
+
+    With MCP_METRICS_TOKEN set it must carry 'Authorization: Bearer <token>';
+    otherwise only local scrapes are served: loopback clients, and other
+    workers over their Unix sockets (which have no client address).
+    """
+    token = os.getenv("MCP_METRICS_TOKEN")
+    if token:
+        return hmac.compare_digest(headers.get("authorization", "").encode(), f"Bearer {token}".encode())
+    if client_host is None:
+        return True
+    try:
+        return ipaddress.ip_address(client_host).is_loopback
+    except ValueError:
+        return False
+
+
+def create_server(toolsets: Optional[list[str]] = None) -> InstrumentedFastMCP:
+    """
+    Create the MCP server with the selected tool groups registered.
+
+    Args:
+        toolsets: Toolset names (see plane_mcp.tools.TOOLSETS); defaults to MCP_TOOLSETS, or every toolset except export
+
+    Environment variables:
+        MCP_TOOLSETS: Comma-separated toolsets to register (default all except export)
+        MCP_HOST / MCP_PORT: Address for the SSE/HTTP transports
+        MCP_METRICS_ENABLED: Serve Prometheus metrics on /metrics (default false)
+        MCP_METRICS_TOKEN: Bearer token required on /metrics (unset: loopback clients only)
+        PLANE_WEBHOOK_SECRET: Receive Plane webhooks on /webhooks/plane (unset disables it)
+    """
+    if toolsets is None:
+        toolsets = parse_toolsets(os.getenv("MCP_TOOLSETS"))
+    server = InstrumentedFastMCP(
+        name="plane-mcp-server",
+        instructions=f"Plane MCP Server v{get_version()} - Integration with Plane project management platform",
+        host=os.getenv("MCP_HOST", "0.0.0.0"),
+        port=int(os.getenv("MCP_PORT", "8000")),
+        lifespan=lifespan,
+    )
+    # continue_result is needed whenever another tool's output may be cut
+    register_toolsets(server, list(dict.fromkeys([*toolsets, "results"])))
+
+    if os.getenv("MCP_METRICS_ENABLED", "false").lower() in ("1", "true", "yes"):
+        from starlette.requests import Request
+        from starlette.responses import PlainTextResponse
+
+        @server.custom_route("/metrics", methods=["GET"])
+        async def metrics(request: Request) -> PlainTextResponse:
+            """Prometheus scrape endpoint (SSE/HTTP transports only)."""
+            if not metrics_allowed(request.headers, request.client.host if request.client else None):
+                return PlainTextResponse("Forbidden", status_code=403)
+            return PlainTextResponse(await render_metrics(request.headers), media_type="text/plain; version=0.0.4")
+
+    if os.getenv("PLANE_WEBHOOK_SECRET"):
+        # Imported here: only needed when webhooks are enabled
+        from plane_mcp.common.webhooks import WEBHOOK_PATH, handle_webhook
+
+        server.custom_route(WEBHOOK_PATH, methods=["POST"])(handle_webhook)
+
+    return server
+
+
+_server: Optional[InstrumentedFastMCP] = None
+
+
+def get_server() -> InstrumentedFastMCP:
+    """Get the process-wide server, loading the environment and creating it on first use."""
+    global _server
+    if _server is None:
+        load_environment()
+        _server = create_server()
+    return _server
+
+
+def __getattr__(name: str) -> Any:
+    # `from plane_mcp.server import mcp` (and `mcp run`) still work, but the
+    # server is only built when asked for rather than at import time.
+    if name == "mcp":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
-    """Main entry point for the server."""
-    print(f"Starting Plane MCP Server v{version}", file=sys.stderr)
+    """Main entry point for the server (or the export command: plane-mcp export <path>)."""
+    if sys.argv[1:2] == ["export"]:
+        from plane_mcp.common.export import export_main
+
+        load_environment()
+        export_main(sys.argv[2:])
+        return
+
+    load_environment()
+    try:
+        toolsets = parse_toolsets(os.getenv("MCP_TOOLSETS"))
+    except ValueError as e:
+        print(f"ERROR: MCP_TOOLSETS: {e}", file=sys.stderr)
+        sys.exit(1)
+    transport = os.getenv("MCP_TRANSPORT", "stdio")
+    host = os.getenv("MCP_HOST", "0.0.0.0")
+    port = int(os.getenv("MCP_PORT", "8000"))
+    workers = worker_count()
+    if workers > 1 and transport not in ("sse", "streamable-http"):
+        print(f"WARNING: MCP_WORKERS is ignored for the {transport} transport", file=sys.stderr)
+        workers = 1
+
+    print(f"Starting Plane MCP Server v{get_version()}", file=sys.stderr)
     print(f"Server listening on {host}:{port} (transport: {transport})", file=sys.stderr)
-    print("Registered tools: metadata, user, projects, issues, modules, module-issues, cycles, cycle-issues, worklogs", file=sys.stderr)
+    print(f"Registered tools: {', '.join(toolsets)}", file=sys.stderr)
 
     try:
         # Run the server with configured transport (blocks until stopped)
-        mcp.run(transport=transport)
+        if workers > 1:
+            run_workers(transport, host, port, workers)
+        else:
+            create_server(toolsets).run(transport=transport)
     except KeyboardInterrupt:
         print("\nShutting down Plane MCP Server...", file=sys.stderr)
     except Exception as e:
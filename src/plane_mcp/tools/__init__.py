@@ -1 +1,56 @@
 """Tools registration."""
+
+import importlib
+from typing import Optional
+
+from mcp.server.fastmcp import FastMCP
+
+# Tool groups selectable with MCP_TOOLSETS: name -> (module, register function).
+# Modules are only imported when their group is registered.
+TOOLSETS: dict[str, tuple[str, str]] = {
+    "metadata": ("plane_mcp.tools.metadata", "register_metadata_tools"),
+    "user": ("plane_mcp.tools.user", "register_user_tools"),
+    "projects": ("plane_mcp.tools.projects", "register_project_tools"),
+    "issues": ("plane_mcp.tools.issues", "register_issue_tools"),
+    "modules": ("plane_mcp.tools.modules", "register_module_tools"),
+    "module-issues": ("plane_mcp.tools.module_issues", "register_module_issue_tools"),
+    "cycles": ("plane_mcp.tools.cycles", "register_cycle_tools"),
+    "cycle-issues": ("plane_mcp.tools.cycle_issues", "register_cycle_issue_tools"),
+    "worklogs": ("plane_mcp.tools.worklogs", "register_worklog_tools"),
+    "mirror": ("plane_mcp.tools.mirror", "register_mirror_tools"),
+    "export": ("plane_mcp.tools.export", "register_export_tools"),
+    "results": ("plane_mcp.tools.results", "register_result_tools"),
+}
+
+# Toolsets only registered when named in MCP_TOOLSETS (or with 'all')
+OPT_IN_TOOLSETS = frozenset({"export"})
+
+
+def parse_toolsets(value: Optional[str]) -> list[str]:
+    """
+    Parse an MCP_TOOLSETS value into toolset names.
+
+    Args:
+        value: Comma-separated names ('module_issues' and 'module-issues' are
+            equivalent); empty selects every toolset except OPT_IN_TOOLSETS,
+            'all' selects every toolset
+
+    Raises:
+        ValueError: If a name is not a known toolset
+    """
+    names = [name.strip().lower().replace("_", "-") for name in (value or "").split(",") if name.strip()]
+    if not names:
+        return [name for name in TOOLSETS if name not in OPT_IN_TOOLSETS]
+    if "all" in names:
+        return list(TOOLSETS)
+    unknown = [name for name in names if name not in TOOLSETS]
+    if unknown:
+        raise ValueError(f"Unknown toolsets: {', '.join(unknown)} (available: {', '.join(TOOLSETS)})")
+    return list(dict.fromkeys(names))
+
+
+def register_toolsets(mcp: FastMCP, names: list[str]) -> None:
+    """Import and register the given toolsets."""
+    for name in names:
+        module_name, function_name = TOOLSETS[name]
+        getattr(importlib.import_module(module_name), function_name)(mcp)
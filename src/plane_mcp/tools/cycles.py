@@ -1,47 +1,99 @@
 """Cycle tools for Plane API."""
 
-import json
-import os
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
+from plane_mcp.common.analytics import scope_analytics
+from plane_mcp.common.identifiers import resolve_project_id
+from plane_mcp.common.projection import format_response
 from plane_mcp.common.request_helper import make_plane_request
+from plane_mcp.common.tenant import get_workspace_slug
 
 
 def register_cycle_tools(mcp: FastMCP) -> None:
     """Register cycle-related tools."""
 
     @mcp.tool()
-    async def list_cycles(project_id: str) -> str:
+    async def list_cycles(
+        project_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
         """
         Get all cycles for a specific project.
 
         Args:
             project_id: The UUID identifier of the project
+            fields: Optional list of fields to return for each cycle, e.g. ['name', 'start_date', 'end_date']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
-            f"workspaces/{workspace_slug}/projects/{project_id}/cycles/"
+            f"workspaces/{workspace_slug}/projects/{project_id}/cycles/",
+            max_staleness=max_staleness,
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
 
     @mcp.tool()
-    async def get_cycle(project_id: str, cycle_id: str) -> str:
+    async def cycle_analytics(
+        project_id: str,
+        cycle_id: str,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
+        """
+        Progress of a cycle: completion, scope change, burndown, velocity and per-assignee load.
+
+        Member issues are joined with the project's state groups and the
+        figures are computed on the server. Burndown runs from start_date to
+        end_date (or today), with an ideal line; velocity counts completed
+        issues and points per ISO week. Results are reused until the cycle's
+        issues or their states change.
+
+        Args:
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project containing the cycle
+            cycle_id: The UUID identifier of the cycle
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
+        """
+        workspace_slug = get_workspace_slug()
+        project_id = await resolve_project_id(project_id)
+        result = await scope_analytics(workspace_slug, project_id, "cycles", cycle_id, max_staleness)
+        return format_response(result, pretty=pretty)
+
+    @mcp.tool()
+    async def get_cycle(
+        project_id: str,
+        cycle_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
         """
         Get details of a specific cycle.
 
         Args:
             project_id: The UUID identifier of the project
             cycle_id: The UUID identifier of the cycle
+            fields: Optional list of fields to return, e.g. ['name', 'start_date', 'end_date']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
-            f"workspaces/{workspace_slug}/projects/{project_id}/cycles/{cycle_id}/"
+            f"workspaces/{workspace_slug}/projects/{project_id}/cycles/{cycle_id}/",
+            max_staleness=max_staleness,
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
 
     @mcp.tool()
     async def create_cycle(
@@ -61,7 +113,7 @@ def register_cycle_tools(mcp: FastMCP) -> None:
             start_date: Optional start date (YYYY-MM-DD)
             end_date: Optional end date (YYYY-MM-DD)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         body: dict = {"name": name}
 
         if description:
@@ -76,7 +128,7 @@ def register_cycle_tools(mcp: FastMCP) -> None:
             f"workspaces/{workspace_slug}/projects/{project_id}/cycles/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def update_cycle(
@@ -98,7 +150,7 @@ def register_cycle_tools(mcp: FastMCP) -> None:
             start_date: Updated start date (YYYY-MM-DD)
             end_date: Updated end date (YYYY-MM-DD)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         body: dict = {}
 
         if name:
@@ -115,7 +167,7 @@ def register_cycle_tools(mcp: FastMCP) -> None:
             f"workspaces/{workspace_slug}/projects/{project_id}/cycles/{cycle_id}/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def delete_cycle(project_id: str, cycle_id: str) -> str:
@@ -126,7 +178,7 @@ def register_cycle_tools(mcp: FastMCP) -> None:
             project_id: The UUID identifier of the project
             cycle_id: The UUID identifier of the cycle
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         await make_plane_request(
             "DELETE",
             f"workspaces/{workspace_slug}/projects/{project_id}/cycles/{cycle_id}/"
@@ -143,10 +195,10 @@ def register_cycle_tools(mcp: FastMCP) -> None:
             cycle_id: The UUID identifier of the source cycle
             new_cycle_id: The UUID identifier of the target cycle
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "POST",
             f"workspaces/{workspace_slug}/projects/{project_id}/cycles/{cycle_id}/transfer-issues/",
             body={"new_cycle_id": new_cycle_id}
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
@@ -0,0 +1,38 @@
+"""Workspace export tools."""
+
+from typing import Optional
+
+from mcp.server.fastmcp import FastMCP
+
+from plane_mcp.common.export import export_target, export_workspace
+from plane_mcp.common.projection import format_response
+
+
+def register_export_tools(mcp: FastMCP) -> None:
+    """Register workspace export tools."""
+
+    @mcp.tool()
+    async def export_snapshot(
+        path: str,
+        projects: Optional[list[str]] = None,
+        gzip: Optional[bool] = None,
+        resume: bool = True,
+        concurrency: Optional[int] = None,
+    ) -> str:
+        """
+        Export projects, cycles, modules, issues, comments and worklogs to an NDJSON file on the server.
+
+        The file is written as it is read, one JSON record per line
+        ({"type", "project_id", "data"}). If an export is interrupted, calling
+        this again with the same path resumes from its checkpoint. Files are
+        written inside the server's export directory (PLANE_EXPORT_DIR).
+
+        Args:
+            path: Output file relative to the export directory, e.g. 'snapshot.ndjson.gz' (gzip-compressed if it ends with '.gz')
+            projects: Optional list of project UUIDs or identifiers (e.g. 'PROFI'); defaults to all projects
+            gzip: Force compression on or off regardless of the file name
+            resume: Continue an interrupted export of the same path instead of starting over
+            concurrency: Parallel comment/worklog requests (default PLANE_BULK_CONCURRENCY)
+        """
+        result = await export_workspace(export_target(path), projects, gzip, resume, concurrency)
+        return format_response(result)
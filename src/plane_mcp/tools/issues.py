@@ -1,72 +1,484 @@
 """Issue tools for Plane API."""
 
-import json
-import os
-from typing import Optional
+import asyncio
+from contextlib import aclosing
+from typing import Awaitable, Callable, Optional, Union
 
+import httpx
 from mcp.server.fastmcp import FastMCP
 
-from plane_mcp.common.request_helper import make_plane_request
+from plane_mcp.common.concurrency import bulk_concurrency, map_bounded
+from plane_mcp.common.continuation import tokens_to_bytes
+from plane_mcp.common.filters import matches, needs_states, parse_conditions, pushdown_params, resolve_state_conditions
+from plane_mcp.common.identifiers import fetch_issue, indexed_issue_id, resolve_issue, resolve_project_id
+from plane_mcp.common.mirror import default_max_staleness, get_mirror
+from plane_mcp.common.projection import ISSUE_SUMMARY, format_response, project_item, source_keys
+from plane_mcp.common.reports import issue_context
+from plane_mcp.common.request_helper import PlaneAPIError, make_plane_request, paginate
+from plane_mcp.common.tenant import get_workspace_slug
+
+CREATE_FIELDS = ("name", "description", "state_id", "priority", "assignees", "labels")
+UPDATE_FIELDS = ("name", "description", "state", "priority", "assignees", "labels")
+
+# Most issues get_issues_batch fetches in one call
+MAX_BATCH_ISSUES = 100
+
+
+def _create_issue_body(
+    name: str,
+    description: Optional[str] = None,
+    state_id: Optional[str] = None,
+    priority: Optional[str] = None,
+    assignees: Optional[list[str]] = None,
+    labels: Optional[list[str]] = None,
+) -> dict:
+    """Build the request body for issue creation."""
+    body: dict = {"name": name}
+
+    if description:
+        body["description_html"] = description
+    if state_id:
+        body["state"] = state_id
+    if priority:
+        body["priority"] = priority
+    if assignees:
+        body["assignees"] = assignees
+    if labels:
+        body["labels"] = labels
+    return body
+
+
+def _update_issue_body(
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    state: Optional[str] = None,
+    priority: Optional[str] = None,
+    assignees: Optional[list[str]] = None,
+    labels: Optional[list[str]] = None,
+) -> dict:
+    """Build the request body for issue update."""
+    body: dict = {}
+
+    if name:
+        body["name"] = name
+    if description:
+        body["description_html"] = description
+    if state:
+        body["state"] = state
+    if priority:
+        body["priority"] = priority
+    if assignees is not None:
+        body["assignees"] = assignees
+    if labels is not None:
+        body["labels"] = labels
+    return body
+
+
+def _is_retryable(error: BaseException, method: str) -> bool:
+    """
+    Whether a failed item may succeed on retry.
+
+    Updates are retried on network errors, 429 and 5xx. Creates are not
+    idempotent: after a 5xx or a read timeout Plane may already have created
+    the issue, so they are only retried on 429 and on errors raised before
+    the request reached Plane (failing to connect).
+    """
+    if not isinstance(error, PlaneAPIError):
+        return False
+    if error.status_code == 429:
+        return True
+    if method == "POST":
+        return error.status_code is None and isinstance(error.__cause__, (httpx.ConnectError, httpx.ConnectTimeout))
+    if error.status_code is None:
+        return isinstance(error.__cause__, httpx.TransportError)
+    return error.status_code >= 500
+
+
+async def _run_bulk(
+    requests: list[tuple[str, Union[str, Callable[[], Awaitable[str]]], dict]],
+    concurrency: int,
+    retries: int,
+) -> dict:
+    """
+    Send (method, path, body) requests concurrently and retry retryable failures.
+
+    The path may be a coroutine function resolving it (e.g. from a readable
+    issue ID), run as part of the item, so an item that cannot be resolved
+    fails on its own instead of failing the whole call.
+
+    Items that succeeded are never resubmitted; each retry round only sends
+    the items that failed with a retryable error in the previous round.
+    """
+    outcomes: dict[int, object] = {}
+    pending = list(range(len(requests)))
+
+    async def send(index: int) -> object:
+        method, path, body = requests[index]
+        if callable(path):
+            path = await path()
+        return await make_plane_request(method, path, body=body)
+
+    for attempt in range(retries + 1):
+        if attempt:
+            await asyncio.sleep(min(2 ** (attempt - 1), 10))
+
+        results = await map_bounded(send, pending, concurrency)
+        for index, result in zip(pending, results):
+            outcomes[index] = result
+        pending = [
+            index for index, result in zip(pending, results)
+            if isinstance(result, BaseException) and _is_retryable(result, requests[index][0])
+        ]
+        if not pending:
+            break
+
+    items = []
+    for index in range(len(requests)):
+        result = outcomes[index]
+        if isinstance(result, BaseException):
+            items.append({"index": index, "ok": False, "error": str(result)})
+        else:
+            response = result if isinstance(result, dict) else {}
+            items.append({
+                "index": index,
+                "ok": True,
+                "id": response.get("id"),
+                "sequence_id": response.get("sequence_id"),
+            })
+
+    succeeded = sum(1 for item in items if item["ok"])
+    return {
+        "total": len(items),
+        "succeeded": succeeded,
+        "failed": len(items) - succeeded,
+        "results": items,
+    }
 
 
 def register_issue_tools(mcp: FastMCP) -> None:
     """Register issue-related tools."""
 
     @mcp.tool()
-    async def list_project_issues(project_id: str) -> str:
+    async def list_project_issues(
+        project_id: str,
+        per_page: int = 100,
+        max_items: Optional[int] = 1000,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+    ) -> str:
         """
         Get all issues for a specific project.
 
+        Follows Plane's pagination until all issues are fetched or max_items is
+        reached. When more issues remain, next_cursor can be passed back as
+        cursor to continue from where the previous call stopped.
+
         Args:
-            project_id: The UUID identifier of the project to get issues for
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project to get issues for
+            per_page: Number of issues per page requested from Plane (1-100)
+            max_items: Stop after this many issues (checked at page boundaries), None for no limit
+            cursor: Optional cursor from a previous call's next_cursor to resume from
+            fields: Optional list of fields to return for each issue instead of the default summary
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
+            max_output_tokens: Approximate output limit in tokens; the rest of a longer result is returned by continue_result (default MCP_OUTPUT_BUDGET)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
-        response = await make_plane_request(
-            "GET",
-            f"workspaces/{workspace_slug}/projects/{project_id}/issues/"
+        workspace_slug = get_workspace_slug()
+        project_id = await resolve_project_id(project_id)
+        issues: list[dict] = []
+        total_count = None
+        next_cursor = None
+
+        # Issues are projected as each page is parsed, so unneeded fields are never built.
+        # Closing the pages on break cancels the prefetch of the next one.
+        pages = paginate(
+            f"workspaces/{workspace_slug}/projects/{project_id}/issues/",
+            per_page=per_page,
+            cursor=cursor,
+            max_staleness=max_staleness,
+            item=lambda issue: project_item(issue, fields, compact, summary=ISSUE_SUMMARY),
+            keys=source_keys(fields, ISSUE_SUMMARY),
         )
+        async with aclosing(pages):
+            async for page in pages:
+                issues.extend(page["results"])
+                total_count = page.get("total_count", total_count)
+                next_cursor = page.get("next_cursor") if page.get("next_page_results") else None
+                if max_items is not None and len(issues) >= max_items:
+                    break
 
-        # Simplify response
-        if isinstance(response, dict) and "results" in response:
-            issues = [
-                {
-                    "id": issue.get("id"),
-                    "name": issue.get("name"),
-                    "sequence_id": issue.get("sequence_id"),
-                    "state": issue.get("state_detail") or issue.get("state"),
-                    "priority": issue.get("priority_detail") or issue.get("priority"),
-                    "created_at": issue.get("created_at"),
-                    "updated_at": issue.get("updated_at"),
-                }
-                for issue in response["results"]
-            ]
-            result = {
-                "total_count": response.get("total_count"),
-                "count": response.get("count"),
-                "results": issues,
-            }
-            return json.dumps(result, indent=2)
+        result = {
+            "total_count": total_count,
+            "count": len(issues),
+            "next_cursor": next_cursor,
+            "results": issues,
+        }
+        return format_response(result, pretty=pretty, max_bytes=tokens_to_bytes(max_output_tokens))
+
+    @mcp.tool()
+    async def search_issues(
+        project_id: str,
+        filters: list[dict],
+        limit: Optional[int] = 100,
+        max_scanned: Optional[int] = None,
+        order_by: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Find issues in a project matching all given filters, without listing every issue.
+
+        Each filter is {"field": ..., "op": ..., "value": ...}. Fields are issue
+        fields (dotted paths allowed) plus state_name and state_group, which
+        are resolved through the project's states. Operators: eq, ne, in,
+        not_in, contains (case-insensitive substring, or membership for lists
+        like assignees/labels), gt, gte, lt, lte (e.g. on created_at, target_date)
+        and is_null. Filters on state, priority, assignees, labels and
+        created_by are sent to Plane; the rest are applied while paging.
+
+        Example: [{"field": "state_group", "op": "in", "value": ["started", "unstarted"]},
+                  {"field": "priority", "op": "eq", "value": "urgent"},
+                  {"field": "name", "op": "contains", "value": "login"}]
+
+        Args:
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project to search
+            filters: List of filter objects, all of which must match
+            limit: Stop after this many matching issues, None for no limit
+            max_scanned: Stop after examining this many issues, None for no limit
+            order_by: Optional Plane ordering, e.g. '-updated_at' or 'priority'
+            fields: Optional list of fields to return for each issue instead of the default summary
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
+            max_output_tokens: Approximate output limit in tokens; the rest of a longer result is returned by continue_result (default MCP_OUTPUT_BUDGET)
+        """
+        workspace_slug = get_workspace_slug()
+        project_id = await resolve_project_id(project_id)
+        base = f"workspaces/{workspace_slug}/projects/{project_id}"
+        conditions = parse_conditions(filters)
 
-        return json.dumps(response, indent=2)
+        if needs_states(conditions):
+            states = await make_plane_request("GET", f"{base}/states/", max_staleness=max_staleness)
+            if isinstance(states, dict):
+                states = states.get("results", [])
+            conditions = resolve_state_conditions(conditions, states)
+
+        # A fresh mirror answers only plain pages, and scanning it locally is
+        # faster than a filtered round trip anyway
+        mirror = get_mirror()
+        staleness = default_max_staleness() if max_staleness is None else max_staleness
+        use_mirror = mirror is not None and order_by is None and mirror.is_fresh("issues", project_id, staleness)
+        params = {} if use_mirror else pushdown_params(conditions)
+        if order_by:
+            params["order_by"] = order_by
+
+        results: list[dict] = []
+        scanned = 0
+        complete = True
+
+        def scan(issue: dict) -> None:
+            # Filter and project each issue as its page is parsed
+            nonlocal scanned, complete
+            if not complete:
+                return
+            scanned += 1
+            if matches(issue, conditions):
+                results.append(project_item(issue, fields, compact, summary=ISSUE_SUMMARY))
+            if (limit is not None and len(results) >= limit) or (max_scanned is not None and scanned >= max_scanned):
+                complete = False
+
+        keys = source_keys(fields, ISSUE_SUMMARY) | {condition.field.split(".", 1)[0] for condition in conditions}
+        pages = paginate(f"{base}/issues/", params=params, max_staleness=max_staleness, item=scan, keys=keys)
+        async with aclosing(pages):
+            async for _ in pages:
+                if not complete:
+                    break
+
+        result = {
+            "count": len(results),
+            "scanned": scanned,
+            "complete": complete,
+            "pushed_down": params,
+            "results": results,
+        }
+        return format_response(result, pretty=pretty, max_bytes=tokens_to_bytes(max_output_tokens))
 
     @mcp.tool()
-    async def get_issue(project_id: str, issue_id: str) -> str:
+    async def get_issue(
+        project_id: str,
+        issue_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
         """
         Get details of a specific issue.
 
         Args:
-            project_id: The UUID identifier of the project
-            issue_id: The UUID identifier of the issue
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project
+            issue_id: The UUID or readable identifier (e.g. 'PROFI-48') of the issue
+            fields: Optional list of fields to return (dotted paths allowed, e.g. 'state_detail.name')
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id, issue_id = await resolve_issue(project_id, issue_id)
         response = await make_plane_request(
             "GET",
-            f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/"
+            f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/",
+            max_staleness=max_staleness,
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
+
+    @mcp.tool()
+    async def get_issues_batch(
+        issue_ids: list[str],
+        project_id: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        concurrency: Optional[int] = None,
+        max_staleness: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Get many issues in one call, e.g. everything listed by list_cycle_issues.
+
+        Each issue is fetched once, even when it is named by both its UUID and
+        its readable ID. Issues are fetched concurrently and served from the
+        local mirror when it is fresh enough (issue responses are not kept in
+        the response cache unless PLANE_CACHE_TTLS sets a TTL for issues); an
+        issue that cannot be fetched gets an error entry instead of failing
+        the call.
+
+        Args:
+            issue_ids: Issue UUIDs and/or readable identifiers (e.g. 'PROFI-48'), at most 100
+            project_id: The UUID or identifier of the project; required when issue_ids contains UUIDs
+            fields: Optional list of fields to return for each issue instead of the default summary
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            concurrency: Maximum number of parallel requests (defaults to PLANE_BULK_CONCURRENCY or 8)
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
+            max_output_tokens: Approximate output limit in tokens; the rest of a longer result is returned by continue_result (default MCP_OUTPUT_BUDGET)
+        """
+        # IDs are case-insensitive; keep the first spelling of each
+        unique: dict[str, str] = {}
+        for ref in issue_ids:
+            unique.setdefault(ref.strip().lower(), ref.strip())
+        refs = list(unique.values())
+        if len(refs) > MAX_BATCH_ISSUES:
+            raise PlaneAPIError(f"get_issues_batch accepts at most {MAX_BATCH_ISSUES} distinct issues, got {len(refs)}")
+
+        async def fetch(ref: str) -> object:
+            return await fetch_issue(project_id, ref, max_staleness=max_staleness)
+
+        # Refs whose UUID is unknown (readable IDs missing from the identifier
+        # index) are fetched first; the rest are then fetched once per UUID
+        concurrency = concurrency or bulk_concurrency()
+        unknown = [ref for ref in refs if indexed_issue_id(ref) is None]
+        fetched: dict[str, tuple[str, object]] = {}
+        for ref, issue in zip(unknown, await map_bounded(fetch, unknown, concurrency)):
+            issue_id = issue.get("id") if isinstance(issue, dict) else None
+            fetched.setdefault(issue_id.lower() if isinstance(issue_id, str) else ref, (ref, issue))
+        known: dict[str, str] = {}
+        for ref in refs:
+            issue_id = indexed_issue_id(ref)
+            if ref not in unknown and issue_id not in fetched:
+                known.setdefault(issue_id, ref)
+        for (issue_id, ref), issue in zip(known.items(), await map_bounded(fetch, list(known.values()), concurrency)):
+            fetched[issue_id] = (ref, issue)
+
+        position = {ref: i for i, ref in enumerate(refs)}
+        results = []
+        for ref, issue in sorted(fetched.values(), key=lambda entry: position[entry[0]]):
+            if isinstance(issue, BaseException):
+                results.append({"ref": ref, "error": str(issue)})
+            else:
+                results.append({"ref": ref, "issue": project_item(issue, fields, compact, summary=ISSUE_SUMMARY)})
+
+        failed = sum(1 for item in results if "error" in item)
+        result = {
+            "requested": len(issue_ids),
+            "count": len(results),
+            "failed": failed,
+            "results": results,
+        }
+        return format_response(result, pretty=pretty, max_bytes=tokens_to_bytes(max_output_tokens))
 
     @mcp.tool()
-    async def get_issue_using_readable_identifier(project_identifier: str, issue_identifier: str) -> str:
+    async def get_issue_context(
+        project_id: str,
+        issue_id: str,
+        include_comments: bool = True,
+        include_worklogs: bool = True,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
+        """
+        Get an issue with everything needed to act on it in one call.
+
+        The issue, its comments and worklogs, and the project's states,
+        labels and workspace members are fetched concurrently (metadata is
+        usually served from the cache), and returned as one document with
+        state, label and user UUIDs resolved to names. Comments or worklogs
+        that cannot be read are reported under 'errors' instead of failing
+        the call.
+
+        Args:
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project
+            issue_id: The UUID or readable identifier (e.g. 'PROFI-48') of the issue
+            include_comments: Include the issue's comments
+            include_worklogs: Include the issue's worklogs and their total
+            compact: Drop bookkeeping fields and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
+        """
+        workspace_slug = get_workspace_slug()
+        project_id, issue_id = await resolve_issue(project_id, issue_id)
+        base = f"workspaces/{workspace_slug}/projects/{project_id}"
+        reads = {
+            "issue": make_plane_request("GET", f"{base}/issues/{issue_id}/", max_staleness=max_staleness),
+            "project": make_plane_request("GET", f"{base}/", max_staleness=max_staleness),
+            "states": make_plane_request("GET", f"{base}/states/", max_staleness=max_staleness),
+            "labels": make_plane_request("GET", f"{base}/labels/", max_staleness=max_staleness),
+            "members": make_plane_request("GET", f"workspaces/{workspace_slug}/members/"),
+        }
+        if include_comments:
+            reads["comments"] = make_plane_request("GET", f"{base}/issues/{issue_id}/comments/")
+        if include_worklogs:
+            reads["worklogs"] = make_plane_request(
+                "GET", f"{base}/issues/{issue_id}/worklogs/", max_staleness=max_staleness
+            )
+        responses = dict(zip(reads, await asyncio.gather(*reads.values(), return_exceptions=True)))
+        if isinstance(responses["issue"], BaseException):
+            raise responses["issue"]
+
+        errors = {name: str(response) for name, response in responses.items() if isinstance(response, BaseException)}
+        responses = {name: None if name in errors else response for name, response in responses.items()}
+        result = issue_context(**responses)
+        if errors:
+            result["errors"] = errors
+        return format_response(result, compact=compact, pretty=pretty)
+
+    @mcp.tool()
+    async def get_issue_using_readable_identifier(
+        project_identifier: str,
+        issue_identifier: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+    ) -> str:
         """
         Get a specific issue using its readable identifier.
 
@@ -76,24 +488,35 @@ def register_issue_tools(mcp: FastMCP) -> None:
         Args:
             project_identifier: The readable identifier of the project (e.g., 'FIRST' for FIRST-123)
             issue_identifier: The issue number (e.g., '123' for FIRST-123)
+            fields: Optional list of fields to return (dotted paths allowed, e.g. 'state_detail.name')
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
             f"workspaces/{workspace_slug}/issues/{project_identifier}-{issue_identifier}/"
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
 
     @mcp.tool()
-    async def get_issue_details_by_readable_id(issue_readable_id: str) -> str:
+    async def get_issue_details_by_readable_id(
+        issue_readable_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+    ) -> str:
         """
         Get full issue details using readable ID (e.g. PROFI-48).
         Returns project_id, issue_id, current state, and other details needed for operations.
 
         Args:
             issue_readable_id: The readable identifier of the issue (e.g., 'PROFI-48', 'ABC-123')
+            fields: Optional list of fields to return (dotted paths allowed, e.g. 'state_detail.name')
+            compact: Drop empty values
+            pretty: Indent the JSON output
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
             f"workspaces/{workspace_slug}/issues/{issue_readable_id}/"
@@ -113,25 +536,37 @@ def register_issue_tools(mcp: FastMCP) -> None:
                 "created_at": response.get("created_at"),
                 "updated_at": response.get("updated_at")
             }
-            return json.dumps(key_info, indent=2)
-        
-        return json.dumps(response, indent=2)
+            return format_response(key_info, fields, compact, pretty)
+
+        return format_response(response, fields, compact, pretty)
 
     @mcp.tool()
-    async def get_issue_comments(project_id: str, issue_id: str) -> str:
+    async def get_issue_comments(
+        project_id: str,
+        issue_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_output_tokens: Optional[int] = None,
+    ) -> str:
         """
         Get all comments for a specific issue.
 
         Args:
-            project_id: The UUID identifier of the project
-            issue_id: The UUID identifier of the issue
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project
+            issue_id: The UUID or readable identifier (e.g. 'PROFI-48') of the issue
+            fields: Optional list of fields to return for each comment, e.g. ['comment_html', 'created_at']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_output_tokens: Approximate output limit in tokens; the rest of a longer result is returned by continue_result (default MCP_OUTPUT_BUDGET)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id, issue_id = await resolve_issue(project_id, issue_id)
         response = await make_plane_request(
             "GET",
             f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/comments/"
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty, max_bytes=tokens_to_bytes(max_output_tokens))
 
     @mcp.tool()
     async def add_issue_comment(project_id: str, issue_id: str, comment_html: str) -> str:
@@ -139,17 +574,18 @@ def register_issue_tools(mcp: FastMCP) -> None:
         Add a comment to a specific issue.
 
         Args:
-            project_id: The UUID identifier of the project
-            issue_id: The UUID identifier of the issue
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project
+            issue_id: The UUID or readable identifier (e.g. 'PROFI-48') of the issue
             comment_html: The HTML content of the comment to add
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id, issue_id = await resolve_issue(project_id, issue_id)
         response = await make_plane_request(
             "POST",
             f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/comments/",
             body={"comment_html": comment_html}
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def create_issue(
@@ -165,7 +601,7 @@ def register_issue_tools(mcp: FastMCP) -> None:
         Create a new issue in a project.
 
         Args:
-            project_id: The UUID identifier of the project
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project
             name: The title/name of the issue
             description: Optional HTML description of the issue
             state_id: Optional UUID of the issue state
@@ -173,26 +609,16 @@ def register_issue_tools(mcp: FastMCP) -> None:
             assignees: Optional list of assignee UUIDs
             labels: Optional list of label UUIDs
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
-        body: dict = {"name": name}
-
-        if description:
-            body["description_html"] = description
-        if state_id:
-            body["state"] = state_id
-        if priority:
-            body["priority"] = priority
-        if assignees:
-            body["assignees"] = assignees
-        if labels:
-            body["labels"] = labels
+        workspace_slug = get_workspace_slug()
+        project_id = await resolve_project_id(project_id)
+        body = _create_issue_body(name, description, state_id, priority, assignees, labels)
 
         response = await make_plane_request(
             "POST",
             f"workspaces/{workspace_slug}/projects/{project_id}/issues/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def update_issue(
@@ -209,8 +635,8 @@ def register_issue_tools(mcp: FastMCP) -> None:
         Update an existing issue.
 
         Args:
-            project_id: The UUID identifier of the project
-            issue_id: The UUID identifier of the issue to update
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project
+            issue_id: The UUID or readable identifier (e.g. 'PROFI-48') of the issue to update
             name: Updated issue name
             description: Updated HTML description
             state: Updated state UUID
@@ -218,28 +644,16 @@ def register_issue_tools(mcp: FastMCP) -> None:
             assignees: Updated list of assignee UUIDs
             labels: Updated list of label UUIDs
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
-        body: dict = {}
-
-        if name:
-            body["name"] = name
-        if description:
-            body["description_html"] = description
-        if state:
-            body["state"] = state
-        if priority:
-            body["priority"] = priority
-        if assignees is not None:
-            body["assignees"] = assignees
-        if labels is not None:
-            body["labels"] = labels
+        workspace_slug = get_workspace_slug()
+        project_id, issue_id = await resolve_issue(project_id, issue_id)
+        body = _update_issue_body(name, description, state, priority, assignees, labels)
 
         response = await make_plane_request(
             "PATCH",
             f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def delete_issue(project_id: str, issue_id: str) -> str:
@@ -247,12 +661,91 @@ def register_issue_tools(mcp: FastMCP) -> None:
         Delete an issue.
 
         Args:
-            project_id: The UUID identifier of the project
-            issue_id: The UUID identifier of the issue to delete
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project
+            issue_id: The UUID or readable identifier (e.g. 'PROFI-48') of the issue to delete
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id, issue_id = await resolve_issue(project_id, issue_id)
         await make_plane_request(
             "DELETE",
             f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/"
         )
         return "Issue deleted successfully"
+
+    @mcp.tool()
+    async def bulk_create_issues(
+        project_id: str,
+        issues: list[dict],
+        concurrency: Optional[int] = None,
+        retries: int = 2,
+    ) -> str:
+        """
+        Create many issues in a project in one call.
+
+        Each item accepts the same fields as create_issue: name (required),
+        description, state_id, priority, assignees, labels. Requests are sent
+        concurrently; items rejected with 429 or that could not reach Plane
+        are retried without resubmitting items that already succeeded. Other
+        failures (5xx, timeouts) are reported, not retried, since the issue
+        may have been created anyway.
+
+        Args:
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project
+            issues: List of issue objects to create
+            concurrency: Maximum number of parallel requests (defaults to PLANE_BULK_CONCURRENCY or 8)
+            retries: Number of retry rounds for failed items
+        """
+        workspace_slug = get_workspace_slug()
+        project_id = await resolve_project_id(project_id)
+        path = f"workspaces/{workspace_slug}/projects/{project_id}/issues/"
+        requests = []
+        for item in issues:
+            if not item.get("name"):
+                raise PlaneAPIError("Every issue in bulk_create_issues requires a name")
+            fields = {key: item.get(key) for key in CREATE_FIELDS}
+            requests.append(("POST", path, _create_issue_body(**fields)))
+
+        result = await _run_bulk(requests, concurrency or bulk_concurrency(), retries)
+        return format_response(result)
+
+    @mcp.tool()
+    async def bulk_update_issues(
+        project_id: str,
+        updates: list[dict],
+        concurrency: Optional[int] = None,
+        retries: int = 2,
+    ) -> str:
+        """
+        Update many issues in a project in one call.
+
+        Each item requires issue_id and accepts the same fields as
+        update_issue: name, description, state, priority, assignees, labels.
+        Readable IDs are resolved per item (to their own project), and an ID
+        that cannot be resolved is reported as that item's failure. Requests
+        are sent concurrently; items that fail with a network error, 429 or
+        5xx are retried without resubmitting items that already succeeded.
+
+        Args:
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project
+            updates: List of update objects, each with issue_id (UUID or readable ID like 'PROFI-48') and the fields to change
+            concurrency: Maximum number of parallel requests (defaults to PLANE_BULK_CONCURRENCY or 8)
+            retries: Number of retry rounds for failed items
+        """
+        workspace_slug = get_workspace_slug()
+        project_id = await resolve_project_id(project_id)
+        if not all(item.get("issue_id") for item in updates):
+            raise PlaneAPIError("Every update in bulk_update_issues requires an issue_id")
+
+        def issue_path(issue: str) -> Callable[[], Awaitable[str]]:
+            async def resolve() -> str:
+                issue_project_id, issue_id = await resolve_issue(project_id, issue)
+                return f"workspaces/{workspace_slug}/projects/{issue_project_id}/issues/{issue_id}/"
+            return resolve
+
+        requests = []
+        for item in updates:
+            fields = {key: item.get(key) for key in UPDATE_FIELDS}
+            requests.append(("PATCH", issue_path(item["issue_id"]), _update_issue_body(**fields)))
+
+        result = await _run_bulk(requests, concurrency or bulk_concurrency(), retries)
+        return format_response(result)
@@ -1,46 +1,70 @@
 """Metadata tools for Plane API."""
 
-import json
-import os
+from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
+from plane_mcp.common.projection import format_response
 from plane_mcp.common.request_helper import make_plane_request
+from plane_mcp.common.tenant import get_workspace_slug
 
 
 def register_metadata_tools(mcp: FastMCP) -> None:
     """Register metadata-related tools."""
 
     @mcp.tool()
-    async def list_labels(project_id: str) -> str:
+    async def list_labels(
+        project_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
         """
         List all labels for a project.
 
         Args:
             project_id: The UUID identifier of the project
+            fields: Optional list of fields to return for each label, e.g. ['name', 'color']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
-            f"workspaces/{workspace_slug}/projects/{project_id}/labels/"
+            f"workspaces/{workspace_slug}/projects/{project_id}/labels/",
+            max_staleness=max_staleness,
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
 
     @mcp.tool()
-    async def get_label(project_id: str, label_id: str) -> str:
+    async def get_label(
+        project_id: str,
+        label_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
         """
         Get details of a specific label.
 
         Args:
             project_id: The UUID identifier of the project
             label_id: The UUID identifier of the label
+            fields: Optional list of fields to return, e.g. ['name', 'color']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
-            f"workspaces/{workspace_slug}/projects/{project_id}/labels/{label_id}/"
+            f"workspaces/{workspace_slug}/projects/{project_id}/labels/{label_id}/",
+            max_staleness=max_staleness,
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
 
     @mcp.tool()
     async def create_label(
@@ -58,7 +82,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             description: Description of the label
             color: Color hex code for the label
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "POST",
             f"workspaces/{workspace_slug}/projects/{project_id}/labels/",
@@ -68,7 +92,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
                 "color": color
             }
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def update_label(
@@ -88,7 +112,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             description: New description for the label
             color: New color hex code for the label
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         body = {}
         if name is not None:
             body["name"] = name
@@ -102,7 +126,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             f"workspaces/{workspace_slug}/projects/{project_id}/labels/{label_id}/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def delete_label(project_id: str, label_id: str) -> str:
@@ -113,7 +137,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             project_id: The UUID identifier of the project
             label_id: The UUID identifier of the label
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         await make_plane_request(
             "DELETE",
             f"workspaces/{workspace_slug}/projects/{project_id}/labels/{label_id}/"
@@ -121,20 +145,32 @@ def register_metadata_tools(mcp: FastMCP) -> None:
         return "Label deleted successfully"
 
     @mcp.tool()
-    async def get_state(project_id: str, state_id: str) -> str:
+    async def get_state(
+        project_id: str,
+        state_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
         """
         Get details of a specific state.
 
         Args:
             project_id: The UUID identifier of the project
             state_id: The UUID identifier of the state
+            fields: Optional list of fields to return, e.g. ['name', 'group']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
-            f"workspaces/{workspace_slug}/projects/{project_id}/states/{state_id}/"
+            f"workspaces/{workspace_slug}/projects/{project_id}/states/{state_id}/",
+            max_staleness=max_staleness,
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
 
     @mcp.tool()
     async def create_state(
@@ -154,7 +190,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             description: Description of the state
             color: Color hex code for the state
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "POST",
             f"workspaces/{workspace_slug}/projects/{project_id}/states/",
@@ -165,7 +201,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
                 "color": color
             }
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def update_state(
@@ -187,7 +223,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             description: New description for the state
             color: New color hex code for the state
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         body = {}
         if name is not None:
             body["name"] = name
@@ -203,7 +239,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             f"workspaces/{workspace_slug}/projects/{project_id}/states/{state_id}/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def delete_state(project_id: str, state_id: str) -> str:
@@ -214,7 +250,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             project_id: The UUID identifier of the project
             state_id: The UUID identifier of the state
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         await make_plane_request(
             "DELETE",
             f"workspaces/{workspace_slug}/projects/{project_id}/states/{state_id}/"
@@ -222,20 +258,29 @@ def register_metadata_tools(mcp: FastMCP) -> None:
         return "State deleted successfully"
 
     @mcp.tool()
-    async def get_issue_type(project_id: str, issue_type_id: str) -> str:
+    async def get_issue_type(
+        project_id: str,
+        issue_type_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+    ) -> str:
         """
         Get details of a specific issue type.
 
         Args:
             project_id: The UUID identifier of the project
             issue_type_id: The UUID identifier of the issue type
+            fields: Optional list of fields to return, e.g. ['name', 'description']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
             f"workspaces/{workspace_slug}/projects/{project_id}/issue-types/{issue_type_id}/"
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
 
     @mcp.tool()
     async def create_issue_type(
@@ -255,7 +300,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             color: Color hex code for the issue type
             icon: Icon identifier for the issue type
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "POST",
             f"workspaces/{workspace_slug}/projects/{project_id}/issue-types/",
@@ -266,7 +311,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
                 "icon": icon
             }
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def update_issue_type(
@@ -288,7 +333,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             color: New color hex code for the issue type
             icon: New icon identifier for the issue type
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         body = {}
         if name is not None:
             body["name"] = name
@@ -304,7 +349,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             f"workspaces/{workspace_slug}/projects/{project_id}/issue-types/{issue_type_id}/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def delete_issue_type(project_id: str, issue_type_id: str) -> str:
@@ -315,7 +360,7 @@ def register_metadata_tools(mcp: FastMCP) -> None:
             project_id: The UUID identifier of the project
             issue_type_id: The UUID identifier of the issue type
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         await make_plane_request(
             "DELETE",
             f"workspaces/{workspace_slug}/projects/{project_id}/issue-types/{issue_type_id}/"
@@ -323,16 +368,27 @@ def register_metadata_tools(mcp: FastMCP) -> None:
         return "Issue type deleted successfully"
 
     @mcp.tool()
-    async def list_states(project_id: str) -> str:
+    async def list_states(
+        project_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
         """
         Get all states for a specific project.
 
         Args:
             project_id: The UUID identifier of the project to get states for
+            fields: Optional list of fields to return for each state, e.g. ['name', 'group']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
-            f"workspaces/{workspace_slug}/projects/{project_id}/states/"
+            f"workspaces/{workspace_slug}/projects/{project_id}/states/",
+            max_staleness=max_staleness,
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
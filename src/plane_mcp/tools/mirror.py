@@ -0,0 +1,58 @@
+"""Local mirror tools."""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from mcp.server.fastmcp import FastMCP
+
+from plane_mcp.common.identifiers import resolve_project_id
+from plane_mcp.common.mirror import get_mirror
+from plane_mcp.common.mirror_sync import sync_workspace
+from plane_mcp.common.projection import format_response
+from plane_mcp.common.request_helper import PlaneAPIError
+
+
+def register_mirror_tools(mcp: FastMCP) -> None:
+    """Register local mirror tools."""
+
+    @mcp.tool()
+    async def sync_mirror(project_id: Optional[str] = None, full: bool = False) -> str:
+        """
+        Sync the local mirror from Plane now instead of waiting for the background sync.
+
+        Args:
+            project_id: Optional UUID or identifier (e.g. 'PROFI') of a single project to sync
+            full: Re-read everything instead of only issues updated since the last sync
+        """
+        projects = [await resolve_project_id(project_id)] if project_id else None
+        result = await sync_workspace(full=full, projects=projects)
+        return format_response(result)
+
+    @mcp.tool()
+    async def get_mirror_status(pretty: bool = False) -> str:
+        """
+        Show what the local mirror holds and when each collection was last synced.
+
+        Args:
+            pretty: Indent the JSON output
+        """
+        mirror = get_mirror()
+        if mirror is None:
+            raise PlaneAPIError("Local mirror is disabled (set PLANE_MIRROR_PATH)")
+
+        def timestamp(value: float) -> Optional[str]:
+            return datetime.fromtimestamp(value, timezone.utc).isoformat() if value else None
+
+        status = [
+            {
+                "kind": state.kind,
+                "project_id": state.project_id or None,
+                "objects": mirror.count(state.kind, state.project_id),
+                "synced_at": timestamp(state.synced_at),
+                "full_synced_at": timestamp(state.full_synced_at),
+                "age_seconds": round(state.age, 1) if state.synced_at else None,
+                "watermark": state.watermark,
+            }
+            for state in mirror.sync_states()
+        ]
+        return format_response({"path": mirror.path, "collections": status}, pretty=pretty)
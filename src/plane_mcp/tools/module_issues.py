@@ -1,31 +1,46 @@
 """Module issue tools for Plane API."""
 
-import json
-import os
+from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
+from plane_mcp.common.continuation import tokens_to_bytes
+from plane_mcp.common.identifiers import resolve_issue, resolve_issue_ids, resolve_project_id
+from plane_mcp.common.projection import format_response
 from plane_mcp.common.request_helper import make_plane_request
+from plane_mcp.common.tenant import get_workspace_slug
 
 
 def register_module_issue_tools(mcp: FastMCP) -> None:
     """Register module-issue-related tools."""
 
     @mcp.tool()
-    async def list_module_issues(project_id: str, module_id: str) -> str:
+    async def list_module_issues(
+        project_id: str,
+        module_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_output_tokens: Optional[int] = None,
+    ) -> str:
         """
         Get all issues for a specific module.
 
         Args:
-            project_id: The UUID identifier of the project containing the module
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project containing the module
             module_id: The UUID identifier of the module to get issues for
+            fields: Optional list of fields to return for each issue (dotted paths allowed, e.g. 'state_detail.name')
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_output_tokens: Approximate output limit in tokens; the rest of a longer result is returned by continue_result (default MCP_OUTPUT_BUDGET)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id = await resolve_project_id(project_id)
         response = await make_plane_request(
             "GET",
             f"workspaces/{workspace_slug}/projects/{project_id}/modules/{module_id}/module-issues/"
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty, max_bytes=tokens_to_bytes(max_output_tokens))
 
     @mcp.tool()
     async def add_module_issues(project_id: str, module_id: str, issues: list[str]) -> str:
@@ -33,17 +48,19 @@ def register_module_issue_tools(mcp: FastMCP) -> None:
         Add issues to a module. Assign module to issues.
 
         Args:
-            project_id: The UUID identifier of the project containing the module
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project containing the module
             module_id: The UUID identifier of the module to add issues to
-            issues: Array of issue UUIDs to add to the module
+            issues: Array of issue UUIDs or readable identifiers (e.g. 'PROFI-48') to add to the module
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id = await resolve_project_id(project_id)
+        issues = await resolve_issue_ids(project_id, issues)
         response = await make_plane_request(
             "POST",
             f"workspaces/{workspace_slug}/projects/{project_id}/modules/{module_id}/module-issues/",
             body={"issues": issues}
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def delete_module_issue(project_id: str, module_id: str, issue_id: str) -> str:
@@ -51,11 +68,12 @@ def register_module_issue_tools(mcp: FastMCP) -> None:
         Remove an issue from a module. Unassign module from issue.
 
         Args:
-            project_id: The UUID identifier of the project containing the module
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project containing the module
             module_id: The UUID identifier of the module containing the issue
-            issue_id: The UUID identifier of the issue to remove from the module
+            issue_id: The UUID or readable identifier (e.g. 'PROFI-48') of the issue to remove from the module
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id, issue_id = await resolve_issue(project_id, issue_id)
         await make_plane_request(
             "DELETE",
             f"workspaces/{workspace_slug}/projects/{project_id}/modules/{module_id}/module-issues/{issue_id}/"
@@ -1,47 +1,99 @@
 """Module tools for Plane API."""
 
-import json
-import os
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
+from plane_mcp.common.analytics import scope_analytics
+from plane_mcp.common.identifiers import resolve_project_id
+from plane_mcp.common.projection import format_response
 from plane_mcp.common.request_helper import make_plane_request
+from plane_mcp.common.tenant import get_workspace_slug
 
 
 def register_module_tools(mcp: FastMCP) -> None:
     """Register module-related tools."""
 
     @mcp.tool()
-    async def list_modules(project_id: str) -> str:
+    async def list_modules(
+        project_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
         """
         Get all modules for a specific project.
 
         Args:
             project_id: The UUID identifier of the project
+            fields: Optional list of fields to return for each module, e.g. ['name', 'status', 'target_date']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
-            f"workspaces/{workspace_slug}/projects/{project_id}/modules/"
+            f"workspaces/{workspace_slug}/projects/{project_id}/modules/",
+            max_staleness=max_staleness,
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
 
     @mcp.tool()
-    async def get_module(project_id: str, module_id: str) -> str:
+    async def module_analytics(
+        project_id: str,
+        module_id: str,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
+        """
+        Progress of a module: completion, scope change, burndown, velocity and per-assignee load.
+
+        Member issues are joined with the project's state groups and the
+        figures are computed on the server. Burndown runs from start_date to
+        target_date (or today), with an ideal line; velocity counts completed
+        issues and points per ISO week. Results are reused until the module's
+        issues or their states change.
+
+        Args:
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project containing the module
+            module_id: The UUID identifier of the module
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
+        """
+        workspace_slug = get_workspace_slug()
+        project_id = await resolve_project_id(project_id)
+        result = await scope_analytics(workspace_slug, project_id, "modules", module_id, max_staleness)
+        return format_response(result, pretty=pretty)
+
+    @mcp.tool()
+    async def get_module(
+        project_id: str,
+        module_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
         """
         Get details of a specific module.
 
         Args:
             project_id: The UUID identifier of the project
             module_id: The UUID identifier of the module
+            fields: Optional list of fields to return, e.g. ['name', 'status', 'target_date']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
-            f"workspaces/{workspace_slug}/projects/{project_id}/modules/{module_id}/"
+            f"workspaces/{workspace_slug}/projects/{project_id}/modules/{module_id}/",
+            max_staleness=max_staleness,
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
 
     @mcp.tool()
     async def create_module(
@@ -63,7 +115,7 @@ def register_module_tools(mcp: FastMCP) -> None:
             target_date: Optional target/end date (YYYY-MM-DD)
             lead: Optional UUID of the module lead
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         body: dict = {"name": name}
 
         if description:
@@ -80,7 +132,7 @@ def register_module_tools(mcp: FastMCP) -> None:
             f"workspaces/{workspace_slug}/projects/{project_id}/modules/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def update_module(
@@ -106,7 +158,7 @@ def register_module_tools(mcp: FastMCP) -> None:
             lead: Updated lead UUID
             status: Updated status
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         body: dict = {}
 
         if name:
@@ -127,7 +179,7 @@ def register_module_tools(mcp: FastMCP) -> None:
             f"workspaces/{workspace_slug}/projects/{project_id}/modules/{module_id}/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def delete_module(project_id: str, module_id: str) -> str:
@@ -138,7 +190,7 @@ def register_module_tools(mcp: FastMCP) -> None:
             project_id: The UUID identifier of the project
             module_id: The UUID identifier of the module
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
         await make_plane_request(
             "DELETE",
             f"workspaces/{workspace_slug}/projects/{project_id}/modules/{module_id}/"
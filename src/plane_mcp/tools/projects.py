@@ -1,41 +1,45 @@
 """Project tools for Plane API."""
 
-import json
-import os
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
+from plane_mcp.common.projection import PROJECT_SUMMARY, format_response
 from plane_mcp.common.request_helper import make_plane_request
+from plane_mcp.common.tenant import get_workspace_slug
 
 
 def register_project_tools(mcp: FastMCP) -> None:
     """Register project-related tools."""
 
     @mcp.tool()
-    async def get_projects() -> str:
-        """Get all projects for the current user."""
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+    async def get_projects(
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
+        """
+        Get all projects for the current user.
+
+        Args:
+            fields: Optional list of fields to return for each project instead of the default summary
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
+        """
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request(
             "GET",
-            f"workspaces/{workspace_slug}/projects/"
+            f"workspaces/{workspace_slug}/projects/",
+            max_staleness=max_staleness,
         )
 
         # Simplify response
         if isinstance(response, dict) and "results" in response:
-            projects = [
-                {
-                    "name": p.get("name"),
-                    "id": p.get("id"),
-                    "identifier": p.get("identifier"),
-                    "description": p.get("description"),
-                    "project_lead": p.get("project_lead"),
-                }
-                for p in response["results"]
-            ]
-            return json.dumps(projects, indent=2)
+            response = response["results"]
 
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty, summary=PROJECT_SUMMARY)
 
     @mcp.tool()
     async def create_project(
@@ -51,7 +55,7 @@ def register_project_tools(mcp: FastMCP) -> None:
             identifier: The identifier of the project (typically 5 uppercase characters)
             description: Optional project description
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
 
         body = {
             "name": name,
@@ -65,4 +69,4 @@ def register_project_tools(mcp: FastMCP) -> None:
             f"workspaces/{workspace_slug}/projects/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
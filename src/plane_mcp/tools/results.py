@@ -0,0 +1,31 @@
+"""Tools for reading the rest of cut tool outputs."""
+
+from typing import Optional
+
+from mcp.server.fastmcp import FastMCP
+
+from plane_mcp.common.continuation import continue_output, tokens_to_bytes
+from plane_mcp.common.request_helper import PlaneAPIError
+
+
+def register_result_tools(mcp: FastMCP) -> None:
+    """Register tools for continuing cut outputs."""
+
+    @mcp.tool()
+    async def continue_result(handle: str, max_output_tokens: Optional[int] = None) -> str:
+        """
+        Get the next items of a tool output that was cut to fit the output budget.
+
+        A cut output has a 'continuation' object; pass its handle here to get
+        the next chunk, which has a new handle while items remain. The rest is
+        kept on the server for a limited time (MCP_CONTINUATION_TTL) and is
+        returned without fetching from Plane again. Each handle can be used once.
+
+        Args:
+            handle: The continuation.handle of the previous output
+            max_output_tokens: Approximate output limit in tokens for this chunk (defaults to the original call's limit)
+        """
+        output = continue_output(handle, tokens_to_bytes(max_output_tokens))
+        if output is None:
+            raise PlaneAPIError(f"Unknown or expired continuation handle '{handle}'; call the original tool again")
+        return output
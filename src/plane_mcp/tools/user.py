@@ -1,25 +1,48 @@
 """User tools for Plane API."""
 
-import json
-import os
+from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
+from plane_mcp.common.projection import format_response
 from plane_mcp.common.request_helper import make_plane_request
+from plane_mcp.common.tenant import get_workspace_slug
 
 
 def register_user_tools(mcp: FastMCP) -> None:
     """Register user-related tools."""
 
     @mcp.tool()
-    async def get_current_user() -> str:
-        """Get information about the current authenticated user."""
+    async def get_current_user(
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+    ) -> str:
+        """
+        Get information about the current authenticated user.
+
+        Args:
+            fields: Optional list of fields to return, e.g. ['display_name', 'email']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+        """
         response = await make_plane_request("GET", "users/me/")
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
 
     @mcp.tool()
-    async def get_workspace_members() -> str:
-        """Get all members in the current workspace."""
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+    async def get_workspace_members(
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+    ) -> str:
+        """
+        Get all members in the current workspace.
+
+        Args:
+            fields: Optional list of fields to return for each member, e.g. ['display_name', 'email']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+        """
+        workspace_slug = get_workspace_slug()
         response = await make_plane_request("GET", f"workspaces/{workspace_slug}/members/")
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
@@ -1,53 +1,171 @@
 """Work log tools for Plane API."""
 
-import json
-import os
+from datetime import date
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
-from plane_mcp.common.request_helper import make_plane_request
+from plane_mcp.common.concurrency import bulk_concurrency, map_bounded
+from plane_mcp.common.continuation import tokens_to_bytes
+from plane_mcp.common.identifiers import resolve_issue, resolve_project_id
+from plane_mcp.common.projection import format_response
+from plane_mcp.common.reports import WorklogAggregator, collect_issues, member_names, scope_path
+from plane_mcp.common.request_helper import PlaneAPIError, make_plane_request
+from plane_mcp.common.tenant import get_workspace_slug
+
+
+def _parse_day(value: Optional[str], name: str) -> Optional[date]:
+    """Parse an optional YYYY-MM-DD tool argument."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError as e:
+        raise PlaneAPIError(f"{name} must be a date in YYYY-MM-DD format, got '{value}'") from e
 
 
 def register_worklog_tools(mcp: FastMCP) -> None:
     """Register worklog-related tools."""
 
     @mcp.tool()
-    async def get_issue_worklogs(project_id: str, issue_id: str) -> str:
+    async def get_issue_worklogs(
+        project_id: str,
+        issue_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+    ) -> str:
         """
         Get all worklogs for a specific issue.
 
         Args:
-            project_id: The UUID identifier of the project containing the issue
-            issue_id: The UUID identifier of the issue to get worklogs for
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project containing the issue
+            issue_id: The UUID or readable identifier (e.g. 'PROFI-48') of the issue to get worklogs for
+            fields: Optional list of fields to return for each worklog, e.g. ['duration', 'logged_by', 'description']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
+            max_output_tokens: Approximate output limit in tokens; the rest of a longer result is returned by continue_result (default MCP_OUTPUT_BUDGET)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id, issue_id = await resolve_issue(project_id, issue_id)
         response = await make_plane_request(
             "GET",
-            f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/worklogs/"
+            f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/worklogs/",
+            max_staleness=max_staleness,
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty, max_bytes=tokens_to_bytes(max_output_tokens))
 
     @mcp.tool()
-    async def get_total_worklogs(project_id: str) -> str:
+    async def get_total_worklogs(
+        project_id: str,
+        fields: Optional[list[str]] = None,
+        compact: bool = False,
+        pretty: bool = False,
+    ) -> str:
         """
         Get total logged time for a project.
 
         Args:
-            project_id: The UUID identifier of the project to get total worklogs for
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project to get total worklogs for
+            fields: Optional list of fields to return for each total, e.g. ['logged_by', 'duration']
+            compact: Drop bulky fields (descriptions, binary data) and empty values
+            pretty: Indent the JSON output
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id = await resolve_project_id(project_id)
         response = await make_plane_request(
             "GET",
             f"workspaces/{workspace_slug}/projects/{project_id}/total-worklogs/"
         )
-        return json.dumps(response, indent=2)
+        return format_response(response, fields, compact, pretty)
+
+    @mcp.tool()
+    async def worklog_report(
+        project_id: str,
+        cycle_id: Optional[str] = None,
+        module_id: Optional[str] = None,
+        group_by: Optional[list[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        pretty: bool = False,
+        max_staleness: Optional[float] = None,
+    ) -> str:
+        """
+        Sum logged time across a project, cycle or module, grouped into a compact table.
+
+        Worklogs of all issues in the scope are fetched in parallel and
+        aggregated as they arrive. For a weekly timesheet per person use
+        group_by=['user', 'week']; for daily totals per issue use ['issue', 'day'].
+
+        Args:
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project
+            cycle_id: Optional cycle UUID to restrict the report to its issues
+            module_id: Optional module UUID to restrict the report to its issues
+            group_by: Grouping columns, any of 'user', 'issue', 'day', 'week' (default ['user'])
+            start_date: Only count work logged on or after this date (YYYY-MM-DD)
+            end_date: Only count work logged on or before this date (YYYY-MM-DD)
+            concurrency: Maximum number of parallel requests (defaults to PLANE_BULK_CONCURRENCY or 8)
+            pretty: Indent the JSON output
+            max_staleness: Serve from the local mirror if it was synced within this many seconds (0 bypasses it)
+        """
+        workspace_slug = get_workspace_slug()
+        project_id = await resolve_project_id(project_id)
+        base = f"workspaces/{workspace_slug}/projects/{project_id}"
+        group_by = group_by or ["user"]
+
+        user_names: dict[str, str] = {}
+        if "user" in group_by:
+            user_names = member_names(await make_plane_request("GET", f"workspaces/{workspace_slug}/members/"))
+
+        issues = await collect_issues(scope_path(base, cycle_id, module_id), max_staleness)
+        identifier = ""
+        if "issue" in group_by:
+            project = await make_plane_request("GET", f"{base}/", max_staleness=max_staleness)
+            identifier = project.get("identifier", "") if isinstance(project, dict) else ""
+        issue_names = {
+            issue["id"]: f"{identifier}-{issue.get('sequence_id')} {issue.get('name', '')}".strip()
+            for issue in issues
+            if issue.get("id")
+        }
+
+        report = WorklogAggregator(
+            group_by,
+            start=_parse_day(start_date, "start_date"),
+            end=_parse_day(end_date, "end_date"),
+            user_label=lambda user_id: user_names.get(user_id, user_id),
+            issue_label=lambda issue_id: issue_names.get(issue_id, issue_id),
+        )
+
+        async def fetch(issue_id: str) -> None:
+            worklogs = await make_plane_request(
+                "GET", f"{base}/issues/{issue_id}/worklogs/", max_staleness=max_staleness
+            )
+            if isinstance(worklogs, dict):
+                worklogs = worklogs.get("results", [])
+            report.add(issue_id, worklogs or [])
+
+        results = await map_bounded(fetch, list(issue_names), concurrency or bulk_concurrency())
+        errors = [
+            {"issue": issue_names[issue_id], "error": str(result)}
+            for issue_id, result in zip(issue_names, results)
+            if isinstance(result, BaseException)
+        ]
+
+        table = report.table()
+        table["issues"] = len(issue_names)
+        if errors:
+            table["errors"] = errors
+        return format_response(table, pretty=pretty)
 
     @mcp.tool()
     async def create_worklog(
         project_id: str,
         issue_id: str,
-        duration: float,
+        duration: int,
         description: str,
         started_at: Optional[str] = None,
     ) -> str:
@@ -55,13 +173,14 @@ def register_worklog_tools(mcp: FastMCP) -> None:
         Create a new worklog for an issue.
 
         Args:
-            project_id: The UUID identifier of the project containing the issue
-            issue_id: The UUID identifier of the issue to create worklog for
-            duration: Duration in hours (e.g., 2.5 for 2 hours 30 minutes)
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project containing the issue
+            issue_id: The UUID or readable identifier (e.g. 'PROFI-48') of the issue to create worklog for
+            duration: Duration in minutes (e.g., 150 for 2 hours 30 minutes)
             description: Description of the work done
             started_at: Optional timestamp when work started (ISO 8601 format)
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id, issue_id = await resolve_issue(project_id, issue_id)
         body: dict = {
             "duration": duration,
             "description": description,
@@ -75,14 +194,14 @@ def register_worklog_tools(mcp: FastMCP) -> None:
             f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/worklogs/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def update_worklog(
         project_id: str,
         issue_id: str,
         worklog_id: str,
-        duration: Optional[float] = None,
+        duration: Optional[int] = None,
         description: Optional[str] = None,
         started_at: Optional[str] = None,
     ) -> str:
@@ -90,14 +209,15 @@ def register_worklog_tools(mcp: FastMCP) -> None:
         Update an existing worklog.
 
         Args:
-            project_id: The UUID identifier of the project containing the issue
-            issue_id: The UUID identifier of the issue containing the worklog
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project containing the issue
+            issue_id: The UUID or readable identifier (e.g. 'PROFI-48') of the issue containing the worklog
             worklog_id: The UUID identifier of the worklog to update
-            duration: Updated duration in hours
+            duration: Updated duration in minutes
             description: Updated description
             started_at: Updated timestamp when work started
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id, issue_id = await resolve_issue(project_id, issue_id)
         body: dict = {}
 
         if duration is not None:
@@ -112,7 +232,7 @@ def register_worklog_tools(mcp: FastMCP) -> None:
             f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/worklogs/{worklog_id}/",
             body=body
         )
-        return json.dumps(response, indent=2)
+        return format_response(response)
 
     @mcp.tool()
     async def delete_worklog(project_id: str, issue_id: str, worklog_id: str) -> str:
@@ -120,11 +240,12 @@ def register_worklog_tools(mcp: FastMCP) -> None:
         Delete a worklog.
 
         Args:
-            project_id: The UUID identifier of the project containing the issue
-            issue_id: The UUID identifier of the issue containing the worklog
+            project_id: The UUID or identifier (e.g. 'PROFI') of the project containing the issue
+            issue_id: The UUID or readable identifier (e.g. 'PROFI-48') of the issue containing the worklog
             worklog_id: The UUID identifier of the worklog to delete
         """
-        workspace_slug = os.getenv("PLANE_WORKSPACE_SLUG")
+        workspace_slug = get_workspace_slug()
+        project_id, issue_id = await resolve_issue(project_id, issue_id)
         await make_plane_request(
             "DELETE",
             f"workspaces/{workspace_slug}/projects/{project_id}/issues/{issue_id}/worklogs/{worklog_id}/"
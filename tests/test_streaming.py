@@ -0,0 +1,63 @@
+"""Incremental and buffered parsing of list responses must agree."""
+
+import pytest
+
+from plane_mcp.common import serializer
+from plane_mcp.common.streaming import PageParser, transform_items
+
+pytest.importorskip("ijson")
+
+ISSUE = {
+    "id": "8a0f4efb-edcd-465e-b638-6821f6e07cc0",
+    "name": "Fix login",
+    "sequence_id": 7,
+    "project": "bdd640fb-0667-4ad1-9c80-317fa3b1799d",
+    "state": {"id": "s1", "group": "started"},
+    "labels": ["l1", "l2"],
+    "description_html": "<p>long</p>",
+}
+
+PAYLOADS = {
+    "page": {"total_count": 2, "next_cursor": "100:1:0", "results": [ISSUE, {**ISSUE, "id": "other"}]},
+    "empty page": {"total_count": 0, "results": []},
+    "list": [ISSUE, {**ISSUE, "id": "other"}],
+    "empty list": [],
+    "object": ISSUE,
+    "empty object": {},
+    "object with non-list results": {"id": "x", "results": 5},
+    "scalar": "ok",
+    "null": None,
+}
+
+CALLBACKS = {
+    "as is": (None, None),
+    "keys": (None, ["name", "state"]),
+    "item": (lambda entry: {"name": entry["name"]} if isinstance(entry, dict) and "name" in entry else entry, None),
+    "filter": (lambda entry: entry if isinstance(entry, dict) and entry.get("id") != "other" else None, ["id"]),
+}
+
+
+def parse_incrementally(body: bytes, item, keys, chunk_size: int = 7) -> dict:
+    parser = PageParser(item, keys)
+    for start in range(0, len(body), chunk_size):
+        parser.feed(body[start:start + chunk_size])
+    return parser.close()
+
+
+@pytest.mark.parametrize("callbacks", CALLBACKS.values(), ids=CALLBACKS.keys())
+@pytest.mark.parametrize("payload", PAYLOADS.values(), ids=PAYLOADS.keys())
+def test_page_parser_matches_transform_items(payload, callbacks):
+    item, keys = callbacks
+    body = serializer.dumps(payload).encode()
+    assert parse_incrementally(body, item, keys) == transform_items(serializer.loads(body), item, keys)
+
+
+def test_page_parser_skips_unkept_fields_and_observes_items():
+    observed = []
+    parser = PageParser(keys=["name"], observe=observed.append)
+    parser.feed(serializer.dumps(PAYLOADS["page"]).encode())
+    page = parser.close()
+
+    assert page["total_count"] == 2
+    assert [set(entry) for entry in page["results"]] == [{"id", "name", "sequence_id", "project"}] * 2
+    assert observed == page["results"]